@@ -78,7 +78,7 @@ from kin_code.core.types import (
     ToolStreamEvent,
     UserMessageEvent,
 )
-from kin_code.core.utils import CancellationReason, get_user_cancellation_message
+from kin_code.core.utils import CancellationReason, get_user_cancellation_text
 
 
 class AcpSessionLoop(BaseModel):
@@ -275,11 +275,7 @@ class KinAcpAgentLoop(AcpAgent):
             else:
                 return (
                     ApprovalResponse.NO,
-                    str(
-                        get_user_cancellation_message(
-                            CancellationReason.OPERATION_CANCELLED
-                        )
-                    ),
+                    get_user_cancellation_text(CancellationReason.OPERATION_CANCELLED),
                 )
 
         return approval_callback
@@ -74,7 +74,7 @@ from kin_code.core.tools.builtins.ask_user_question import (
 from kin_code.core.types import AgentStats, ApprovalResponse, LLMMessage, Role
 from kin_code.core.utils import (
     CancellationReason,
-    get_user_cancellation_message,
+    get_user_cancellation_text,
     is_dangerous_directory,
     logger,
 )
@@ -288,9 +288,10 @@ class VibeApp(App):  # noqa: PLR0904
         self, message: ApprovalApp.ApprovalRejected
     ) -> None:
         if self._pending_approval and not self._pending_approval.done():
-            feedback = str(
-                get_user_cancellation_message(CancellationReason.OPERATION_CANCELLED)
+            feedback = get_user_cancellation_text(
+                CancellationReason.OPERATION_CANCELLED
             )
+
             self._pending_approval.set_result((ApprovalResponse.NO, feedback))
 
         await self._switch_to_input_app()
@@ -38,7 +38,9 @@ class EventHandler:
         self.todo_area_callback = todo_area_callback
         self.get_tools_collapsed = get_tools_collapsed
         self.get_todos_collapsed = get_todos_collapsed
-        self.current_tool_call: ToolCallMessage | None = None
+        # Tool calls can run concurrently, so each in-flight call is tracked by
+        # its id until its result arrives.
+        self.tool_calls: dict[str, ToolCallMessage] = {}
         self.current_compact: CompactMessage | None = None
 
     async def handle_event(
@@ -103,31 +105,26 @@ class EventHandler:
         if event.tool_name != "todo":
             await self.mount_callback(tool_call)
 
-        self.current_tool_call = tool_call
+        self.tool_calls[event.tool_call_id] = tool_call
         return tool_call
 
     async def _handle_tool_result(self, event: ToolResultEvent) -> None:
+        tool_call = self.tool_calls.pop(event.tool_call_id, None)
         if event.tool_name == "todo":
             todos_collapsed = self.get_todos_collapsed()
-            tool_result = ToolResultMessage(
-                event, self.current_tool_call, collapsed=todos_collapsed
-            )
+            tool_result = ToolResultMessage(event, tool_call, collapsed=todos_collapsed)
             # Show in todo area
             todo_area = self.todo_area_callback()
             await todo_area.remove_children()
             await todo_area.mount(tool_result)
         else:
             tools_collapsed = self.get_tools_collapsed()
-            tool_result = ToolResultMessage(
-                event, self.current_tool_call, collapsed=tools_collapsed
-            )
+            tool_result = ToolResultMessage(event, tool_call, collapsed=tools_collapsed)
             await self.mount_callback(tool_result)
 
-        self.current_tool_call = None
-
     async def _handle_tool_stream(self, event: ToolStreamEvent) -> None:
-        if self.current_tool_call:
-            self.current_tool_call.set_stream_message(event.message)
+        if tool_call := self.tool_calls.get(event.tool_call_id):
+            tool_call.set_stream_message(event.message)
 
     async def _handle_assistant_message(self, event: AssistantEvent) -> None:
         if not event.content or not event.content.strip():
@@ -156,9 +153,9 @@ class EventHandler:
         await self.mount_callback(NoMarkupStatic(str(event), classes="unknown-event"))
 
     def stop_current_tool_call(self) -> None:
-        if self.current_tool_call:
-            self.current_tool_call.stop_spinning()
-            self.current_tool_call = None
+        for tool_call in self.tool_calls.values():
+            tool_call.stop_spinning()
+        self.tool_calls.clear()
 
     def stop_current_compact(self) -> None:
         if self.current_compact:
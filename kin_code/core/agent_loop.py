@@ -85,10 +85,12 @@ class AgentLoop:
         max_price: float | None = None,
         backend: BackendLike | None = None,
         enable_streaming: bool = False,
+        measure_tool_duration: bool = True,
     ) -> None:
         self._base_config = config
         self._max_turns = max_turns
         self._max_price = max_price
+        self._measure_tool_duration = measure_tool_duration
 
         self.agent_manager = AgentManager(
             lambda: self._base_config, initial_agent=agent_name
@@ -129,9 +131,14 @@ class AgentLoop:
             session_id=self.session_id,
         )
 
+        self.format_handler = APIToolFormatHandler()
+
         # Initialize tool runner
         self.tool_runner = ToolRunner(
-            tool_manager=self.tool_manager, auto_approve=self.config.auto_approve
+            tool_manager=self.tool_manager,
+            auto_approve=self.config.auto_approve,
+            measure_duration=self._measure_tool_duration,
+            max_concurrency=self.config.tool_concurrency,
         )
 
         # Start session migration in background
@@ -259,6 +266,9 @@ class AgentLoop:
 
     async def act(self, msg: str) -> AsyncGenerator[BaseEvent]:
         self.history.clean()
+        # Tool managers are built before the event loop runs, so background
+        # warm-up can only be scheduled once a turn starts.
+        self.tool_manager.prewarm_tools()
         async for event in self._conversation_loop(msg):
             yield event
 
@@ -333,9 +343,8 @@ class AgentLoop:
 
         last_message = self.messages[-1]
 
-        format_handler = APIToolFormatHandler()
-        parsed = format_handler.parse_message(last_message)
-        resolved = format_handler.resolve_tool_calls(parsed, self.tool_manager)
+        parsed = self.format_handler.parse_message(last_message)
+        resolved = self.format_handler.resolve_tool_calls(parsed, self.tool_manager)
 
         if not resolved.tool_calls and not resolved.failed_calls:
             return
@@ -526,11 +535,15 @@ class AgentLoop:
             self._max_price = max_price
 
         self.tool_manager = ToolManager(lambda: self.config)
+        SkillManager.refresh()
         self.skill_manager = SkillManager(lambda: self.config)
 
         # Update tool runner with new tool manager
         self.tool_runner = ToolRunner(
-            tool_manager=self.tool_manager, auto_approve=self.config.auto_approve
+            tool_manager=self.tool_manager,
+            auto_approve=self.config.auto_approve,
+            measure_duration=self._measure_tool_duration,
+            max_concurrency=self.config.tool_concurrency,
         )
 
         new_system_prompt = get_universal_system_prompt(
@@ -464,6 +464,14 @@ class VibeConfig(BaseSettings):
     enable_update_checks: bool = True
     enable_auto_update: bool = True
     api_timeout: float = 720.0
+    tool_concurrency: int = Field(
+        default=1,
+        ge=0,
+        description=(
+            "Maximum number of tool calls from a single response to run at once. "
+            "1 runs them one after another, 0 removes the limit."
+        ),
+    )
     providers: list[ProviderConfig] = Field(
         default_factory=lambda: list(DEFAULT_PROVIDERS)
     )
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from kin_code.core.llm.format import ResolvedToolCall
+from kin_code.core.llm.format import APIToolFormatHandler, ResolvedToolCall
 from kin_code.core.types import LLMMessage, Role, ToolCall
-from kin_code.core.utils import CancellationReason, get_user_cancellation_message
+from kin_code.core.utils import CancellationReason, get_user_cancellation_text
+
+_FORMAT_HANDLER = APIToolFormatHandler()
 
 
 class ConversationHistory:
@@ -21,13 +23,8 @@ class ConversationHistory:
 
     def append_tool_response(self, tool_call: ResolvedToolCall, text: str) -> None:
         """Append a tool response message to history."""
-        from kin_code.core.llm.format import APIToolFormatHandler
-
-        format_handler = APIToolFormatHandler()
         self.messages.append(
-            LLMMessage.model_validate(
-                format_handler.create_tool_response_message(tool_call, text)
-            )
+            _FORMAT_HANDLER.create_tool_response_message(tool_call, text)
         )
 
     def count_tool_responses(self, start_index: int) -> int:
@@ -63,9 +60,7 @@ class ConversationHistory:
             role=Role.tool,
             tool_call_id=tool_call_data.id or "",
             name=tool_name,
-            content=str(
-                get_user_cancellation_message(CancellationReason.TOOL_NO_RESPONSE)
-            ),
+            content=get_user_cancellation_text(CancellationReason.TOOL_NO_RESPONSE),
         )
 
     def fill_missing_tool_responses(self) -> None:
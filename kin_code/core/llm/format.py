@@ -186,7 +186,7 @@ class APIToolFormatHandler:
     def create_tool_response_message(
         self, tool_call: ResolvedToolCall, result_text: str
     ) -> LLMMessage:
-        return LLMMessage(
+        return LLMMessage.model_construct(
             role=Role.tool,
             tool_call_id=tool_call.call_id,
             name=tool_call.tool_name,
@@ -196,7 +196,7 @@ class APIToolFormatHandler:
     def create_failed_tool_response_message(
         self, failed: FailedToolCall, error_content: str
     ) -> LLMMessage:
-        return LLMMessage(
+        return LLMMessage.model_construct(
             role=Role.tool,
             tool_call_id=failed.call_id,
             name=failed.tool_name,
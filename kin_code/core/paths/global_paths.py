@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from functools import cache, cached_property
 import os
 from pathlib import Path
 
@@ -27,16 +28,74 @@ def _get_kin_home() -> Path:
     return _DEFAULT_KIN_HOME
 
 
+class _KinPaths:
+    """Paths derived from a single Kin home directory.
+
+    Each path is built on first access and then served straight from the
+    instance ``__dict__``.
+    """
+
+    def __init__(self, home: Path) -> None:
+        self.home = home
+
+    @cached_property
+    def global_config_file(self) -> Path:
+        return self.home / "config.toml"
+
+    @cached_property
+    def global_env_file(self) -> Path:
+        return self.home / ".env"
+
+    @cached_property
+    def global_tools_dir(self) -> Path:
+        return self.home / "tools"
+
+    @cached_property
+    def global_skills_dir(self) -> Path:
+        return self.home / "skills"
+
+    @cached_property
+    def global_agents_dir(self) -> Path:
+        return self.home / "agents"
+
+    @cached_property
+    def log_dir(self) -> Path:
+        return self.home / "logs"
+
+    @cached_property
+    def session_log_dir(self) -> Path:
+        return self.log_dir / "session"
+
+    @cached_property
+    def trusted_folders_file(self) -> Path:
+        return self.home / "trusted_folders.toml"
+
+    @cached_property
+    def log_file(self) -> Path:
+        return self.home / "kin.log"
+
+
+@cache
+def _kin_paths_for(home: Path) -> _KinPaths:
+    return _KinPaths(home)
+
+
+def _kin_paths() -> _KinPaths:
+    # Keyed on the current home so KIN_HOME/VIBE_HOME changes are still honored.
+    return _kin_paths_for(_get_kin_home())
+
+
 KIN_HOME = GlobalPath(_get_kin_home)
 VIBE_HOME = KIN_HOME  # Backwards compatibility alias
-GLOBAL_CONFIG_FILE = GlobalPath(lambda: KIN_HOME.path / "config.toml")
-GLOBAL_ENV_FILE = GlobalPath(lambda: KIN_HOME.path / ".env")
-GLOBAL_TOOLS_DIR = GlobalPath(lambda: KIN_HOME.path / "tools")
-GLOBAL_SKILLS_DIR = GlobalPath(lambda: KIN_HOME.path / "skills")
-GLOBAL_AGENTS_DIR = GlobalPath(lambda: KIN_HOME.path / "agents")
-SESSION_LOG_DIR = GlobalPath(lambda: KIN_HOME.path / "logs" / "session")
-TRUSTED_FOLDERS_FILE = GlobalPath(lambda: KIN_HOME.path / "trusted_folders.toml")
-LOG_DIR = GlobalPath(lambda: KIN_HOME.path / "logs")
-LOG_FILE = GlobalPath(lambda: KIN_HOME.path / "kin.log")
-
-DEFAULT_TOOL_DIR = GlobalPath(lambda: KIN_ROOT / "core" / "tools" / "builtins")
+GLOBAL_CONFIG_FILE = GlobalPath(lambda: _kin_paths().global_config_file)
+GLOBAL_ENV_FILE = GlobalPath(lambda: _kin_paths().global_env_file)
+GLOBAL_TOOLS_DIR = GlobalPath(lambda: _kin_paths().global_tools_dir)
+GLOBAL_SKILLS_DIR = GlobalPath(lambda: _kin_paths().global_skills_dir)
+GLOBAL_AGENTS_DIR = GlobalPath(lambda: _kin_paths().global_agents_dir)
+SESSION_LOG_DIR = GlobalPath(lambda: _kin_paths().session_log_dir)
+TRUSTED_FOLDERS_FILE = GlobalPath(lambda: _kin_paths().trusted_folders_file)
+LOG_DIR = GlobalPath(lambda: _kin_paths().log_dir)
+LOG_FILE = GlobalPath(lambda: _kin_paths().log_file)
+
+_DEFAULT_TOOL_DIR = KIN_ROOT / "core" / "tools" / "builtins"
+DEFAULT_TOOL_DIR = GlobalPath(lambda: _DEFAULT_TOOL_DIR)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import threading
 
 from kin_code.core.agent_loop import AgentLoop
 from kin_code.core.agents.models import BuiltinAgentName
@@ -10,6 +12,28 @@ from kin_code.core.types import AssistantEvent, LLMMessage, OutputFormat, Role
 from kin_code.core.utils import ConversationLimitException, logger
 
 
+class _ThreadRunner(threading.local):
+    runner: asyncio.Runner | None = None
+
+
+_thread_runner = _ThreadRunner()
+
+
+def _get_runner() -> asyncio.Runner:
+    """Return this thread's persistent asyncio runner, creating it on first use.
+
+    Reusing one event loop across calls avoids paying loop setup and teardown
+    on every run when programmatic mode is driven from a batch or service.
+    The loop is not installed as the thread's current event loop.
+    """
+    if (runner := _thread_runner.runner) is None:
+        runner = _thread_runner.runner = asyncio.Runner(
+            loop_factory=asyncio.new_event_loop
+        )
+        atexit.register(runner.close)
+    return runner
+
+
 def run_programmatic(
     config: VibeConfig,
     prompt: str,
@@ -48,24 +72,26 @@ def run_programmatic(
         max_turns=max_turns,
         max_price=max_price,
         enable_streaming=False,
+        measure_tool_duration=False,
     )
     logger.info("USER: %s", prompt)
 
     async def _async_run() -> str | None:
         if previous_messages:
-            non_system_messages = [
-                msg for msg in previous_messages if not (msg.role == Role.system)
-            ]
-            agent_loop.messages.extend(non_system_messages)
+            messages = agent_loop.messages
+            initial_count = len(messages)
+            messages.extend(msg for msg in previous_messages if msg.role != Role.system)
             logger.info(
-                "Loaded %d messages from previous session", len(non_system_messages)
+                "Loaded %d messages from previous session",
+                len(messages) - initial_count,
             )
 
+        on_event = formatter.on_event
         async for event in agent_loop.act(prompt):
-            formatter.on_event(event)
+            on_event(event)
             if isinstance(event, AssistantEvent) and event.stopped_by_middleware:
                 raise ConversationLimitException(event.content)
 
         return formatter.finalize()
 
-    return asyncio.run(_async_run())
+    return _get_runner().run(_async_run())
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+import itertools
 from logging import getLogger
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from kin_code.core.paths.config_paths import resolve_local_skills_dir
 from kin_code.core.paths.global_paths import GLOBAL_SKILLS_DIR
 from kin_code.core.skills.models import SkillInfo, SkillMetadata
-from kin_code.core.skills.parser import SkillParseError, parse_frontmatter
+from kin_code.core.skills.parser import SkillParseError, parse_frontmatter_from_file
 from kin_code.core.utils import name_matches
 
 if TYPE_CHECKING:
@@ -16,6 +19,12 @@ if TYPE_CHECKING:
 
 logger = getLogger("kin_code")
 
+type _SearchPathsKey = tuple[Path, tuple[Path, ...], Path]
+
+_search_paths_cache: dict[_SearchPathsKey, list[Path]] = {}
+
+_MAX_DISCOVERY_WORKERS = 8
+
 
 class SkillManager:
     """Manages skill discovery and retrieval.
@@ -93,8 +102,11 @@ class SkillManager:
 
     def __init__(self, config_getter: Callable[[], VibeConfig]) -> None:
         self._config_getter = config_getter
-        self._search_paths = self._compute_search_paths(self._config)
+        self._search_paths = self._get_search_paths(self._config)
         self._available: dict[str, SkillInfo] = self._discover_skills()
+        # Filtered view of _available, rebuilt only when the skill filters change.
+        self._filter_key: tuple[tuple[str, ...], tuple[str, ...]] | None = None
+        self._filtered: dict[str, SkillInfo] = {}
 
         if self._available:
             logger.info(
@@ -109,20 +121,42 @@ class SkillManager:
 
     @property
     def available_skills(self) -> dict[str, SkillInfo]:
-        if self._config.enabled_skills:
+        config = self._config
+        filter_key = (tuple(config.enabled_skills), tuple(config.disabled_skills))
+        if filter_key != self._filter_key:
+            self._filtered = self._filter_skills(*filter_key)
+            self._filter_key = filter_key
+        return self._filtered
+
+    def _filter_skills(
+        self, enabled: tuple[str, ...], disabled: tuple[str, ...]
+    ) -> dict[str, SkillInfo]:
+        if enabled:
             return {
                 name: info
                 for name, info in self._available.items()
-                if name_matches(name, self._config.enabled_skills)
+                if name_matches(name, list(enabled))
             }
-        if self._config.disabled_skills:
+        if disabled:
             return {
                 name: info
                 for name, info in self._available.items()
-                if not name_matches(name, self._config.disabled_skills)
+                if not name_matches(name, list(disabled))
             }
         return dict(self._available)
 
+    @staticmethod
+    def refresh() -> None:
+        """Forget memoized search paths so the next manager rescans the disk."""
+        _search_paths_cache.clear()
+
+    @classmethod
+    def _get_search_paths(cls, config: VibeConfig) -> list[Path]:
+        key = (Path.cwd(), tuple(config.skill_paths), GLOBAL_SKILLS_DIR.path)
+        if (paths := _search_paths_cache.get(key)) is None:
+            paths = _search_paths_cache[key] = cls._compute_search_paths(config)
+        return list(paths)
+
     @staticmethod
     def _compute_search_paths(config: VibeConfig) -> list[Path]:
         paths: list[Path] = []
@@ -137,11 +171,15 @@ class SkillManager:
         if GLOBAL_SKILLS_DIR.path.is_dir():
             paths.append(GLOBAL_SKILLS_DIR.path)
 
+        # Lexical normalization is enough for dedup and avoids resolve()'s
+        # per-component stat calls; duplicate skill names are still
+        # first-wins in _discover_skills if a symlinked path slips through.
+        seen: set[str] = set()
         unique: list[Path] = []
         for p in paths:
-            rp = p.resolve()
-            if rp not in unique:
-                unique.append(rp)
+            if (normalized := os.path.normpath(os.path.abspath(p))) not in seen:
+                seen.add(normalized)
+                unique.append(Path(normalized))
 
         return unique
 
@@ -155,11 +193,19 @@ class SkillManager:
         Returns:
             Dictionary mapping skill names to their SkillInfo objects.
         """
+        files_per_dir = [self._find_skill_files(base) for base in self._search_paths]
+        loaded = iter(
+            self._load_skills([file for files in files_per_dir for file in files])
+        )
+
         skills: dict[str, SkillInfo] = {}
-        for base in self._search_paths:
-            if not base.is_dir():
-                continue
-            for name, info in self._discover_skills_in_dir(base).items():
+        for files in files_per_dir:
+            dir_skills = {
+                info.name: info
+                for info in itertools.islice(loaded, len(files))
+                if info is not None
+            }
+            for name, info in dir_skills.items():
                 if name not in skills:
                     skills[name] = info
                 else:
@@ -171,17 +217,35 @@ class SkillManager:
                     )
         return skills
 
-    def _discover_skills_in_dir(self, base: Path) -> dict[str, SkillInfo]:
-        skills: dict[str, SkillInfo] = {}
-        for skill_dir in base.iterdir():
-            if not skill_dir.is_dir():
-                continue
-            skill_file = skill_dir / "SKILL.md"
-            if not skill_file.is_file():
+    def _find_skill_files(self, base: Path) -> list[Path]:
+        try:
+            entries = list(os.scandir(base))
+        except OSError as e:
+            logger.debug("Cannot scan skills directory %s: %s", base, e)
+            return []
+        skill_files: list[Path] = []
+        for entry in entries:
+            # DirEntry caches the file type from readdir, so this is stat-free
+            # for everything except symlinks.
+            if not entry.is_dir():
                 continue
-            if (skill_info := self._try_load_skill(skill_file)) is not None:
-                skills[skill_info.name] = skill_info
-        return skills
+            if os.path.isfile(skill_file := os.path.join(entry.path, "SKILL.md")):
+                skill_files.append(Path(skill_file))
+        return skill_files
+
+    def _load_skills(self, skill_files: list[Path]) -> list[SkillInfo | None]:
+        """Parse skill files, overlapping their I/O on a small thread pool.
+
+        Results are returned in input order so callers can apply first-wins
+        precedence exactly as with a sequential scan.
+        """
+        if len(skill_files) <= 1:
+            return [self._try_load_skill(file) for file in skill_files]
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_DISCOVERY_WORKERS, len(skill_files)),
+            thread_name_prefix="skill-discovery",
+        ) as executor:
+            return list(executor.map(self._try_load_skill, skill_files))
 
     def _try_load_skill(self, skill_file: Path) -> SkillInfo | None:
         try:
@@ -193,11 +257,10 @@ class SkillManager:
 
     def _parse_skill_file(self, skill_path: Path) -> SkillInfo:
         try:
-            content = skill_path.read_text(encoding="utf-8")
+            frontmatter = parse_frontmatter_from_file(skill_path)
         except OSError as e:
             raise SkillParseError(f"Cannot read file: {e}") from e
 
-        frontmatter, _ = parse_frontmatter(content)
         metadata = SkillMetadata.model_validate(frontmatter)
 
         skill_name_from_dir = skill_path.parent.name
@@ -212,4 +275,9 @@ class SkillManager:
         return SkillInfo.from_metadata(metadata, skill_path)
 
     def get_skill(self, name: str) -> SkillInfo | None:
+        """Look up an enabled skill by name.
+
+        This is a dict lookup against the cached filtered view, so repeated
+        calls, including misses, never re-run the enabled/disabled patterns.
+        """
         return self.available_skills.get(name)
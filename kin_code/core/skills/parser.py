@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from pathlib import Path
 import re
 from typing import Any
 
@@ -14,17 +15,45 @@ class SkillParseError(Exception):
 
 FM_BOUNDARY = re.compile(r"^-{3,}\s*$", re.MULTILINE)
 
+_MISSING_FRONTMATTER = (
+    "Missing or invalid YAML frontmatter (metadata section must start and end with ---)"
+)
+
 
 def parse_frontmatter(content: str) -> tuple[dict[str, Any], str]:
     splits = FM_BOUNDARY.split(content, 2)
     if len(splits) < 3 or splits[0].strip():  # noqa: PLR2004
-        raise SkillParseError(
-            "Missing or invalid YAML frontmatter (metadata section must start and end with ---)"
-        )
+        raise SkillParseError(_MISSING_FRONTMATTER)
+
+    return _load_frontmatter(splits[1]), splits[2]
+
+
+def parse_frontmatter_from_file(path: Path) -> dict[str, Any]:
+    """Parse the YAML frontmatter of a file without reading its body.
+
+    Lines are consumed only up to the closing ``---`` boundary, so large
+    markdown bodies are never loaded during discovery.
+    """
+    yaml_lines: list[str] = []
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                break
+        else:
+            raise SkillParseError(_MISSING_FRONTMATTER)
+
+        if not FM_BOUNDARY.match(line):
+            raise SkillParseError(_MISSING_FRONTMATTER)
+
+        for line in f:
+            if FM_BOUNDARY.match(line):
+                return _load_frontmatter("".join(yaml_lines))
+            yaml_lines.append(line)
+
+    raise SkillParseError(_MISSING_FRONTMATTER)
 
-    yaml_content = splits[1]
-    markdown_body = splits[2]
 
+def _load_frontmatter(yaml_content: str) -> dict[str, Any]:
     try:
         frontmatter = yaml.safe_load(yaml_content)
     except yaml.YAMLError as e:
@@ -36,4 +65,4 @@ def parse_frontmatter(content: str) -> tuple[dict[str, Any], str]:
     if not isinstance(frontmatter, dict):
         raise SkillParseError("YAML frontmatter must be a mapping/dictionary")
 
-    return frontmatter, markdown_body
+    return frontmatter
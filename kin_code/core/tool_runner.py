@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncGenerator, Callable
+from collections.abc import AsyncGenerator, Callable, Iterable
+from dataclasses import dataclass
 from enum import StrEnum, auto
+import functools
 import time
-from typing import cast
+from typing import Any, cast
 
 from pydantic import BaseModel
 
 from kin_code.core.agents.manager import AgentManager
-from kin_code.core.llm.format import APIToolFormatHandler, ResolvedMessage
+from kin_code.core.llm.format import ResolvedMessage, ResolvedToolCall
 from kin_code.core.tools.base import (
     BaseTool,
     InvokeContext,
@@ -34,7 +36,7 @@ from kin_code.core.types import (
 from kin_code.core.utils import (
     TOOL_ERROR_TAG,
     CancellationReason,
-    get_user_cancellation_message,
+    get_user_cancellation_text,
 )
 
 
@@ -43,11 +45,89 @@ class ToolExecutionResponse(StrEnum):
     EXECUTE = auto()
 
 
-class ToolDecision(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ToolDecision:
     verdict: ToolExecutionResponse
     feedback: str | None = None
 
 
+_AUTO_APPROVED = ToolDecision(verdict=ToolExecutionResponse.EXECUTE)
+
+
+type _ToolEvent = ToolResultEvent | ToolStreamEvent
+
+
+def _as_async_approval_callback(callback: ApprovalCallback) -> AsyncApprovalCallback:
+    """Normalize an approval callback so it can always be awaited."""
+    if asyncio.iscoroutinefunction(callback):
+        return cast(AsyncApprovalCallback, callback)
+
+    sync_callback = cast(SyncApprovalCallback, callback)
+
+    async def approve(
+        tool_name: str, args: BaseModel, tool_call_id: str
+    ) -> tuple[ApprovalResponse, str | None]:
+        return sync_callback(tool_name, args, tool_call_id)
+
+    return approve
+
+
+def _plain_value(value: Any) -> Any:
+    match value:
+        case BaseModel():
+            return value.model_dump()
+        case list() if value and isinstance(value[0], BaseModel):
+            return [item.model_dump() for item in value]
+    return value
+
+
+_SCALAR_TYPES: frozenset[Any] = frozenset({str, int, float, bool})
+
+
+@functools.cache
+def _result_fields(model_class: type[BaseModel]) -> tuple[tuple[str, bool], ...]:
+    """Names of the non-excluded fields, each flagged if it may hold models."""
+    return tuple(
+        (name, field.annotation not in _SCALAR_TYPES)
+        for name, field in model_class.model_fields.items()
+        if not field.exclude
+    )
+
+
+def _format_tool_result(result: BaseModel) -> str:
+    """Render a tool result as ``name: value`` lines for the conversation history.
+
+    Walks the model's fields directly instead of dumping the whole model to a
+    dict first; only nested models are dumped, so the text matches
+    ``model_dump()`` output. Fields marked ``exclude=True`` are skipped.
+    """
+    values = result.__dict__
+    lines = [
+        f"{name}: {_plain_value(values[name]) if nested else values[name]}"
+        for name, nested in _result_fields(type(result))
+    ]
+    if extra := result.__pydantic_extra__:
+        lines.extend(f"{name}: {_plain_value(value)}" for name, value in extra.items())
+    return "\n".join(lines)
+
+
+async def _cancel_tasks(tasks: list[asyncio.Task[None]]) -> None:
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _collect_queued_results(
+    queue: asyncio.Queue[tuple[int, _ToolEvent | BaseException]],
+    ready: dict[int, ToolResultEvent],
+) -> None:
+    """Move the result events still sitting in ``queue`` into ``ready``."""
+    while not queue.empty():
+        index, item = queue.get_nowait()
+        if isinstance(item, ToolResultEvent):
+            ready[index] = item
+
+
 class ToolRunner:
     """Coordinates tool execution with permission handling."""
 
@@ -56,10 +136,29 @@ class ToolRunner:
         tool_manager: ToolManager,
         approval_callback: ApprovalCallback | None = None,
         auto_approve: bool = False,
+        measure_duration: bool = True,
+        max_concurrency: int = 1,
     ) -> None:
         self.tool_manager = tool_manager
         self.approval_callback = approval_callback
         self.auto_approve = auto_approve
+        # When False, ToolResultEvent.duration is left as None.
+        self.measure_duration = measure_duration
+        # Upper bound on tool calls run at once; 1 keeps them sequential and
+        # 0 means no limit.
+        self.max_concurrency = max_concurrency
+
+    @property
+    def approval_callback(self) -> ApprovalCallback | None:
+        return self._approval_callback
+
+    @approval_callback.setter
+    def approval_callback(self, callback: ApprovalCallback | None) -> None:
+        # Classify sync vs async once here rather than on every approval request.
+        self._approval_callback = callback
+        self._async_approval_callback = (
+            _as_async_approval_callback(callback) if callback else None
+        )
 
     def set_approval_callback(self, callback: ApprovalCallback | None) -> None:
         """Set or update the approval callback."""
@@ -68,11 +167,47 @@ class ToolRunner:
     def _make_tool_message(
         self, tool_name: str, content: str, tool_call_id: str
     ) -> LLMMessage:
-        """Create a tool response message."""
-        return LLMMessage(
+        """Create a tool response message.
+
+        Every field is already a validated ``str`` and tool messages carry no
+        ``message_id``, so validation would be a no-op and is skipped.
+        """
+        return LLMMessage.model_construct(
             role=Role.tool, name=tool_name, content=content, tool_call_id=tool_call_id
         )
 
+    def _unsuccessful_result(
+        self,
+        tool_call: ResolvedToolCall,
+        message: str,
+        history_append_func: Callable[[LLMMessage], None],
+        *,
+        skipped: bool = False,
+    ) -> ToolResultEvent:
+        """Record ``message`` as the call's tool response and build its event.
+
+        ``message`` becomes the skip reason when ``skipped`` is set and the
+        error otherwise. All fields are already validated, so the event is
+        built without validation.
+        """
+        history_append_func(
+            self._make_tool_message(tool_call.tool_name, message, tool_call.call_id)
+        )
+        if skipped:
+            return ToolResultEvent.model_construct(
+                tool_name=tool_call.tool_name,
+                tool_class=tool_call.tool_class,
+                skipped=True,
+                skip_reason=message,
+                tool_call_id=tool_call.call_id,
+            )
+        return ToolResultEvent.model_construct(
+            tool_name=tool_call.tool_name,
+            tool_class=tool_call.tool_class,
+            error=message,
+            tool_call_id=tool_call.call_id,
+        )
+
     def _make_error_message(self, tool_name: str, error: str) -> str:
         """Format an error message with the standard error tag."""
         return f"<{TOOL_ERROR_TAG}>{tool_name}: {error}</{TOOL_ERROR_TAG}>"
@@ -104,193 +239,306 @@ class ToolRunner:
             )
             stats.tool_calls_failed += 1
             history_append_func(
-                LLMMessage.model_validate(
-                    APIToolFormatHandler().create_failed_tool_response_message(
-                        failed, error_msg
-                    )
-                )
+                self._make_tool_message(failed.tool_name, error_msg, failed.call_id)
             )
 
+        if self._runs_concurrently(resolved.tool_calls):
+            async for event in self._handle_concurrently(
+                resolved.tool_calls,
+                agent_manager,
+                user_input_callback,
+                stats,
+                history_append_func,
+            ):
+                yield event
+            return
+
         for tool_call in resolved.tool_calls:
-            yield ToolCallEvent(
-                tool_name=tool_call.tool_name,
-                tool_class=tool_call.tool_class,
-                args=tool_call.validated_args,
-                tool_call_id=tool_call.call_id,
+            yield self._make_call_event(tool_call)
+
+            prepared = await self._prepare_tool_call(
+                tool_call, stats, history_append_func
             )
+            if isinstance(prepared, ToolResultEvent):
+                yield prepared
+                continue
 
+            async for event in self._invoke_tool(
+                tool_call,
+                prepared,
+                agent_manager,
+                user_input_callback,
+                stats,
+                history_append_func,
+            ):
+                yield event
+
+    def _runs_concurrently(self, tool_calls: list[ResolvedToolCall]) -> bool:
+        if self.max_concurrency == 1 or len(tool_calls) <= 1:
+            return False
+        return not any(tool_call.tool_class.sequential for tool_call in tool_calls)
+
+    async def _handle_concurrently(
+        self,
+        tool_calls: list[ResolvedToolCall],
+        agent_manager: AgentManager,
+        user_input_callback: UserInputCallback | None,
+        stats: AgentStats,
+        history_append_func: Callable[[LLMMessage], None],
+    ) -> AsyncGenerator[ToolCallEvent | ToolResultEvent | ToolStreamEvent]:
+        """Run approved tool calls concurrently.
+
+        Calls are announced and approved one at a time, in order. Stream events
+        are yielded as they arrive, while result events and history messages
+        are released in the original call order.
+        """
+        history: list[list[LLMMessage]] = [[] for _ in tool_calls]
+        ready: dict[int, ToolResultEvent] = {}
+        queue: asyncio.Queue[tuple[int, _ToolEvent | BaseException]] = asyncio.Queue()
+        approved: dict[int, BaseTool] = {}
+        tasks: list[asyncio.Task[None]] = []
+        next_index = 0
+
+        async def run_one(index: int, semaphore: asyncio.Semaphore) -> None:
+            tool_call, tool_instance = tool_calls[index], approved[index]
             try:
-                tool_instance = self.tool_manager.get(tool_call.tool_name)
-            except (KeyError, ValueError, AttributeError) as exc:
-                error_msg = f"Error getting tool '{tool_call.tool_name}': {exc}"
-                yield ToolResultEvent(
-                    tool_name=tool_call.tool_name,
-                    tool_class=tool_call.tool_class,
-                    error=error_msg,
-                    tool_call_id=tool_call.call_id,
-                )
-                history_append_func(
-                    self._make_tool_message(
-                        tool_call.tool_name, error_msg, tool_call.call_id
-                    )
+                async with semaphore:
+                    async for event in self._invoke_tool(
+                        tool_call,
+                        tool_instance,
+                        agent_manager,
+                        user_input_callback,
+                        stats,
+                        history[index].append,
+                    ):
+                        queue.put_nowait((index, event))
+            except BaseException as exc:
+                queue.put_nowait((index, exc))
+                raise
+
+        try:
+            for index, tool_call in enumerate(tool_calls):
+                yield self._make_call_event(tool_call)
+                prepared = await self._prepare_tool_call(
+                    tool_call, stats, history[index].append
                 )
-                continue
+                if isinstance(prepared, ToolResultEvent):
+                    ready[index] = prepared
+                else:
+                    approved[index] = prepared
 
-            decision = await self._should_execute(
-                tool_instance, tool_call.validated_args, tool_call.call_id
+            semaphore = asyncio.Semaphore(self.max_concurrency or len(approved) or 1)
+            tasks.extend(
+                asyncio.create_task(run_one(index, semaphore)) for index in approved
             )
 
-            if decision.verdict == ToolExecutionResponse.SKIP:
-                stats.tool_calls_rejected += 1
-                skip_reason = decision.feedback or str(
-                    get_user_cancellation_message(
-                        CancellationReason.TOOL_SKIPPED, tool_call.tool_name
-                    )
-                )
-                yield ToolResultEvent(
-                    tool_name=tool_call.tool_name,
-                    tool_class=tool_call.tool_class,
-                    skipped=True,
-                    skip_reason=skip_reason,
-                    tool_call_id=tool_call.call_id,
-                )
-                history_append_func(
-                    self._make_tool_message(
-                        tool_call.tool_name, skip_reason, tool_call.call_id
-                    )
+            while True:
+                while next_index in ready:
+                    yield ready.pop(next_index)
+                    next_index += 1
+                if next_index == len(tool_calls):
+                    break
+
+                index, item = await queue.get()
+                match item:
+                    case BaseException():
+                        raise item
+                    case ToolResultEvent():
+                        ready[index] = item
+                    case _:
+                        yield item
+        except asyncio.CancelledError:
+            # Like the sequential path, report every announced call that has not
+            # finished yet so its spinner stops, then let the cancellation through.
+            await _cancel_tasks(tasks)
+            _collect_queued_results(queue, ready)
+            self._interrupt_unfinished(
+                tool_calls, approved.keys() - ready.keys(), next_index, ready, history
+            )
+            for index in sorted(ready):
+                yield ready[index]
+            raise
+        finally:
+            await _cancel_tasks(tasks)
+            for messages in history:
+                for message in messages:
+                    history_append_func(message)
+
+    def _interrupt_unfinished(
+        self,
+        tool_calls: list[ResolvedToolCall],
+        unfinished: Iterable[int],
+        next_index: int,
+        ready: dict[int, ToolResultEvent],
+        history: list[list[LLMMessage]],
+    ) -> None:
+        """Record an interrupted result for approved calls that never produced one.
+
+        Calls still waiting for a slot, or cancelled before their first step,
+        never reach ``_invoke_tool`` and so report nothing themselves.
+        """
+        interrupted = get_user_cancellation_text(CancellationReason.TOOL_INTERRUPTED)
+        for index in unfinished:
+            if index >= next_index:
+                ready[index] = self._unsuccessful_result(
+                    tool_calls[index], interrupted, history[index].append
                 )
-                continue
 
-            stats.tool_calls_agreed += 1
+    def _make_call_event(self, tool_call: ResolvedToolCall) -> ToolCallEvent:
+        return ToolCallEvent(
+            tool_name=tool_call.tool_name,
+            tool_class=tool_call.tool_class,
+            args=tool_call.validated_args,
+            tool_call_id=tool_call.call_id,
+        )
 
-            try:
-                start_time = time.perf_counter()
-                result_model = None
-
-                async for item in tool_instance.invoke(
-                    ctx=InvokeContext(
-                        tool_call_id=tool_call.call_id,
-                        approval_callback=self.approval_callback,
-                        agent_manager=agent_manager,
-                        user_input_callback=user_input_callback,
-                    ),
-                    **tool_call.args_dict,
-                ):
-                    if isinstance(item, ToolStreamEvent):
-                        yield item
-                    else:
-                        result_model = item
+    async def _prepare_tool_call(
+        self,
+        tool_call: ResolvedToolCall,
+        stats: AgentStats,
+        history_append_func: Callable[[LLMMessage], None],
+    ) -> BaseTool | ToolResultEvent:
+        """Resolve the tool and decide whether it may run.
 
-                duration = time.perf_counter() - start_time
+        Returns the tool instance when the call is approved, or the result
+        event to report when it cannot run.
+        """
+        try:
+            tool_instance = self.tool_manager.get(tool_call.tool_name)
+        except (KeyError, ValueError, AttributeError) as exc:
+            error_msg = f"Error getting tool '{tool_call.tool_name}': {exc}"
+            return self._unsuccessful_result(tool_call, error_msg, history_append_func)
+
+        # Only an approval prompt needs to await; every other decision is made
+        # synchronously without creating a coroutine.
+        decision = (
+            _AUTO_APPROVED
+            if self.auto_approve
+            else self._check_permission(tool_instance, tool_call.validated_args)
+        )
+        if decision is None:
+            decision = await self._ask_approval(
+                tool_instance.get_name(), tool_call.validated_args, tool_call.call_id
+            )
+
+        if decision.verdict == ToolExecutionResponse.SKIP:
+            stats.tool_calls_rejected += 1
+            skip_reason = decision.feedback or get_user_cancellation_text(
+                CancellationReason.TOOL_SKIPPED, tool_call.tool_name
+            )
+            return self._unsuccessful_result(
+                tool_call, skip_reason, history_append_func, skipped=True
+            )
 
-                if result_model is None:
-                    raise ToolError("Tool did not yield a result")
+        stats.tool_calls_agreed += 1
+        return tool_instance
 
-                text = "\n".join(
-                    f"{k}: {v}" for k, v in result_model.model_dump().items()
-                )
-                history_append_func(
-                    self._make_tool_message(
-                        tool_call.tool_name, text, tool_call.call_id
-                    )
-                )
-                yield ToolResultEvent(
-                    tool_name=tool_call.tool_name,
-                    tool_class=tool_call.tool_class,
-                    result=result_model,
-                    duration=duration,
+    async def _invoke_tool(
+        self,
+        tool_call: ResolvedToolCall,
+        tool_instance: BaseTool,
+        agent_manager: AgentManager,
+        user_input_callback: UserInputCallback | None,
+        stats: AgentStats,
+        history_append_func: Callable[[LLMMessage], None],
+    ) -> AsyncGenerator[ToolResultEvent | ToolStreamEvent]:
+        """Run an approved tool call, yielding its stream events and result."""
+        try:
+            start_time = time.perf_counter() if self.measure_duration else None
+            result_model = None
+
+            async for item in tool_instance.invoke(
+                ctx=InvokeContext(
                     tool_call_id=tool_call.call_id,
-                )
+                    approval_callback=self.approval_callback,
+                    agent_manager=agent_manager,
+                    user_input_callback=user_input_callback,
+                ),
+                **tool_call.args_dict,
+            ):
+                if isinstance(item, ToolStreamEvent):
+                    yield item
+                else:
+                    result_model = item
 
-                stats.tool_calls_succeeded += 1
+            duration = (
+                time.perf_counter() - start_time if start_time is not None else None
+            )
 
-            except asyncio.CancelledError:
-                cancel = str(
-                    get_user_cancellation_message(CancellationReason.TOOL_INTERRUPTED)
-                )
-                yield ToolResultEvent(
-                    tool_name=tool_call.tool_name,
-                    tool_class=tool_call.tool_class,
-                    error=cancel,
-                    tool_call_id=tool_call.call_id,
-                )
-                history_append_func(
-                    self._make_tool_message(
-                        tool_call.tool_name, cancel, tool_call.call_id
-                    )
-                )
-                raise
+            if result_model is None:
+                raise ToolError("Tool did not yield a result")
 
-            except (ToolError, ToolPermissionError) as exc:
-                error_msg = f"<{TOOL_ERROR_TAG}>{tool_instance.get_name()} failed: {exc}</{TOOL_ERROR_TAG}>"
-                yield ToolResultEvent(
-                    tool_name=tool_call.tool_name,
-                    tool_class=tool_call.tool_class,
-                    error=error_msg,
-                    tool_call_id=tool_call.call_id,
-                )
-                if isinstance(exc, ToolPermissionError):
-                    stats.tool_calls_agreed, stats.tool_calls_rejected = (
-                        stats.tool_calls_agreed - 1,
-                        stats.tool_calls_rejected + 1,
-                    )
-                else:
-                    stats.tool_calls_failed += 1
-                history_append_func(
-                    self._make_tool_message(
-                        tool_call.tool_name, error_msg, tool_call.call_id
-                    )
+            history_append_func(
+                self._make_tool_message(
+                    tool_call.tool_name,
+                    _format_tool_result(result_model),
+                    tool_call.call_id,
                 )
-                continue
+            )
+            yield ToolResultEvent(
+                tool_name=tool_call.tool_name,
+                tool_class=tool_call.tool_class,
+                result=result_model,
+                duration=duration,
+                tool_call_id=tool_call.call_id,
+            )
 
-    async def _should_execute(
-        self, tool: BaseTool, args: BaseModel, tool_call_id: str
-    ) -> ToolDecision:
-        """Check permissions and ask for approval if needed."""
-        if self.auto_approve:
-            return ToolDecision(verdict=ToolExecutionResponse.EXECUTE)
+            stats.tool_calls_succeeded += 1
 
+        except asyncio.CancelledError:
+            cancel = get_user_cancellation_text(CancellationReason.TOOL_INTERRUPTED)
+            yield self._unsuccessful_result(tool_call, cancel, history_append_func)
+            raise
+
+        except (ToolError, ToolPermissionError) as exc:
+            error_msg = f"<{TOOL_ERROR_TAG}>{tool_instance.get_name()} failed: {exc}</{TOOL_ERROR_TAG}>"
+            if isinstance(exc, ToolPermissionError):
+                stats.tool_calls_agreed, stats.tool_calls_rejected = (
+                    stats.tool_calls_agreed - 1,
+                    stats.tool_calls_rejected + 1,
+                )
+            else:
+                stats.tool_calls_failed += 1
+            yield self._unsuccessful_result(tool_call, error_msg, history_append_func)
+
+    def _check_permission(self, tool: BaseTool, args: BaseModel) -> ToolDecision | None:
+        """Decide from configuration alone; None means the user must be asked."""
+        tool_name = tool.get_name()
         allowlist_denylist_result = tool.check_allowlist_denylist(args)
         match allowlist_denylist_result:
             case ToolPermission.ALWAYS:
-                return ToolDecision(verdict=ToolExecutionResponse.EXECUTE)
+                return _AUTO_APPROVED
             case ToolPermission.NEVER:
                 denylist_patterns = tool.config.denylist
                 denylist_str = ", ".join(repr(pattern) for pattern in denylist_patterns)
                 return ToolDecision(
                     verdict=ToolExecutionResponse.SKIP,
-                    feedback=f"Tool '{tool.get_name()}' blocked by denylist: [{denylist_str}]",
+                    feedback=f"Tool '{tool_name}' blocked by denylist: [{denylist_str}]",
                 )
 
-        tool_name = tool.get_name()
-        perm = self.tool_manager.get_tool_config(tool_name).permission
-
-        match perm:
+        match self.tool_manager.get_tool_permission(tool_name):
             case ToolPermission.ALWAYS:
-                return ToolDecision(verdict=ToolExecutionResponse.EXECUTE)
+                return _AUTO_APPROVED
             case ToolPermission.NEVER:
                 return ToolDecision(
                     verdict=ToolExecutionResponse.SKIP,
                     feedback=f"Tool '{tool_name}' is permanently disabled",
                 )
 
-        return await self._ask_approval(tool_name, args, tool_call_id)
+        return None
 
     async def _ask_approval(
         self, tool_name: str, args: BaseModel, tool_call_id: str
     ) -> ToolDecision:
         """Ask user for approval to execute a tool."""
-        if not self.approval_callback:
+        if not self._async_approval_callback:
             return ToolDecision(
                 verdict=ToolExecutionResponse.SKIP,
                 feedback="Tool execution not permitted.",
             )
-        if asyncio.iscoroutinefunction(self.approval_callback):
-            async_callback = cast(AsyncApprovalCallback, self.approval_callback)
-            response, feedback = await async_callback(tool_name, args, tool_call_id)
-        else:
-            sync_callback = cast(SyncApprovalCallback, self.approval_callback)
-            response, feedback = sync_callback(tool_name, args, tool_call_id)
+        response, feedback = await self._async_approval_callback(
+            tool_name, args, tool_call_id
+        )
 
         match response:
             case ApprovalResponse.YES:
@@ -4,8 +4,10 @@ from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass, field
 from enum import StrEnum, auto
+import fnmatch
 import functools
 import inspect
+import os
 from pathlib import Path
 import re
 import sys
@@ -32,6 +34,21 @@ if TYPE_CHECKING:
 ARGS_COUNT = 4
 
 
+@functools.lru_cache(maxsize=64)
+def _compile_path_patterns(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Combine fnmatch patterns into one regex, or None if there are none."""
+    if not patterns:
+        return None
+    return re.compile(
+        "|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns)
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _snake_case(name: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
 @dataclass
 class InvokeContext:
     """Context passed to tools during invocation."""
@@ -115,6 +132,10 @@ class BaseTool[
 
     prompt_path: ClassVar[Path] | None = None
 
+    # Tools that mutate shared state or talk to the user set this so a batch of
+    # tool calls containing them is never run concurrently.
+    sequential: ClassVar[bool] = False
+
     def __init__(self, config: ToolConfig, state: ToolState) -> None:
         self.config = config
         self.state = state
@@ -312,9 +333,7 @@ class BaseTool[
 
     @classmethod
     def get_name(cls) -> str:
-        name = cls.__name__
-        snake_case = re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
-        return snake_case
+        return _snake_case(cls.__name__)
 
     @classmethod
     def create_config_with_permission(
@@ -334,3 +353,25 @@ class BaseTool[
         Base implementation returns None. Override in subclasses for specific logic.
         """
         return None
+
+    def check_path_allowlist_denylist(self, path: str) -> ToolPermission | None:
+        """Match a path argument against the denylist, then the allowlist.
+
+        The path is made absolute against the working directory and compared
+        with ``fnmatch`` semantics. Each list is compiled to a single regex
+        once and reused across calls.
+        """
+        path_obj = Path(path).expanduser()
+        if not path_obj.is_absolute():
+            path_obj = Path.cwd() / path_obj
+        path_str = os.path.normcase(path_obj)
+
+        denylist = _compile_path_patterns(tuple(self.config.denylist))
+        if denylist and denylist.match(path_str):
+            return ToolPermission.NEVER
+
+        allowlist = _compile_path_patterns(tuple(self.config.allowlist))
+        if allowlist and allowlist.match(path_str):
+            return ToolPermission.ALWAYS
+
+        return None
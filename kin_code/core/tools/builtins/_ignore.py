@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+import os
+from pathlib import Path
+import re
+import stat
+
+import pathspec
+
+
+@lru_cache(maxsize=64)
+def _read_ignore_file(path: str, mtime_ns: int, size: int) -> tuple[str, ...]:
+    """Return the patterns in an ignore file.
+
+    ``mtime_ns`` and ``size`` are only part of the cache key, so the file is
+    read again as soon as it changes on disk.
+    """
+    try:
+        content = Path(path).read_text("utf-8")
+    except OSError:
+        return ()
+    return tuple(
+        line
+        for raw in content.splitlines()
+        if (line := raw.strip()) and not line.startswith("#")
+    )
+
+
+def load_ignore_file(path: Path) -> tuple[str, ...]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return ()
+    if not stat.S_ISREG(st.st_mode):
+        return ()
+    return _read_ignore_file(str(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=32)
+def _compile_spec(patterns: tuple[str, ...]) -> pathspec.PathSpec:
+    return pathspec.PathSpec.from_lines("gitignore", patterns)
+
+
+def build_exclude_spec(
+    base_path: Path,
+    exclude_patterns: Iterable[str],
+    codeignore_file: str,
+    respect_gitignore: bool,
+) -> pathspec.PathSpec:
+    """Combine configured patterns with the ignore files found in ``base_path``.
+
+    Compiled specs are cached by their pattern list, so repeated calls only
+    stat the ignore files and compile nothing unless a pattern changed.
+    """
+    patterns = [*exclude_patterns, *load_ignore_file(base_path / codeignore_file)]
+    if respect_gitignore:
+        patterns.extend(load_ignore_file(base_path / ".gitignore"))
+    return _compile_spec(tuple(patterns))
+
+
+@lru_cache(maxsize=32)
+def _combine_regexes(regexes: tuple[str, ...]) -> Callable[[str], re.Match[str] | None]:
+    return re.compile("|".join(f"(?:{regex})" for regex in regexes)).match
+
+
+def exclude_matcher(spec: pathspec.PathSpec) -> Callable[[str], bool]:
+    """Return a predicate equivalent to ``spec.match_file`` for relative paths.
+
+    When no pattern is negated, the last matching pattern can only ever
+    exclude, so "any pattern matches" is the whole answer and all patterns are
+    tested with one combined regex. Otherwise ``spec.match_file`` is used.
+    """
+    regexes: list[str] = []
+    for pattern in spec.patterns:
+        if pattern.include is None:
+            continue
+        regex = getattr(pattern, "regex", None)
+        if (
+            pattern.include is False
+            or not isinstance(regex, re.Pattern)
+            or not isinstance(regex.pattern, str)
+            or not regex.pattern.startswith("^")
+            or regex.flags != re.UNICODE
+        ):
+            return spec.match_file
+        regexes.append(regex.pattern)
+
+    if not regexes:
+        return lambda path: False
+
+    match = _combine_regexes(tuple(regexes))
+    if os.sep == "/":
+        return lambda path: match(path) is not None
+    return lambda path: match(path.replace(os.sep, "/")) is not None
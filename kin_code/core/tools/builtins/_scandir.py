@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import os
+import stat
+import threading
+import time
+
+_CACHE_SIZE = 2048
+# Directory mtimes can be coarser than the time between two changes, so a
+# listing is only cached once its directory has been left alone for a while.
+_SETTLE_NS = 2_000_000_000
+
+
+@dataclass(frozen=True, slots=True)
+class ScanEntry:
+    """The parts of an ``os.DirEntry`` the walkers need, safe to cache.
+
+    Only the name and the file type are kept. ``stat`` always goes to disk, so
+    sizes and mtimes are never stale even when the listing came from cache.
+    """
+
+    parent: str
+    name: str
+    kind: int
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.parent, self.name)
+
+    def is_symlink(self) -> bool:
+        return self.kind == stat.S_IFLNK
+
+    def is_dir(self, *, follow_symlinks: bool = True) -> bool:
+        if follow_symlinks and self.kind == stat.S_IFLNK:
+            return os.path.isdir(self.path)
+        return self.kind == stat.S_IFDIR
+
+    def is_file(self, *, follow_symlinks: bool = True) -> bool:
+        if follow_symlinks and self.kind == stat.S_IFLNK:
+            return os.path.isfile(self.path)
+        return self.kind == stat.S_IFREG
+
+    def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+        return os.stat(self.path, follow_symlinks=follow_symlinks)
+
+
+def _kind(entry: os.DirEntry[str]) -> int:
+    try:
+        if entry.is_symlink():
+            return stat.S_IFLNK
+        if entry.is_dir(follow_symlinks=False):
+            return stat.S_IFDIR
+        if entry.is_file(follow_symlinks=False):
+            return stat.S_IFREG
+    except OSError:
+        pass
+    return 0
+
+
+_cache: OrderedDict[str, tuple[int, tuple[ScanEntry, ...]]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def scan_directory(path: str) -> tuple[ScanEntry, ...]:
+    """List ``path``, reusing the previous listing if the directory is unchanged.
+
+    Adding, removing or renaming a child bumps the directory's mtime, so one
+    ``stat`` decides whether the cached listing is still valid. Raises
+    ``OSError`` like ``os.scandir``.
+    """
+    mtime_ns = os.stat(path).st_mtime_ns
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            _cache.move_to_end(path)
+            return cached[1]
+
+    with os.scandir(path) as it:
+        entries = tuple(ScanEntry(path, entry.name, _kind(entry)) for entry in it)
+
+    if time.time_ns() - mtime_ns > _SETTLE_NS:
+        with _cache_lock:
+            _cache[path] = (mtime_ns, entries)
+            _cache.move_to_end(path)
+            if len(_cache) > _CACHE_SIZE:
+                _cache.popitem(last=False)
+    return entries
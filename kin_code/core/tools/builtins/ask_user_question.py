@@ -95,6 +95,7 @@ FORMAT:
 EXAMPLES:
 - "Which database should we use?" with options ["PostgreSQL", "SQLite", "MySQL"]
 - "Delete these files?" with options ["Yes, delete", "No, keep"]"""
+    sequential: ClassVar[bool] = True
 
     @classmethod
     def get_call_display(cls, event: ToolCallEvent) -> ToolCallDisplay:
@@ -9,7 +9,7 @@ import sys
 from typing import ClassVar, Literal, final
 
 from pydantic import BaseModel, Field
-from tree_sitter import Language, Node, Parser
+from tree_sitter import Language, Parser, Query, QueryCursor
 import tree_sitter_bash as tsbash
 
 from kin_code.core.tools.base import (
@@ -24,38 +24,55 @@ from kin_code.core.tools.ui import ToolCallDisplay, ToolResultDisplay, ToolUIDat
 from kin_code.core.types import ToolCallEvent, ToolResultEvent, ToolStreamEvent
 from kin_code.core.utils import is_windows
 
+_COMMAND_PART_TYPES = frozenset({
+    "command_name",
+    "word",
+    "string",
+    "raw_string",
+    "concatenation",
+})
+
+
+@lru_cache(maxsize=1)
+def _get_language() -> Language:
+    return Language(tsbash.language())
+
 
 @lru_cache(maxsize=1)
 def _get_parser() -> Parser:
-    return Parser(Language(tsbash.language()))
+    return Parser(_get_language())
 
 
-def _extract_commands(command: str) -> list[str]:
-    parser = _get_parser()
-    tree = parser.parse(command.encode("utf-8"))
+@lru_cache(maxsize=1)
+def _get_command_query() -> Query:
+    return Query(_get_language(), "(command) @command")
 
-    commands: list[str] = []
 
-    def find_commands(node: Node) -> None:
-        if node.type == "command":
-            parts = []
-            for child in node.children:
-                if (
-                    child.type
-                    in {"command_name", "word", "string", "raw_string", "concatenation"}
-                    and child.text is not None
-                ):
-                    parts.append(child.text.decode("utf-8"))
-            if parts:
-                commands.append(" ".join(parts))
+@lru_cache(maxsize=512)
+def _extract_commands(command: str) -> tuple[str, ...]:
+    """Return the simple commands in ``command``, in source order.
 
-        for child in node.children:
-            find_commands(child)
+    Command nodes are collected by a compiled tree-sitter query rather than a
+    Python-level tree walk, and parts are sliced from the encoded source.
+    Results are cached because the same commands recur within a session.
+    """
+    source = command.encode("utf-8")
+    tree = _get_parser().parse(source)
+    nodes = QueryCursor(_get_command_query()).captures(tree.root_node)
 
-    find_commands(tree.root_node)
-    return commands
+    commands: list[str] = []
+    for node in sorted(nodes.get("command", ()), key=lambda n: n.start_byte):
+        parts = [
+            source[child.start_byte : child.end_byte].decode("utf-8")
+            for child in node.children
+            if child.type in _COMMAND_PART_TYPES
+        ]
+        if parts:
+            commands.append(" ".join(parts))
+    return tuple(commands)
 
 
+@lru_cache(maxsize=1)
 def _get_subprocess_encoding() -> str:
     if sys.platform == "win32":
         # Windows console uses OEM code page (e.g., cp850, cp1252)
@@ -71,27 +88,52 @@ def _get_shell_executable() -> str | None:
     return os.environ.get("SHELL")
 
 
-def _get_base_env() -> dict[str, str]:
-    base_env = {
-        **os.environ,
-        "CI": "true",
-        "NONINTERACTIVE": "1",
-        "NO_TTY": "1",
-        "NO_COLOR": "1",
-    }
+@lru_cache(maxsize=1)
+def _get_env_overrides() -> dict[str, str]:
+    overrides = {"CI": "true", "NONINTERACTIVE": "1", "NO_TTY": "1", "NO_COLOR": "1"}
 
     if is_windows():
-        base_env["GIT_PAGER"] = "more"
-        base_env["PAGER"] = "more"
+        overrides["GIT_PAGER"] = "more"
+        overrides["PAGER"] = "more"
     else:
-        base_env["TERM"] = "dumb"
-        base_env["DEBIAN_FRONTEND"] = "noninteractive"
-        base_env["GIT_PAGER"] = "cat"
-        base_env["PAGER"] = "cat"
-        base_env["LESS"] = "-FX"
-        base_env["LC_ALL"] = "en_US.UTF-8"
+        overrides["TERM"] = "dumb"
+        overrides["DEBIAN_FRONTEND"] = "noninteractive"
+        overrides["GIT_PAGER"] = "cat"
+        overrides["PAGER"] = "cat"
+        overrides["LESS"] = "-FX"
+        overrides["LC_ALL"] = "en_US.UTF-8"
+
+    return overrides
+
+
+def _get_base_env() -> dict[str, str]:
+    # os.environ is copied on every call on purpose: it can change at runtime
+    # (e.g. .env loading), and only the fixed overrides are safe to cache.
+    return {**os.environ, **_get_env_overrides()}
+
+
+# start_new_session is Unix-only, on Windows it's ignored
+_SESSION_KWARGS: dict[Literal["start_new_session"], bool] = (
+    {} if is_windows() else {"start_new_session": True}
+)
 
-    return base_env
+# Output is truncated to max_output_bytes *characters* after decoding. No
+# supported encoding needs more than this many bytes per character, so keeping
+# this multiple of the limit yields exactly the same truncated text.
+_MAX_BYTES_PER_CHAR = 4
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+async def _read_capped(stream: asyncio.StreamReader | None, limit: int) -> bytes:
+    """Drain ``stream`` to EOF, keeping only its first ``limit`` bytes."""
+    if stream is None:
+        return b""
+
+    buffer = bytearray()
+    while chunk := await stream.read(_READ_CHUNK_SIZE):
+        if (room := limit - len(buffer)) > 0:
+            buffer += chunk[:room]
+    return bytes(buffer)
 
 
 async def _kill_process_tree(proc: asyncio.subprocess.Process) -> None:
@@ -121,6 +163,21 @@ async def _kill_process_tree(proc: asyncio.subprocess.Process) -> None:
         pass
 
 
+def _is_standalone_denylisted(
+    command: str, denylist_standalone: frozenset[str]
+) -> bool:
+    """Whether ``command`` is a bare denylisted program run without arguments."""
+    parts = command.split()
+    if len(parts) != 1:
+        return False
+
+    base_command = parts[0]
+    return (
+        os.path.basename(base_command) in denylist_standalone
+        or base_command in denylist_standalone
+    )
+
+
 def _get_default_allowlist() -> list[str]:
     common = ["echo", "find", "git diff", "git log", "git status", "tree", "whoami"]
 
@@ -257,39 +314,22 @@ EXAMPLES:
         if not command_parts:
             return None
 
-        def is_denylisted(command: str) -> bool:
-            return any(command.startswith(pattern) for pattern in self.config.denylist)
-
-        def is_standalone_denylisted(command: str) -> bool:
-            parts = command.split()
-            if not parts:
-                return False
-
-            base_command = parts[0]
-            has_args = len(parts) > 1
-
-            if not has_args:
-                command_name = os.path.basename(base_command)
-                if command_name in self.config.denylist_standalone:
-                    return True
-                if base_command in self.config.denylist_standalone:
-                    return True
-
-            return False
-
-        def is_allowlisted(command: str) -> bool:
-            return any(command.startswith(pattern) for pattern in self.config.allowlist)
+        # str.startswith accepts a tuple and checks every prefix in C, so each
+        # part costs a single call however many patterns are configured.
+        denylist = tuple(self.config.denylist)
+        allowlist = tuple(self.config.allowlist)
+        denylist_standalone = frozenset(self.config.denylist_standalone)
 
+        all_allowlisted = True
         for part in command_parts:
-            if is_denylisted(part):
-                return ToolPermission.NEVER
-            if is_standalone_denylisted(part):
+            if part.startswith(denylist) or _is_standalone_denylisted(
+                part, denylist_standalone
+            ):
                 return ToolPermission.NEVER
+            if all_allowlisted and not part.startswith(allowlist):
+                all_allowlisted = False
 
-        if all(is_allowlisted(part) for part in command_parts):
-            return ToolPermission.ALWAYS
-
-        return None
+        return ToolPermission.ALWAYS if all_allowlisted else None
 
     @final
     def _build_timeout_error(self, command: str, timeout: int) -> ToolError:
@@ -320,11 +360,6 @@ EXAMPLES:
 
         proc = None
         try:
-            # start_new_session is Unix-only, on Windows it's ignored
-            kwargs: dict[Literal["start_new_session"], bool] = (
-                {} if is_windows() else {"start_new_session": True}
-            )
-
             proc = await asyncio.create_subprocess_shell(
                 args.command,
                 stdout=asyncio.subprocess.PIPE,
@@ -332,13 +367,17 @@ EXAMPLES:
                 stdin=asyncio.subprocess.DEVNULL,
                 env=_get_base_env(),
                 executable=_get_shell_executable(),
-                **kwargs,
+                **_SESSION_KWARGS,
             )
 
+            byte_limit = max_bytes * _MAX_BYTES_PER_CHAR
             try:
-                stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                    proc.communicate(), timeout=timeout
-                )
+                async with asyncio.timeout(timeout):
+                    stdout_bytes, stderr_bytes, _ = await asyncio.gather(
+                        _read_capped(proc.stdout, byte_limit),
+                        _read_capped(proc.stderr, byte_limit),
+                        proc.wait(),
+                    )
             except TimeoutError:
                 await _kill_process_tree(proc)
                 raise self._build_timeout_error(args.command, timeout)
@@ -369,5 +408,7 @@ EXAMPLES:
         except Exception as exc:
             raise ToolError(f"Error running command {args.command!r}: {exc}") from exc
         finally:
-            if proc is not None:
+            # On the normal path the child has already been reaped, so skip
+            # the cleanup coroutine (and taskkill on Windows) entirely.
+            if proc is not None and proc.returncode is None:
                 await _kill_process_tree(proc)
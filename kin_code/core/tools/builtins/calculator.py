@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from collections.abc import AsyncGenerator
+from functools import cached_property
 import math
+import re
 from typing import ClassVar
 
 from pydantic import BaseModel, Field
@@ -30,6 +32,43 @@ def _safe_pow(base: float, exp: float) -> float:
     return pow(base, exp)
 
 
+_FUNCTIONS = (
+    ("sin", math.sin),
+    ("cos", math.cos),
+    ("tan", math.tan),
+    ("sqrt", math.sqrt),
+    ("log", math.log),
+    ("log10", math.log10),
+    ("log2", math.log2),
+    ("exp", math.exp),
+    ("abs", abs),
+    ("pow", _safe_pow),
+    ("floor", math.floor),
+    ("ceil", math.ceil),
+    ("round", round),
+    ("min", min),
+    ("max", max),
+)
+_NAMES = (("pi", math.pi), ("e", math.e), ("tau", math.tau))
+
+# Numeric literals joined by + - * / only: nothing matching this can reference a
+# name, call a function or build an unbounded value, so it is safe to hand to
+# Python's own compiler instead of walking it with SimpleEval.
+_TRIVIAL_NUMERIC = re.compile(r"\s*-?\d+(?:\.\d+)?(?:\s*[+\-*/]\s*-?\d+(?:\.\d+)?)*\s*")
+
+
+def _eval_trivial(expression: str) -> float | int | None:
+    """Evaluate plain arithmetic on numeric literals, or return None."""
+    if not _TRIVIAL_NUMERIC.fullmatch(expression):
+        return None
+    try:
+        code = compile(expression.strip(), "<calculator>", "eval")
+    except SyntaxError:
+        # e.g. literals with leading zeros; SimpleEval reports these.
+        return None
+    return eval(code, {"__builtins__": {}})
+
+
 class CalculatorConfig(BaseToolConfig):
     """Configuration for the calculator tool."""
 
@@ -97,27 +136,12 @@ EXAMPLES:
     def get_status_text(cls) -> str:
         return "Calculating"
 
-    def _create_evaluator(self) -> SimpleEval:
-        """Create a configured SimpleEval instance with math functions and constants."""
+    @cached_property
+    def _evaluator(self) -> SimpleEval:
+        """Configured SimpleEval instance, built once and reused across calls."""
         evaluator = SimpleEval()
-        evaluator.functions.update({
-            "sin": math.sin,
-            "cos": math.cos,
-            "tan": math.tan,
-            "sqrt": math.sqrt,
-            "log": math.log,
-            "log10": math.log10,
-            "log2": math.log2,
-            "exp": math.exp,
-            "abs": abs,
-            "pow": _safe_pow,
-            "floor": math.floor,
-            "ceil": math.ceil,
-            "round": round,
-            "min": min,
-            "max": max,
-        })
-        evaluator.names.update({"pi": math.pi, "e": math.e, "tau": math.tau})
+        evaluator.functions.update(_FUNCTIONS)
+        evaluator.names.update(_NAMES)
         return evaluator
 
     async def run(
@@ -135,10 +159,10 @@ EXAMPLES:
         Raises:
             ToolError: If the expression is invalid or contains undefined names.
         """
-        evaluator = self._create_evaluator()
-
         try:
-            result = evaluator.eval(args.expression)
+            result = _eval_trivial(args.expression)
+            if result is None:
+                result = self._evaluator.eval(args.expression)
         except NameNotDefined as err:
             raise ToolError(f"Undefined name in expression: {err}") from err
         except InvalidExpression as err:
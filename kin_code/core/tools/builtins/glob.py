@@ -1,8 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+import asyncio
+from collections.abc import AsyncGenerator, Callable, Iterator
 import fnmatch
-from pathlib import Path
+import heapq
+import operator
+import os
+from pathlib import Path, PurePath
+import re
+import stat
 from typing import TYPE_CHECKING, ClassVar
 
 import pathspec
@@ -16,6 +22,8 @@ from kin_code.core.tools.base import (
     ToolError,
     ToolPermission,
 )
+from kin_code.core.tools.builtins._ignore import build_exclude_spec, exclude_matcher
+from kin_code.core.tools.builtins._scandir import ScanEntry, scan_directory
 from kin_code.core.tools.ui import ToolCallDisplay, ToolResultDisplay, ToolUIData
 from kin_code.core.types import ToolStreamEvent
 
@@ -23,6 +31,131 @@ if TYPE_CHECKING:
     from kin_code.core.types import ToolCallEvent, ToolResultEvent
 
 
+# Pattern components are matched the way pathlib matches them on this platform.
+_CASE_FLAGS = 0 if os.path.normcase("Aa") == "Aa" else re.IGNORECASE
+
+
+def _split_pattern(pattern: str) -> tuple[str, ...] | None:
+    """Split a relative glob pattern into components.
+
+    Returns None for patterns the directory walker does not handle (anchored
+    paths, ``..``, trailing separators, malformed ``**``); those go through
+    :meth:`pathlib.Path.glob` instead.
+    """
+    if pattern.endswith(("/", os.sep)):
+        return None
+    pure = PurePath(pattern)
+    if pure.anchor or not pure.parts:
+        return None
+    for part in pure.parts:
+        if part == ".." or ("**" in part and part != "**"):
+            return None
+    return pure.parts
+
+
+def _scan(directory: str) -> tuple[ScanEntry, ...]:
+    try:
+        return scan_directory(directory)
+    except OSError:
+        return ()
+
+
+def _iter_directories(
+    directory: str,
+    prefix: str,
+    entries: tuple[ScanEntry, ...],
+    prune: Callable[[str], bool],
+) -> Iterator[tuple[str, str, tuple[ScanEntry, ...]]]:
+    """Yield ``(path, relative prefix, entries)`` for a tree, without symlinks.
+
+    Directories come out in the same order as pathlib's ``**`` selector, and
+    each one is scanned only once. Directories whose prefix ``prune`` accepts
+    are skipped without being opened.
+    """
+    yield directory, prefix, entries
+    stack = [(prefix, entries)]
+    while stack:
+        parent_prefix, parent_entries = stack.pop()
+        children = []
+        for entry in parent_entries:
+            if entry.is_dir(follow_symlinks=False):
+                child_prefix = f"{parent_prefix}{entry.name}{os.sep}"
+                if prune(child_prefix):
+                    continue
+                child_entries = _scan(entry.path)
+                yield entry.path, child_prefix, child_entries
+                children.append((child_prefix, child_entries))
+        stack.extend(reversed(children))
+
+
+def _walk_matches(
+    base: str, parts: tuple[str, ...], prune: Callable[[str], bool]
+) -> Iterator[tuple[str, ScanEntry]]:
+    """Yield ``(relative path, entry)`` for regular files matching ``parts``.
+
+    File types come from the directory listing itself, so no extra ``stat``
+    call is made per candidate. Symlinked files are skipped
+    and ``**`` does not descend into symlinked directories, as with pathlib.
+    ``prune`` is called with each directory's relative prefix (ending in a
+    separator) before it is scanned; directories it accepts are not entered.
+    """
+    matchers = [
+        None if part == "**" else re.compile(fnmatch.translate(part), _CASE_FLAGS).match
+        for part in parts
+    ]
+    last = len(parts) - 1
+
+    def walk(
+        directory: str, prefix: str, entries: tuple[ScanEntry, ...], index: int
+    ) -> Iterator[tuple[str, ScanEntry]]:
+        match = matchers[index]
+        if match is None:
+            if index == last:
+                return
+            for sub_dir, sub_prefix, sub_entries in _iter_directories(
+                directory, prefix, entries, prune
+            ):
+                yield from walk(sub_dir, sub_prefix, sub_entries, index + 1)
+            return
+
+        for entry in entries:
+            if not match(entry.name):
+                continue
+            if index == last:
+                if entry.is_file(follow_symlinks=False):
+                    yield f"{prefix}{entry.name}", entry
+            elif _is_dir(entry):
+                sub_prefix = f"{prefix}{entry.name}{os.sep}"
+                if prune(sub_prefix):
+                    continue
+                yield from walk(entry.path, sub_prefix, _scan(entry.path), index + 1)
+
+    matches = walk(base, "", _scan(base), 0)
+    if parts.count("**") <= 1:
+        yield from matches
+        return
+
+    seen: set[str] = set()
+    for rel_str, entry in matches:
+        if rel_str not in seen:
+            seen.add(rel_str)
+            yield rel_str, entry
+
+
+def _is_dir(entry: ScanEntry) -> bool:
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _entry_mtime(entry: ScanEntry) -> float:
+    try:
+        return entry.stat(follow_symlinks=False).st_mtime
+    except OSError:
+        return 0.0
+
+
 class GlobToolConfig(BaseToolConfig):
     permission: ToolPermission = ToolPermission.ALWAYS
 
@@ -123,20 +256,18 @@ NOTES:
         base_path = self._resolve_path(args.path)
         exclude_spec = self._build_exclude_spec(base_path)
 
-        matching_files = self._find_matching_files(
-            base_path, args.pattern, exclude_spec
+        # The walk is blocking filesystem work; keep it off the event loop.
+        matching_files = await asyncio.to_thread(
+            self._find_matching_files, base_path, args.pattern, exclude_spec
         )
-        sorted_files = self._sort_by_mtime(matching_files)
+        result_files = self._most_recent(matching_files, self.config.max_results)
 
         self._update_state(args.pattern)
 
-        truncated = len(sorted_files) > self.config.max_results
-        result_files = sorted_files[: self.config.max_results]
-
-        relative_paths = [self._make_relative(f, base_path) for f in result_files]
-
         yield GlobResult(
-            files=relative_paths, truncated=truncated, total_matches=len(sorted_files)
+            files=result_files,
+            truncated=len(matching_files) > self.config.max_results,
+            total_matches=len(matching_files),
         )
 
     def _validate_args(self, args: GlobArgs) -> None:
@@ -156,43 +287,46 @@ NOTES:
         return path_obj
 
     def _build_exclude_spec(self, base_path: Path) -> pathspec.PathSpec:
-        patterns: list[str] = []
-
-        patterns.extend(self.config.exclude_patterns)
-
-        codeignore_path = base_path / self.config.codeignore_file
-        if codeignore_path.is_file():
-            patterns.extend(self._load_ignore_file(codeignore_path))
-
-        if self.config.respect_gitignore:
-            gitignore_path = base_path / ".gitignore"
-            if gitignore_path.is_file():
-                patterns.extend(self._load_ignore_file(gitignore_path))
-
-        return pathspec.PathSpec.from_lines("gitignore", patterns)
-
-    def _load_ignore_file(self, path: Path) -> list[str]:
-        patterns = []
-        try:
-            content = path.read_text("utf-8")
-            for line in content.splitlines():
-                line = line.strip()
-                if line and not line.startswith("#"):
-                    patterns.append(line)
-        except OSError:
-            pass
-        return patterns
+        return build_exclude_spec(
+            base_path,
+            self.config.exclude_patterns,
+            self.config.codeignore_file,
+            self.config.respect_gitignore,
+        )
 
     def _find_matching_files(
         self, base_path: Path, pattern: str, exclude_spec: pathspec.PathSpec
-    ) -> list[Path]:
+    ) -> list[tuple[str, float]]:
+        """Return ``(relative path, mtime)`` for every non-excluded match.
+
+        Excluded directories are pruned during the walk, so large trees such as
+        ``node_modules/`` are never listed. As with git, nothing inside an
+        excluded directory can be re-included.
+        """
+        parts = _split_pattern(pattern)
+        if parts is None:
+            return self._find_matching_files_pathlib(base_path, pattern, exclude_spec)
+
+        is_excluded = exclude_matcher(exclude_spec)
+        return [
+            (rel_str, _entry_mtime(entry))
+            for rel_str, entry in _walk_matches(str(base_path), parts, is_excluded)
+            if not is_excluded(rel_str)
+        ]
+
+    def _find_matching_files_pathlib(
+        self, base_path: Path, pattern: str, exclude_spec: pathspec.PathSpec
+    ) -> list[tuple[str, float]]:
         matching = []
+        is_excluded = exclude_matcher(exclude_spec)
 
         for file_path in base_path.glob(pattern):
-            if not file_path.is_file():
+            # One lstat answers "regular file, not a symlink" and gives mtime.
+            try:
+                st = file_path.lstat()
+            except OSError:
                 continue
-
-            if file_path.is_symlink():
+            if not stat.S_ISREG(st.st_mode):
                 continue
 
             try:
@@ -201,27 +335,23 @@ NOTES:
             except ValueError:
                 continue
 
-            if exclude_spec.match_file(rel_str):
+            if is_excluded(rel_str):
                 continue
 
-            matching.append(file_path)
+            matching.append((rel_str, st.st_mtime))
 
         return matching
 
-    def _sort_by_mtime(self, files: list[Path]) -> list[Path]:
-        def get_mtime(p: Path) -> float:
-            try:
-                return p.stat().st_mtime
-            except OSError:
-                return 0.0
-
-        return sorted(files, key=get_mtime, reverse=True)
+    def _most_recent(self, files: list[tuple[str, float]], limit: int) -> list[str]:
+        """Return the ``limit`` most recently modified paths, newest first.
 
-    def _make_relative(self, file_path: Path, base_path: Path) -> str:
-        try:
-            return str(file_path.relative_to(base_path))
-        except ValueError:
-            return str(file_path)
+        ``heapq.nlargest`` keeps only ``limit`` candidates instead of sorting
+        every match, and breaks ties in the same order as a stable sort.
+        """
+        return [
+            rel_str
+            for rel_str, _ in heapq.nlargest(limit, files, key=operator.itemgetter(1))
+        ]
 
     def _update_state(self, pattern: str) -> None:
         self.state.recent_patterns.append(pattern)
@@ -229,20 +359,7 @@ NOTES:
             self.state.recent_patterns.pop(0)
 
     def check_allowlist_denylist(self, args: GlobArgs) -> ToolPermission | None:
-        path_obj = Path(args.path).expanduser()
-        if not path_obj.is_absolute():
-            path_obj = Path.cwd() / path_obj
-        path_str = str(path_obj)
-
-        for pattern in self.config.denylist:
-            if fnmatch.fnmatch(path_str, pattern):
-                return ToolPermission.NEVER
-
-        for pattern in self.config.allowlist:
-            if fnmatch.fnmatch(path_str, pattern):
-                return ToolPermission.ALWAYS
-
-        return None
+        return self.check_path_allowlist_denylist(args.path)
 
     @classmethod
     def get_call_display(cls, event: ToolCallEvent) -> ToolCallDisplay:
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncGenerator
-from datetime import UTC, datetime
-import fnmatch
+import heapq
+import os
 from pathlib import Path
+import time
 from typing import TYPE_CHECKING, ClassVar, Literal
 
 import pathspec
@@ -17,6 +19,8 @@ from kin_code.core.tools.base import (
     ToolError,
     ToolPermission,
 )
+from kin_code.core.tools.builtins._ignore import build_exclude_spec, exclude_matcher
+from kin_code.core.tools.builtins._scandir import ScanEntry, scan_directory
 from kin_code.core.tools.ui import ToolCallDisplay, ToolResultDisplay, ToolUIData
 from kin_code.core.types import ToolStreamEvent
 
@@ -24,6 +28,29 @@ if TYPE_CHECKING:
     from kin_code.core.types import ToolCallEvent, ToolResultEvent
 
 
+def _format_mtime(timestamp: float) -> str:
+    """Format a timestamp as ISO 8601 UTC, to the second.
+
+    ``time.strftime`` over ``time.gmtime`` is several times cheaper than
+    building a ``datetime`` per entry on large recursive listings.
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(timestamp))
+
+
+type _Found = tuple[str, ScanEntry]
+
+
+def _sort_key(found: _Found) -> str:
+    return found[0].lower()
+
+
+def _is_dir(item: ScanEntry) -> bool:
+    try:
+        return item.is_dir()
+    except OSError:
+        return False
+
+
 class ListDirectoryConfig(BaseToolConfig):
     permission: ToolPermission = ToolPermission.ALWAYS
 
@@ -128,29 +155,31 @@ NOTES:
 
         effective_depth = min(args.max_depth, self.config.max_depth)
 
-        entries = self._collect_entries(
-            base_path,
-            base_path,
+        # The walk is blocking filesystem work; keep it off the event loop.
+        dirs, files = await asyncio.to_thread(
+            self._collect_entries,
+            str(base_path),
             args.recursive,
             effective_depth,
             args.include_hidden,
             exclude_spec,
         )
 
-        dirs = [e for e in entries if e.type == "directory"]
-        files = [e for e in entries if e.type in {"file", "symlink"}]
-
-        sorted_dirs = sorted(dirs, key=lambda e: e.name.lower())
-        sorted_files = sorted(files, key=lambda e: e.name.lower())
-        sorted_entries = sorted_dirs + sorted_files
-
-        truncated = len(sorted_entries) > self.config.max_entries
-        result_entries = sorted_entries[: self.config.max_entries]
+        # Only the entries that will be returned are stat'ed and turned into
+        # models; the rest are just counted.
+        limit = self.config.max_entries
+        selected = heapq.nsmallest(limit, dirs, key=_sort_key)
+        if len(selected) < limit:
+            selected += heapq.nsmallest(limit - len(selected), files, key=_sort_key)
 
         yield ListDirectoryResult(
             path=str(base_path),
-            entries=result_entries,
-            truncated=truncated,
+            entries=[
+                entry
+                for name, item in selected
+                if (entry := self._create_entry(item, name))
+            ],
+            truncated=len(dirs) + len(files) > limit,
             total_files=len(files),
             total_directories=len(dirs),
         )
@@ -168,93 +197,76 @@ NOTES:
         return path_obj
 
     def _build_exclude_spec(self, base_path: Path) -> pathspec.PathSpec:
-        patterns: list[str] = list(self.config.exclude_patterns)
-
-        codeignore_path = base_path / self.config.codeignore_file
-        if codeignore_path.is_file():
-            patterns.extend(self._load_ignore_file(codeignore_path))
-
-        if self.config.respect_gitignore:
-            gitignore_path = base_path / ".gitignore"
-            if gitignore_path.is_file():
-                patterns.extend(self._load_ignore_file(gitignore_path))
-
-        return pathspec.PathSpec.from_lines("gitignore", patterns)
-
-    def _load_ignore_file(self, path: Path) -> list[str]:
-        patterns = []
-        try:
-            content = path.read_text("utf-8")
-            for line in content.splitlines():
-                line = line.strip()
-                if line and not line.startswith("#"):
-                    patterns.append(line)
-        except OSError:
-            pass
-        return patterns
+        return build_exclude_spec(
+            base_path,
+            self.config.exclude_patterns,
+            self.config.codeignore_file,
+            self.config.respect_gitignore,
+        )
 
     def _collect_entries(
         self,
-        current_path: Path,
-        base_path: Path,
+        base_path: str,
         recursive: bool,
         depth: int,
         include_hidden: bool,
         exclude_spec: pathspec.PathSpec | None,
-    ) -> list[DirectoryEntry]:
-        entries: list[DirectoryEntry] = []
-
-        if depth <= 0:
-            return entries
-
-        try:
-            items = sorted(current_path.iterdir(), key=lambda p: p.name.lower())
-        except PermissionError:
-            return entries
-
-        for item in items:
-            if not include_hidden and item.name.startswith("."):
+    ) -> tuple[list[_Found], list[_Found]]:
+        """Collect directories and other entries up to ``depth`` levels deep.
+
+        The tree is walked depth-first with an explicit stack; relative names
+        are built by string concatenation and excluded directories are
+        skipped before they are opened. Symlinks, including ones pointing at
+        directories, are returned with the files.
+        """
+        is_excluded = exclude_matcher(exclude_spec) if exclude_spec else None
+        dirs: list[_Found] = []
+        files: list[_Found] = []
+        stack: list[tuple[str, str, int]] = [(base_path, "", depth)]
+
+        while stack:
+            current_path, prefix, remaining = stack.pop()
+            if remaining <= 0:
                 continue
 
+            # No per-directory sort: run() orders the whole result by name.
             try:
-                rel_path = item.relative_to(base_path)
-                rel_str = str(rel_path)
-            except ValueError:
+                items = scan_directory(current_path)
+            except OSError:
                 continue
 
-            if exclude_spec and exclude_spec.match_file(
-                rel_str + "/" if item.is_dir() else rel_str
-            ):
-                continue
+            subdirs: list[tuple[str, str, int]] = []
+            for item in items:
+                if not include_hidden and item.name.startswith("."):
+                    continue
 
-            entry = self._create_entry(item, base_path)
-            if entry:
-                entries.append(entry)
+                rel_str = prefix + item.name
+                is_dir = _is_dir(item)
+                if is_excluded and is_excluded(rel_str + os.sep if is_dir else rel_str):
+                    continue
 
-            if recursive and item.is_dir() and not item.is_symlink():
-                sub_entries = self._collect_entries(
-                    item, base_path, True, depth - 1, include_hidden, exclude_spec
-                )
-                entries.extend(sub_entries)
+                if not is_dir or item.is_symlink():
+                    files.append((rel_str, item))
+                    continue
 
-        return entries
+                dirs.append((rel_str, item))
+                if recursive:
+                    subdirs.append((item.path, rel_str + os.sep, remaining - 1))
 
-    def _create_entry(self, path: Path, base_path: Path) -> DirectoryEntry | None:
-        try:
-            rel_path = path.relative_to(base_path)
-            name = str(rel_path)
-        except ValueError:
-            name = path.name
+            stack.extend(reversed(subdirs))
+
+        return dirs, files
 
+    def _create_entry(self, item: ScanEntry, name: str) -> DirectoryEntry | None:
         try:
-            stat = path.lstat()
+            stat = item.stat(follow_symlinks=False)
         except OSError:
             return None
 
-        if path.is_symlink():
+        if item.is_symlink():
             entry_type: Literal["file", "directory", "symlink"] = "symlink"
             size = None
-        elif path.is_dir():
+        elif item.is_dir(follow_symlinks=False):
             entry_type = "directory"
             size = None
         else:
@@ -262,29 +274,19 @@ NOTES:
             size = stat.st_size
 
         try:
-            mtime = datetime.fromtimestamp(stat.st_mtime, tz=UTC).isoformat()
-        except (OSError, ValueError):
+            mtime = _format_mtime(stat.st_mtime)
+        except (OSError, OverflowError, ValueError):
             mtime = None
 
-        return DirectoryEntry(name=name, type=entry_type, size=size, modified=mtime)
+        # Every field is built above with the right type, so skip validation.
+        return DirectoryEntry.model_construct(
+            name=name, type=entry_type, size=size, modified=mtime
+        )
 
     def check_allowlist_denylist(
         self, args: ListDirectoryArgs
     ) -> ToolPermission | None:
-        path_obj = Path(args.path).expanduser()
-        if not path_obj.is_absolute():
-            path_obj = Path.cwd() / path_obj
-        path_str = str(path_obj)
-
-        for pattern in self.config.denylist:
-            if fnmatch.fnmatch(path_str, pattern):
-                return ToolPermission.NEVER
-
-        for pattern in self.config.allowlist:
-            if fnmatch.fnmatch(path_str, pattern):
-                return ToolPermission.ALWAYS
-
-        return None
+        return self.check_path_allowlist_denylist(args.path)
 
     @classmethod
     def get_call_display(cls, event: ToolCallEvent) -> ToolCallDisplay:
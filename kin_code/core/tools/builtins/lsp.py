@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import suppress
 from dataclasses import dataclass, field
 from enum import StrEnum, auto
+from functools import lru_cache
 import json
 from pathlib import Path
 import shutil
 from typing import TYPE_CHECKING, Any, ClassVar
+from urllib.request import url2pathname
+from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
@@ -43,14 +47,64 @@ class LSPServerConfig:
     languages: list[str] = field(default_factory=list)
 
 
+# Requests whose result depends only on their params and the document, so
+# concurrent duplicates can share one round trip.
+COALESCED_METHODS = frozenset({
+    "textDocument/definition",
+    "textDocument/documentSymbol",
+    "textDocument/hover",
+    "textDocument/implementation",
+    "textDocument/references",
+})
+MAX_IN_FLIGHT = 32
+# Server requests that only need an empty success reply.
+_ACKNOWLEDGED_REQUESTS = frozenset({
+    "client/registerCapability",
+    "client/unregisterCapability",
+    "window/workDoneProgress/create",
+})
+
+
 @dataclass
 class LSPServerProcess:
     process: asyncio.subprocess.Process
     request_id: int = 0
     initialized: bool = False
-
-
-@dataclass
+    # Header and body chunks of notifications waiting for the next write.
+    outbox: list[bytes] = field(default_factory=list)
+    # Requests awaiting a response, resolved by the reader task.
+    pending: dict[int, asyncio.Future[dict[str, Any]]] = field(default_factory=dict)
+    reader_task: asyncio.Task[None] | None = None
+    # Coalesced read-only requests in flight, by (method, params, doc version).
+    inflight: dict[tuple[str, bytes, int], asyncio.Future[Any]] = field(
+        default_factory=dict
+    )
+    # Caps the requests outstanding at the server at once.
+    slots: asyncio.Semaphore = field(
+        default_factory=lambda: asyncio.Semaphore(MAX_IN_FLIGHT)
+    )
+    # Listeners for $/progress notifications, by work-done token.
+    progress: dict[str, asyncio.Queue[dict[str, Any] | None]] = field(
+        default_factory=dict
+    )
+    # Workspace roots the server was initialized with or has been sent.
+    roots: set[Path] = field(default_factory=set)
+    # Whether the server accepts workspace/didChangeWorkspaceFolders.
+    workspace_folders: bool = False
+    # Documents the server has open, by URI: (version, st_mtime_ns, st_size).
+    opened: dict[str, tuple[int, int, int]] = field(default_factory=dict)
+    # Serializes syncing each document, since the file is read off the loop.
+    document_locks: dict[str, asyncio.Lock] = field(default_factory=dict)
+
+    @property
+    def alive(self) -> bool:
+        """Whether the process runs and its reader still answers requests."""
+        if self.process.returncode is not None:
+            return False
+        return self.reader_task is None or not self.reader_task.done()
+
+
+@dataclass(frozen=True, slots=True)
 class _OperationContext:
     server: LSPServerProcess
     args: LSPArgs
@@ -58,6 +112,215 @@ class _OperationContext:
     position: dict[str, int]
     text_document: dict[str, str]
     text_document_position: dict[str, Any]
+    # {"workDoneToken": ...} for requests that report progress, else empty.
+    work_done: dict[str, str]
+
+
+# StreamReader buffer size for server stdout. The reader stops pulling from the
+# pipe once twice this much is buffered, so the 64 KiB default would pause and
+# resume many times for one large symbol response.
+_STREAM_LIMIT = 8 * 1024 * 1024
+
+
+def _dumps(message: dict[str, Any]) -> bytes:
+    return json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _frame(message: dict[str, Any]) -> tuple[bytes, bytes]:
+    """Return the header and body of a message, left apart to avoid a copy."""
+    content = _dumps(message)
+    return b"Content-Length: %d\r\n\r\n" % len(content), content
+
+
+def _handle_server_message(server: LSPServerProcess, message: dict[str, Any]) -> None:
+    if "id" in message:
+        _reply(server, message)
+    elif message["method"] == "$/progress":
+        params = message.get("params", {})
+        if (queue := server.progress.get(params.get("token"))) is not None:
+            queue.put_nowait(params.get("value", {}))
+
+
+def _reply(server: LSPServerProcess, request: dict[str, Any]) -> None:
+    """Answer a server-initiated request so the server never waits on us."""
+    method = request["method"]
+    response: dict[str, Any] = {"jsonrpc": "2.0", "id": request["id"]}
+    if method == "workspace/configuration":
+        response["result"] = [None] * len(request.get("params", {}).get("items", []))
+    elif method == "workspace/workspaceFolders":
+        response["result"] = [_workspace_folder(root) for root in server.roots]
+    elif method in _ACKNOWLEDGED_REQUESTS:
+        response["result"] = None
+    else:
+        response["error"] = {"code": -32601, "message": f"Unhandled: {method}"}
+
+    if server.process.stdin is not None:
+        server.process.stdin.writelines(_frame(response))
+
+
+def _progress_message(value: dict[str, Any]) -> str | None:
+    """Render a work-done progress update, or None if it says nothing new."""
+    if value.get("kind") == "end":
+        return None
+    parts = [part for key in ("title", "message") if (part := value.get(key))]
+    if (percentage := value.get("percentage")) is not None:
+        parts.append(f"{percentage}%")
+    return " ".join(parts) or None
+
+
+async def _read_messages(server: LSPServerProcess) -> None:
+    """Read every message from the server and resolve the matching request.
+
+    Runs for the lifetime of the server, so each frame is parsed exactly once
+    and any number of requests can be in flight. Messages that carry a
+    ``method`` are server-initiated: requests get a minimal reply, progress is
+    routed to its listener, and other notifications are dropped.
+    """
+    stdout = server.process.stdout
+    assert stdout is not None
+
+    try:
+        while True:
+            # Headers are ASCII lines ending at a blank line. Only the length
+            # matters, and int() parses it straight from the bytes.
+            content_length = None
+            while (line := await stdout.readuntil(b"\r\n")) != b"\r\n":
+                if line.startswith(b"Content-Length:"):
+                    content_length = int(line[15:])
+            if content_length is None:
+                continue
+
+            body = await stdout.readexactly(content_length)
+            try:
+                message = json.loads(body)
+            except ValueError:
+                # One undecodable frame; the stream itself is still in sync.
+                continue
+            if "method" in message:
+                _handle_server_message(server, message)
+                continue
+            future = server.pending.pop(message.get("id"), None)
+            if future is not None and not future.done():
+                future.set_result(message)
+    except (
+        asyncio.IncompleteReadError,
+        asyncio.LimitOverrunError,
+        ValueError,
+        OSError,
+    ):
+        pass
+    finally:
+        # Nothing reads the stream any more, so the server is of no further
+        # use; stop it rather than leave later requests waiting on it.
+        if server.process.returncode is None:
+            with suppress(ProcessLookupError):
+                server.process.kill()
+        for future in server.pending.values():
+            if not future.done():
+                future.set_exception(ToolError("LSP server closed connection"))
+        server.pending.clear()
+
+
+# LSP SymbolKind names, indexed by their numeric value (1-26).
+SYMBOL_KINDS: tuple[str, ...] = (
+    "unknown",
+    "file",
+    "module",
+    "namespace",
+    "package",
+    "class",
+    "method",
+    "property",
+    "field",
+    "constructor",
+    "enum",
+    "interface",
+    "function",
+    "variable",
+    "constant",
+    "string",
+    "number",
+    "boolean",
+    "array",
+    "object",
+    "key",
+    "null",
+    "enum_member",
+    "struct",
+    "event",
+    "operator",
+    "type_parameter",
+)
+
+
+# Files that mark the root of a project, and the language they imply if any.
+PROJECT_MARKERS: dict[str, str | None] = {
+    "pyproject.toml": "python",
+    "setup.py": "python",
+    "setup.cfg": "python",
+    "pyrightconfig.json": "python",
+    "tsconfig.json": "typescript",
+    "jsconfig.json": "typescript",
+    "package.json": "typescript",
+    ".git": None,
+}
+
+
+@lru_cache(maxsize=1024)
+def _find_workspace_root(directory: Path) -> Path:
+    """Return ``directory`` or its nearest ancestor that looks like a project root.
+
+    Falls back to ``directory`` itself, so loose files still get a server.
+    Cached per directory: the answer picks the server a request goes to, and
+    stat'ing every marker in every ancestor on each call adds up.
+    """
+    for candidate in (directory, *directory.parents):
+        if any((candidate / marker).exists() for marker in PROJECT_MARKERS):
+            return candidate
+    return directory
+
+
+def _detect_project_languages(root: Path) -> list[str]:
+    languages: list[str] = []
+    for marker, language in PROJECT_MARKERS.items():
+        if language and language not in languages and (root / marker).exists():
+            languages.append(language)
+    return languages
+
+
+@lru_cache(maxsize=4096)
+def _uri_to_path(uri: str) -> str:
+    """Convert a ``file://`` URI from the server to a local path.
+
+    Percent-escapes are decoded and, on Windows, ``/C:/x`` becomes ``C:\\x``.
+    The same URIs repeat across the items of one response, hence the cache.
+    """
+    if not uri.startswith("file://"):
+        return uri
+    return url2pathname(uri[7:])
+
+
+_which_cache: dict[str, str] = {}
+
+
+def _which(command: str) -> str | None:
+    """``shutil.which`` that remembers hits, so respawns skip the PATH walk.
+
+    Misses are not cached: a server installed mid-session is found next time.
+    """
+    if (path := _which_cache.get(command)) is None:
+        if (path := shutil.which(command)) is not None:
+            _which_cache[command] = path
+    return path
+
+
+def _workspace_folder(root: Path) -> dict[str, str]:
+    return {"uri": root.as_uri(), "name": root.name}
+
+
+def _discard_result(future: asyncio.Future[Any]) -> None:
+    if not future.cancelled():
+        future.exception()
 
 
 LANGUAGE_SERVERS: dict[str, LSPServerConfig] = {
@@ -86,6 +349,10 @@ class LSPToolConfig(BaseToolConfig):
     timeout: int = Field(default=30, description="Timeout for LSP requests in seconds.")
     max_references: int = Field(default=50, description="Maximum references to return.")
     max_symbols: int = Field(default=100, description="Maximum symbols to return.")
+    prewarm: bool = Field(
+        default=False,
+        description="Start language servers for the working directory at startup.",
+    )
 
 
 class LSPState(BaseToolState):
@@ -173,9 +440,43 @@ NOTES:
 - Requires language server to be installed (pyright for Python)
 - Line and character numbers are 1-based
 - Supports Python and TypeScript/JavaScript
-- Server is started lazily on first use"""
+- Servers start lazily on first use and serve every project root they can"""
+
+    _servers: ClassVar[dict[tuple[str, Path], LSPServerProcess]] = {}
+    _server_locks: ClassVar[dict[str, asyncio.Lock]] = {}
+    # asyncio only keeps weak references to tasks, so prewarm holds them here.
+    _prewarm_tasks: ClassVar[set[asyncio.Task[LSPServerProcess]]] = set()
+    # Filled in below the class body, once the handlers exist.
+    _HANDLERS: ClassVar[
+        dict[LSPOperation, Callable[[LSP, _OperationContext], Awaitable[LSPResult]]]
+    ]
+
+    @classmethod
+    def prewarm(
+        cls, roots: list[Path], config: LSPToolConfig | None = None
+    ) -> list[asyncio.Task[LSPServerProcess]]:
+        """Start servers for the languages found in ``roots`` in the background.
+
+        The first request then skips the server's start-up and indexing time.
+        Does nothing outside a running event loop. Failures are left on the
+        returned tasks; the next request for that root simply retries.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return []
 
-    _servers: ClassVar[dict[str, LSPServerProcess]] = {}
+        tool = cls(config=config or LSPToolConfig(), state=LSPState())
+        tasks = []
+        for root in {_find_workspace_root(root) for root in roots}:
+            for language in _detect_project_languages(root):
+                if _which(LANGUAGE_SERVERS[language].command[0]):
+                    task = loop.create_task(tool._ensure_server(language, root))
+                    LSP._prewarm_tasks.add(task)
+                    task.add_done_callback(LSP._prewarm_tasks.discard)
+                    task.add_done_callback(_discard_result)
+                    tasks.append(task)
+        return tasks
 
     async def run(
         self, args: LSPArgs, ctx: InvokeContext | None = None
@@ -188,10 +489,35 @@ NOTES:
                 f"No LSP server configured for file type: {file_path.suffix}"
             )
 
-        server = await self._ensure_server(language, file_path.parent)
+        server = await self._ensure_server(
+            language, _find_workspace_root(file_path.parent)
+        )
 
-        result = await self._execute_operation(server, args, file_path, language)
-        yield result
+        if ctx is None:
+            yield await self._execute_operation(server, args, file_path, language)
+            return
+
+        # Relay the server's progress reports while the operation runs; the
+        # operation finishing puts None on the queue to end the loop.
+        token = f"kin-code/{uuid4().hex}"
+        queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+        server.progress[token] = queue
+        operation = asyncio.create_task(
+            self._execute_operation(server, args, file_path, language, token)
+        )
+        operation.add_done_callback(lambda _: queue.put_nowait(None))
+        try:
+            while (value := await queue.get()) is not None:
+                if message := _progress_message(value):
+                    yield ToolStreamEvent(
+                        tool_name=self.get_name(),
+                        message=message,
+                        tool_call_id=ctx.tool_call_id,
+                    )
+            yield operation.result()
+        finally:
+            server.progress.pop(token, None)
+            operation.cancel()
 
     def _resolve_path(self, path: str) -> Path:
         path_obj = Path(path).expanduser()
@@ -212,37 +538,80 @@ NOTES:
     async def _ensure_server(
         self, language: str, workspace_root: Path
     ) -> LSPServerProcess:
-        if language in LSP._servers:
-            server = LSP._servers[language]
-            if server.process.returncode is None:
+        key = (language, workspace_root)
+        server = LSP._servers.get(key)
+        if server is not None and server.alive:
+            return server
+
+        # Concurrent first requests share a single spawn, and a second workspace
+        # waits for the first so it can be added to the same server.
+        lock = LSP._server_locks.setdefault(language, asyncio.Lock())
+        async with lock:
+            for pool_key, pooled in list(LSP._servers.items()):
+                if not pooled.alive:
+                    del LSP._servers[pool_key]
+
+            if (server := LSP._servers.get(key)) is not None:
                 return server
-            del LSP._servers[language]
 
+            for (pool_language, _), pooled in LSP._servers.items():
+                if pool_language == language and pooled.workspace_folders:
+                    await self._add_workspace_folder(pooled, workspace_root)
+                    LSP._servers[key] = pooled
+                    return pooled
+
+            return await self._start_server(language, workspace_root)
+
+    async def _add_workspace_folder(
+        self, server: LSPServerProcess, workspace_root: Path
+    ) -> None:
+        """Add a root to a running multi-root server instead of spawning another."""
+        event = {"added": [_workspace_folder(workspace_root)], "removed": []}
+        await self._send_notification(
+            server, "workspace/didChangeWorkspaceFolders", {"event": event}
+        )
+        server.roots.add(workspace_root)
+
+    async def _start_server(
+        self, language: str, workspace_root: Path
+    ) -> LSPServerProcess:
         server_config = LANGUAGE_SERVERS.get(language)
         if server_config is None:
             raise ToolError(f"No LSP server configured for language: {language}")
 
         command = server_config.command
-        if not shutil.which(command[0]):
+        if (executable := _which(command[0])) is None:
             raise ToolError(
                 f"LSP server not found: {command[0]}. "
                 f"Install it with: pip install pyright (for Python) "
                 f"or npm install -g typescript-language-server (for TypeScript)"
             )
 
-        process = await asyncio.create_subprocess_exec(
-            *command,
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=str(workspace_root),
-        )
+        try:
+            process = await asyncio.create_subprocess_exec(
+                executable,
+                *command[1:],
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                cwd=str(workspace_root),
+                limit=_STREAM_LIMIT,
+            )
+        except FileNotFoundError:
+            # Uninstalled since it was looked up; look again next time.
+            _which_cache.pop(command[0], None)
+            raise ToolError(f"LSP server not found: {command[0]}")
 
         server = LSPServerProcess(process=process)
-        LSP._servers[language] = server
-
-        await self._initialize_server(server, workspace_root)
+        server.reader_task = asyncio.create_task(_read_messages(server))
+        try:
+            await self._initialize_server(server, workspace_root)
+        except BaseException:
+            if process.returncode is None:
+                process.kill()
+            raise
 
+        LSP._servers[(language, workspace_root)] = server
         return server
 
     async def _initialize_server(
@@ -252,6 +621,7 @@ NOTES:
             "processId": None,
             "rootUri": workspace_root.as_uri(),
             "rootPath": str(workspace_root),
+            "workspaceFolders": [_workspace_folder(workspace_root)],
             "capabilities": {
                 "textDocument": {
                     "hover": {"contentFormat": ["markdown", "plaintext"]},
@@ -260,16 +630,61 @@ NOTES:
                     "documentSymbol": {"hierarchicalDocumentSymbolSupport": True},
                     "callHierarchy": {},
                 },
-                "workspace": {"symbol": {"symbolKind": {}}},
+                "workspace": {
+                    "symbol": {"symbolKind": {}},
+                    "workspaceFolders": True,
+                    "configuration": True,
+                },
+                "window": {"workDoneProgress": True},
             },
         }
 
-        await self._send_request(server, "initialize", init_params)
-        await self._send_notification(server, "initialized", {})
+        result = await self._send_request(server, "initialize", init_params)
+        self._queue_notification(server, "initialized", {})
+        # Multi-root servers such as pyright only load workspace settings once
+        # the client reports them, and hold requests back until then.
+        await self._send_notification(
+            server, "workspace/didChangeConfiguration", {"settings": {}}
+        )
         server.initialized = True
+        server.roots.add(workspace_root)
+
+        capabilities = (result or {}).get("capabilities", {})
+        folders = capabilities.get("workspace", {}).get("workspaceFolders", {})
+        server.workspace_folders = bool(
+            folders.get("supported") and folders.get("changeNotifications")
+        )
 
     async def _send_request(
         self, server: LSPServerProcess, method: str, params: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Send a request and return its result.
+
+        Identical read-only queries against the same document version share
+        one request while it is in flight.
+        """
+        if method not in COALESCED_METHODS:
+            return await self._request(server, method, params)
+
+        uri = params.get("textDocument", {}).get("uri")
+        version = server.opened.get(uri, (0,))[0] if uri else 0
+        # The progress token is unique per call and does not change the answer.
+        query = {k: v for k, v in params.items() if k != "workDoneToken"}
+        key = (method, _dumps(query), version)
+        if (shared := server.inflight.get(key)) is None:
+            shared = asyncio.ensure_future(self._request(server, method, params))
+            server.inflight[key] = shared
+
+            def release(task: asyncio.Future[Any]) -> None:
+                server.inflight.pop(key, None)
+                _discard_result(task)
+
+            shared.add_done_callback(release)
+        # Shielded so one caller giving up does not cancel the others.
+        return await asyncio.shield(shared)
+
+    async def _request(
+        self, server: LSPServerProcess, method: str, params: dict[str, Any]
     ) -> dict[str, Any]:
         server.request_id += 1
         request_id = server.request_id
@@ -280,85 +695,63 @@ NOTES:
             "method": method,
             "params": params,
         }
+        future = asyncio.get_running_loop().create_future()
+        server.pending[request_id] = future
+        try:
+            async with asyncio.timeout(self.config.timeout), server.slots:
+                await self._write(server, *_frame(message))
+                response = await future
+        except TimeoutError:
+            raise ToolError(f"LSP request timed out after {self.config.timeout}s")
+        finally:
+            server.pending.pop(request_id, None)
 
-        content = json.dumps(message)
-        header = f"Content-Length: {len(content)}\r\n\r\n"
-
-        if server.process.stdin is None:
-            raise ToolError("LSP server stdin not available")
-
-        server.process.stdin.write((header + content).encode())
-        await server.process.stdin.drain()
+        if "error" in response:
+            error = response["error"]
+            raise ToolError(f"LSP error: {error.get('message', 'Unknown error')}")
 
-        response = await self._read_response(server, request_id)
-        return response
+        return response.get("result", {})
 
     async def _send_notification(
         self, server: LSPServerProcess, method: str, params: dict[str, Any]
     ) -> None:
-        message = {"jsonrpc": "2.0", "method": method, "params": params}
+        self._queue_notification(server, method, params)
+        await self._write(server)
+
+    def _queue_notification(
+        self, server: LSPServerProcess, method: str, params: dict[str, Any]
+    ) -> None:
+        """Queue a notification to be sent with the next message.
 
-        content = json.dumps(message)
-        header = f"Content-Length: {len(content)}\r\n\r\n"
+        Notifications need no reply, so this lets them share a single write and
+        drain with the request that follows.
+        """
+        message = {"jsonrpc": "2.0", "method": method, "params": params}
+        server.outbox.extend(_frame(message))
 
+    async def _write(self, server: LSPServerProcess, *chunks: bytes) -> None:
         if server.process.stdin is None:
             raise ToolError("LSP server stdin not available")
 
-        server.process.stdin.write((header + content).encode())
+        # One writelines call lets the transport join everything with a single
+        # copy, or hand the chunks to writev where it supports that.
+        data = [*server.outbox, *chunks]
+        server.outbox.clear()
+        server.process.stdin.writelines(data)
         await server.process.stdin.drain()
 
-    async def _read_response(
-        self, server: LSPServerProcess, expected_id: int
-    ) -> dict[str, Any]:
-        if server.process.stdout is None:
-            raise ToolError("LSP server stdout not available")
-
-        try:
-            return await self._read_response_loop(server, expected_id)
-        except TimeoutError:
-            raise ToolError(f"LSP request timed out after {self.config.timeout}s")
-
-    async def _read_response_loop(
-        self, server: LSPServerProcess, expected_id: int
-    ) -> dict[str, Any]:
-        stdout = server.process.stdout
-        assert stdout is not None
-
-        while True:
-            header_line = await asyncio.wait_for(
-                stdout.readline(), timeout=self.config.timeout
-            )
-            if not header_line:
-                raise ToolError("LSP server closed connection")
-
-            header = header_line.decode().strip()
-            if not header.startswith("Content-Length:"):
-                continue
-
-            content_length = int(header.split(":")[1].strip())
-            await stdout.readline()
-
-            content = await asyncio.wait_for(
-                stdout.read(content_length), timeout=self.config.timeout
-            )
-            response = json.loads(content.decode())
-
-            if response.get("id") != expected_id:
-                continue
-
-            if "error" in response:
-                error = response["error"]
-                raise ToolError(f"LSP error: {error.get('message', 'Unknown error')}")
-
-            return response.get("result", {})
-
     async def _execute_operation(
-        self, server: LSPServerProcess, args: LSPArgs, file_path: Path, language: str
+        self,
+        server: LSPServerProcess,
+        args: LSPArgs,
+        file_path: Path,
+        language: str,
+        progress_token: str | None = None,
     ) -> LSPResult:
-        await self._open_document(server, file_path, language)
+        uri = await self._open_document(server, file_path, language)
 
         position = {"line": args.line - 1, "character": args.character - 1}
-        text_document = {"uri": file_path.as_uri()}
+        text_document = {"uri": uri}
         text_document_position = {"textDocument": text_document, "position": position}
 
         ctx = _OperationContext(
@@ -368,40 +761,34 @@ NOTES:
             position=position,
             text_document=text_document,
             text_document_position=text_document_position,
+            work_done={"workDoneToken": progress_token} if progress_token else {},
         )
 
-        handlers = {
-            LSPOperation.GO_TO_DEFINITION: self._op_go_to_definition,
-            LSPOperation.FIND_REFERENCES: self._op_find_references,
-            LSPOperation.HOVER: self._op_hover,
-            LSPOperation.DOCUMENT_SYMBOL: self._op_document_symbol,
-            LSPOperation.WORKSPACE_SYMBOL: self._op_workspace_symbol,
-            LSPOperation.GO_TO_IMPLEMENTATION: self._op_go_to_implementation,
-            LSPOperation.INCOMING_CALLS: self._op_incoming_calls,
-            LSPOperation.OUTGOING_CALLS: self._op_outgoing_calls,
-        }
-
-        handler = handlers[args.operation]
-        return await handler(ctx)
+        handler = LSP._HANDLERS[args.operation]
+        return await handler(self, ctx)
 
     async def _op_go_to_definition(self, ctx: _OperationContext) -> LSPResult:
         response = await self._send_request(
             ctx.server, "textDocument/definition", ctx.text_document_position
         )
         locations = self._parse_locations(response)
-        return LSPResult(
+        return LSPResult.model_construct(
             operation=ctx.args.operation,
             locations=locations,
             message=f"Found {len(locations)} definition(s)",
         )
 
     async def _op_find_references(self, ctx: _OperationContext) -> LSPResult:
-        params = {**ctx.text_document_position, "context": {"includeDeclaration": True}}
+        params = {
+            **ctx.text_document_position,
+            **ctx.work_done,
+            "context": {"includeDeclaration": True},
+        }
         response = await self._send_request(
             ctx.server, "textDocument/references", params
         )
         locations = self._parse_locations(response)[: self.config.max_references]
-        return LSPResult(
+        return LSPResult.model_construct(
             operation=ctx.args.operation,
             locations=locations,
             message=f"Found {len(locations)} reference(s)",
@@ -412,7 +799,7 @@ NOTES:
             ctx.server, "textDocument/hover", ctx.text_document_position
         )
         hover_content = self._parse_hover(response)
-        return LSPResult(
+        return LSPResult.model_construct(
             operation=ctx.args.operation,
             hover_content=hover_content,
             message="Hover information retrieved"
@@ -429,7 +816,7 @@ NOTES:
         symbols = self._parse_symbols(response, ctx.file_path)[
             : self.config.max_symbols
         ]
-        return LSPResult(
+        return LSPResult.model_construct(
             operation=ctx.args.operation,
             symbols=symbols,
             message=f"Found {len(symbols)} symbol(s)",
@@ -438,10 +825,10 @@ NOTES:
     async def _op_workspace_symbol(self, ctx: _OperationContext) -> LSPResult:
         query = ctx.args.query or ""
         response = await self._send_request(
-            ctx.server, "workspace/symbol", {"query": query}
+            ctx.server, "workspace/symbol", {"query": query, **ctx.work_done}
         )
         symbols = self._parse_workspace_symbols(response)[: self.config.max_symbols]
-        return LSPResult(
+        return LSPResult.model_construct(
             operation=ctx.args.operation,
             symbols=symbols,
             message=f"Found {len(symbols)} symbol(s)",
@@ -452,7 +839,7 @@ NOTES:
             ctx.server, "textDocument/implementation", ctx.text_document_position
         )
         locations = self._parse_locations(response)
-        return LSPResult(
+        return LSPResult.model_construct(
             operation=ctx.args.operation,
             locations=locations,
             message=f"Found {len(locations)} implementation(s)",
@@ -463,21 +850,28 @@ NOTES:
             ctx.server, "textDocument/prepareCallHierarchy", ctx.text_document_position
         )
         if not prep_response:
-            return LSPResult(
+            return LSPResult.model_construct(
                 operation=ctx.args.operation,
                 call_items=[],
                 message="No call hierarchy item at position",
             )
 
         items = prep_response if isinstance(prep_response, list) else [prep_response]
-        all_calls: list[CallItem] = []
-        for item in items:
-            calls_response = await self._send_request(
-                ctx.server, "callHierarchy/incomingCalls", {"item": item}
+        responses = await asyncio.gather(
+            *(
+                self._send_request(
+                    ctx.server, "callHierarchy/incomingCalls", {"item": item}
+                )
+                for item in items
             )
-            all_calls.extend(self._parse_incoming_calls(calls_response))
+        )
+        all_calls = [
+            call
+            for response in responses
+            for call in self._parse_incoming_calls(response)
+        ]
 
-        return LSPResult(
+        return LSPResult.model_construct(
             operation=ctx.args.operation,
             call_items=all_calls,
             message=f"Found {len(all_calls)} incoming call(s)",
@@ -488,21 +882,28 @@ NOTES:
             ctx.server, "textDocument/prepareCallHierarchy", ctx.text_document_position
         )
         if not prep_response:
-            return LSPResult(
+            return LSPResult.model_construct(
                 operation=ctx.args.operation,
                 call_items=[],
                 message="No call hierarchy item at position",
             )
 
         items = prep_response if isinstance(prep_response, list) else [prep_response]
-        all_calls: list[CallItem] = []
-        for item in items:
-            calls_response = await self._send_request(
-                ctx.server, "callHierarchy/outgoingCalls", {"item": item}
+        responses = await asyncio.gather(
+            *(
+                self._send_request(
+                    ctx.server, "callHierarchy/outgoingCalls", {"item": item}
+                )
+                for item in items
             )
-            all_calls.extend(self._parse_outgoing_calls(calls_response))
+        )
+        all_calls = [
+            call
+            for response in responses
+            for call in self._parse_outgoing_calls(response)
+        ]
 
-        return LSPResult(
+        return LSPResult.model_construct(
             operation=ctx.args.operation,
             call_items=all_calls,
             message=f"Found {len(all_calls)} outgoing call(s)",
@@ -510,22 +911,59 @@ NOTES:
 
     async def _open_document(
         self, server: LSPServerProcess, file_path: Path, language: str
-    ) -> None:
+    ) -> str:
+        """Make sure the server has the current contents of ``file_path``.
+
+        The document is opened once per server. After that it is only read and
+        resent, as a full-text ``didChange``, when its mtime or size moved.
+        Concurrent calls for the same document take turns, so it is opened
+        once and versions keep increasing. Returns the document URI.
+        """
+        uri = file_path.as_uri()
+        if (lock := server.document_locks.get(uri)) is None:
+            lock = server.document_locks[uri] = asyncio.Lock()
+        async with lock:
+            return await self._sync_document(server, file_path, language, uri)
+
+    async def _sync_document(
+        self, server: LSPServerProcess, file_path: Path, language: str, uri: str
+    ) -> str:
         try:
-            content = file_path.read_text("utf-8")
+            st = file_path.stat()
+            opened = server.opened.get(uri)
+            if opened is not None and opened[1:] == (st.st_mtime_ns, st.st_size):
+                return uri
+            # Off the event loop: a cold read would stall every other request.
+            data = await asyncio.to_thread(file_path.read_bytes)
         except OSError as e:
             raise ToolError(f"Failed to read file: {e}")
 
-        params = {
-            "textDocument": {
-                "uri": file_path.as_uri(),
-                "languageId": language,
-                "version": 1,
-                "text": content,
+        content = data.decode("utf-8", "replace")
+
+        if opened is None:
+            version = 1
+            params = {
+                "textDocument": {
+                    "uri": uri,
+                    "languageId": language,
+                    "version": version,
+                    "text": content,
+                }
             }
-        }
-        await self._send_notification(server, "textDocument/didOpen", params)
+            self._queue_notification(server, "textDocument/didOpen", params)
+        else:
+            version = opened[0] + 1
+            params = {
+                "textDocument": {"uri": uri, "version": version},
+                "contentChanges": [{"text": content}],
+            }
+            self._queue_notification(server, "textDocument/didChange", params)
+        server.opened[uri] = (version, st.st_mtime_ns, st.st_size)
+        return uri
 
+    # The parsers below build result models with model_construct: the server's
+    # responses are trusted and field types are already what the models declare,
+    # so per-field validation would only cost time on large responses.
     def _parse_locations(self, response: Any) -> list[Location]:
         if response is None:
             return []
@@ -541,14 +979,14 @@ NOTES:
             if not uri:
                 continue
 
-            file_path = uri.replace("file://", "")
+            file_path = _uri_to_path(uri)
 
             range_data = item.get("range") or item.get("targetSelectionRange")
             if range_data:
                 start = range_data.get("start", {})
                 end = range_data.get("end", {})
                 locations.append(
-                    Location(
+                    Location.model_construct(
                         file_path=file_path,
                         line=start.get("line", 0) + 1,
                         character=start.get("character", 0) + 1,
@@ -557,7 +995,9 @@ NOTES:
                     )
                 )
             else:
-                locations.append(Location(file_path=file_path, line=1, character=1))
+                locations.append(
+                    Location.model_construct(file_path=file_path, line=1, character=1)
+                )
 
         return locations
 
@@ -591,34 +1031,37 @@ NOTES:
             return []
 
         items = response if isinstance(response, list) else [response]
-        symbols = []
-
-        def process_symbol(item: dict[str, Any], parent_name: str = "") -> None:
+        symbols: list[Symbol] = []
+        append = symbols.append
+        kind_to_string = self._symbol_kind_to_string
+        path = str(file_path)
+
+        # Depth-first with an explicit stack; children are pushed in reverse so
+        # symbols come out in document order, parents before their members.
+        stack: list[tuple[dict[str, Any], str]] = [
+            (item, "") for item in reversed(items) if item
+        ]
+        while stack:
+            item, parent_name = stack.pop()
             name = item.get("name", "")
             if parent_name:
                 name = f"{parent_name}.{name}"
 
-            kind = self._symbol_kind_to_string(item.get("kind", 0))
-
             range_data = item.get("range") or item.get("location", {}).get("range", {})
             start = range_data.get("start", {})
 
-            symbols.append(
-                Symbol(
+            append(
+                Symbol.model_construct(
                     name=name,
-                    kind=kind,
-                    file_path=str(file_path),
+                    kind=kind_to_string(item.get("kind", 0)),
+                    file_path=path,
                     line=start.get("line", 0) + 1,
                     character=start.get("character", 0) + 1,
                 )
             )
 
-            for child in item.get("children", []):
-                process_symbol(child, name)
-
-        for item in items:
-            if item:
-                process_symbol(item)
+            if children := item.get("children"):
+                stack.extend((child, name) for child in reversed(children) if child)
 
         return symbols
 
@@ -635,13 +1078,13 @@ NOTES:
 
             location = item.get("location", {})
             uri = location.get("uri", "")
-            file_path = uri.replace("file://", "")
+            file_path = _uri_to_path(uri)
 
             range_data = location.get("range", {})
             start = range_data.get("start", {})
 
             symbols.append(
-                Symbol(
+                Symbol.model_construct(
                     name=item.get("name", ""),
                     kind=self._symbol_kind_to_string(item.get("kind", 0)),
                     file_path=file_path,
@@ -665,13 +1108,13 @@ NOTES:
 
             from_item = item.get("from", {})
             uri = from_item.get("uri", "")
-            file_path = uri.replace("file://", "")
+            file_path = _uri_to_path(uri)
 
             range_data = from_item.get("range", {})
             start = range_data.get("start", {})
 
             calls.append(
-                CallItem(
+                CallItem.model_construct(
                     name=from_item.get("name", ""),
                     file_path=file_path,
                     line=start.get("line", 0) + 1,
@@ -693,13 +1136,13 @@ NOTES:
 
             to_item = item.get("to", {})
             uri = to_item.get("uri", "")
-            file_path = uri.replace("file://", "")
+            file_path = _uri_to_path(uri)
 
             range_data = to_item.get("range", {})
             start = range_data.get("start", {})
 
             calls.append(
-                CallItem(
+                CallItem.model_construct(
                     name=to_item.get("name", ""),
                     file_path=file_path,
                     line=start.get("line", 0) + 1,
@@ -709,35 +1152,9 @@ NOTES:
         return calls
 
     def _symbol_kind_to_string(self, kind: int) -> str:
-        kinds = {
-            1: "file",
-            2: "module",
-            3: "namespace",
-            4: "package",
-            5: "class",
-            6: "method",
-            7: "property",
-            8: "field",
-            9: "constructor",
-            10: "enum",
-            11: "interface",
-            12: "function",
-            13: "variable",
-            14: "constant",
-            15: "string",
-            16: "number",
-            17: "boolean",
-            18: "array",
-            19: "object",
-            20: "key",
-            21: "null",
-            22: "enum_member",
-            23: "struct",
-            24: "event",
-            25: "operator",
-            26: "type_parameter",
-        }
-        return kinds.get(kind, "unknown")
+        if isinstance(kind, int) and 0 <= kind < len(SYMBOL_KINDS):
+            return SYMBOL_KINDS[kind]
+        return "unknown"
 
     @classmethod
     def get_call_display(cls, event: ToolCallEvent) -> ToolCallDisplay:
@@ -763,3 +1180,15 @@ NOTES:
     @classmethod
     def get_status_text(cls) -> str:
         return "Running LSP"
+
+
+LSP._HANDLERS = {
+    LSPOperation.GO_TO_DEFINITION: LSP._op_go_to_definition,
+    LSPOperation.FIND_REFERENCES: LSP._op_find_references,
+    LSPOperation.HOVER: LSP._op_hover,
+    LSPOperation.DOCUMENT_SYMBOL: LSP._op_document_symbol,
+    LSPOperation.WORKSPACE_SYMBOL: LSP._op_workspace_symbol,
+    LSPOperation.GO_TO_IMPLEMENTATION: LSP._op_go_to_implementation,
+    LSPOperation.INCOMING_CALLS: LSP._op_incoming_calls,
+    LSPOperation.OUTGOING_CALLS: LSP._op_outgoing_calls,
+}
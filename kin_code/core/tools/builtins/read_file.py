@@ -107,22 +107,7 @@ NOTES:
         )
 
     def check_allowlist_denylist(self, args: ReadFileArgs) -> ToolPermission | None:
-        import fnmatch
-
-        file_path = Path(args.path).expanduser()
-        if not file_path.is_absolute():
-            file_path = Path.cwd() / file_path
-        file_str = str(file_path)
-
-        for pattern in self.config.denylist:
-            if fnmatch.fnmatch(file_str, pattern):
-                return ToolPermission.NEVER
-
-        for pattern in self.config.allowlist:
-            if fnmatch.fnmatch(file_str, pattern):
-                return ToolPermission.ALWAYS
-
-        return None
+        return self.check_path_allowlist_denylist(args.path)
 
     def _prepare_and_validate_path(self, args: ReadFileArgs) -> Path:
         self._validate_inputs(args)
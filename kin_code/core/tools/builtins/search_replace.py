@@ -107,6 +107,7 @@ NOTES:
 - Search text must match exactly (whitespace matters)
 - Supports fuzzy matching to help diagnose failures
 - Multiple blocks can be applied in one call"""
+    sequential: ClassVar[bool] = True
 
     @classmethod
     def get_call_display(cls, event: ToolCallEvent) -> ToolCallDisplay:
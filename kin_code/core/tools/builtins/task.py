@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+import asyncio
+from collections.abc import AsyncGenerator, Callable
+from functools import lru_cache
+import io
+import os
 import re
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from pydantic import BaseModel, Field
 
 from kin_code.core.agent_loop import AgentLoop
 from kin_code.core.agents.models import AgentType
 from kin_code.core.config import SessionLoggingConfig, VibeConfig
+from kin_code.core.paths.config_paths import CONFIG_FILE
 from kin_code.core.tools.base import (
     BaseTool,
     BaseToolConfig,
@@ -25,6 +30,7 @@ from kin_code.core.tools.ui import (
 )
 from kin_code.core.types import (
     AssistantEvent,
+    BaseEvent,
     ReasoningEvent,
     Role,
     ToolCallEvent,
@@ -42,6 +48,10 @@ _TASK_SUFFIX = (
     "- Provide a final text response; do not end with only tool calls"
 )
 
+# A subagent can emit a burst of events without ever suspending, which would
+# starve other tasks; hand control back to the event loop every so often.
+_YIELD_EVERY = 32
+
 # Regex patterns that indicate content contains malformed tool call attempts.
 # These patterns match XML-style tool calls that some models emit incorrectly.
 _TOOL_CALL_PATTERN = re.compile(
@@ -56,7 +66,36 @@ def _is_tool_call_content(content: str) -> bool:
     start. This handles cases where models prefix malformed tool calls with text
     like "Here's my analysis:" before the XML.
     """
-    return bool(_TOOL_CALL_PATTERN.search(content))
+    # Every pattern starts with "<"; plain prose skips the regex entirely.
+    return "<" in content and _TOOL_CALL_PATTERN.search(content) is not None
+
+
+@lru_cache(maxsize=1)
+def _load_subagent_config(path: str, mtime_ns: int, size: int) -> VibeConfig:
+    """Load the config subagents start from.
+
+    ``path``, ``mtime_ns`` and ``size`` are only part of the cache key, so the
+    config is loaded again as soon as the config file changes on disk.
+    """
+    return VibeConfig.load(session_logging=SessionLoggingConfig(enabled=False))
+
+
+def _subagent_config() -> VibeConfig:
+    path = CONFIG_FILE.path
+    try:
+        st = os.stat(path)
+    except OSError:
+        config = _load_subagent_config(str(path), 0, 0)
+    else:
+        config = _load_subagent_config(str(path), st.st_mtime_ns, st.st_size)
+    # Agent loops change their config in place, so each one gets its own copy.
+    return config.model_copy(deep=True)
+
+
+@lru_cache(maxsize=64)
+def _get_adapter(tool_class: type[BaseTool]) -> ToolUIDataAdapter:
+    """Return the UI adapter for a tool class, built once per class."""
+    return ToolUIDataAdapter(tool_class)
 
 
 class TaskArgs(BaseModel):
@@ -101,13 +140,15 @@ class TaskToolConfig(BaseToolConfig):
 class _EventProcessingState:
     """Mutable state for processing subagent events."""
 
-    accumulated_response: list[str]
-    accumulated_reasoning: list[str]
+    accumulated_response: io.StringIO
+    accumulated_reasoning: io.StringIO
+    last_valid_response: str
     completed: bool
 
     def __init__(self) -> None:
-        self.accumulated_response = []
-        self.accumulated_reasoning = []
+        self.accumulated_response = io.StringIO()
+        self.accumulated_reasoning = io.StringIO()
+        self.last_valid_response = ""
         self.completed = True
 
 
@@ -139,6 +180,17 @@ NOTES:
 - Only subagents can be used (not regular agents)
 - Prevents recursive spawning for safety"""
 
+    # Filled in below the class body, once the handlers exist.
+    _EVENT_HANDLERS: ClassVar[
+        dict[
+            type[BaseEvent],
+            Callable[
+                [Task, Any, _EventProcessingState, InvokeContext],
+                ToolStreamEvent | None,
+            ],
+        ]
+    ]
+
     @classmethod
     def get_call_display(cls, event: ToolCallEvent) -> ToolCallDisplay:
         args = event.args
@@ -179,64 +231,57 @@ NOTES:
             return None, None
 
     def _process_event(
-        self,
-        event: AssistantEvent | ToolCallEvent | ReasoningEvent | ToolResultEvent,
-        state: _EventProcessingState,
-        ctx: InvokeContext,
+        self, event: BaseEvent, state: _EventProcessingState, ctx: InvokeContext
     ) -> ToolStreamEvent | None:
         """Handle a single event from the subagent loop.
 
         Updates state in-place and returns a ToolStreamEvent if one should be yielded.
         Only processes AssistantEvent, ToolCallEvent, ReasoningEvent, and ToolResultEvent.
         """
-        match event:
-            case ToolCallEvent():
-                # Clear accumulated response when tool calls start.
-                # We only want the final summary after all tool execution.
-                state.accumulated_response.clear()
-            case AssistantEvent(content=content) if content:
-                state.accumulated_response.append(content)
-                if event.stopped_by_middleware:
-                    state.completed = False
-            case ReasoningEvent(content=content) if content:
-                state.accumulated_reasoning.append(content)
-            case ToolResultEvent(skipped=True):
-                state.completed = False
-            case ToolResultEvent(result=result, tool_class=tool_class) if (
-                result and tool_class
-            ):
-                adapter = ToolUIDataAdapter(tool_class)
-                display = adapter.get_result_display(event)
-                return ToolStreamEvent(
-                    tool_name=self.get_name(),
-                    message=f"{event.tool_name}: {display.message}",
-                    tool_call_id=ctx.tool_call_id,
-                )
-            case _:
-                return None
+        if handler := Task._EVENT_HANDLERS.get(type(event)):
+            return handler(self, event, state, ctx)
         return None
 
-    def _extract_response_from_history(self, subagent_loop: AgentLoop) -> str:
-        """Extract final response from message history when accumulated response is empty.
+    def _on_tool_call(
+        self, event: ToolCallEvent, state: _EventProcessingState, ctx: InvokeContext
+    ) -> None:
+        # Clear accumulated response when tool calls start.
+        # We only want the final summary after all tool execution,
+        # but keep the last usable text in case that summary is empty.
+        content = state.accumulated_response.getvalue()
+        if content.strip() and not _is_tool_call_content(content):
+            state.last_valid_response = content
+        state.accumulated_response.seek(0)
+        state.accumulated_response.truncate()
+
+    def _on_assistant(
+        self, event: AssistantEvent, state: _EventProcessingState, ctx: InvokeContext
+    ) -> None:
+        if event.content:
+            state.accumulated_response.write(event.content)
+            if event.stopped_by_middleware:
+                state.completed = False
 
-        Some models return empty content on their final turn after tool calls, or emit
-        malformed tool call XML instead of actual text. This method walks the history
-        in reverse to find the last valid assistant response.
+    def _on_reasoning(
+        self, event: ReasoningEvent, state: _EventProcessingState, ctx: InvokeContext
+    ) -> None:
+        if event.content:
+            state.accumulated_reasoning.write(event.content)
 
-        Edge cases handled:
-        - Empty content strings (skipped)
-        - Malformed tool call XML patterns (skipped via _is_tool_call_content)
-        - Non-string content (converted to string)
-        - No valid content found (returns empty string)
-        """
-        for msg in reversed(subagent_loop.messages):
-            if msg.role != Role.assistant or not msg.content:
-                continue
-            content = msg.content if isinstance(msg.content, str) else str(msg.content)
-            # Skip empty content and malformed tool call attempts
-            if content.strip() and not _is_tool_call_content(content):
-                return content
-        return ""
+    def _on_tool_result(
+        self, event: ToolResultEvent, state: _EventProcessingState, ctx: InvokeContext
+    ) -> ToolStreamEvent | None:
+        if event.skipped:
+            state.completed = False
+            return None
+        if not (event.result and event.tool_class):
+            return None
+        display = _get_adapter(event.tool_class).get_result_display(event)
+        return ToolStreamEvent(
+            tool_name=self.get_name(),
+            message=f"{event.tool_name}: {display.message}",
+            tool_call_id=ctx.tool_call_id,
+        )
 
     async def run(
         self, args: TaskArgs, ctx: InvokeContext | None = None
@@ -256,47 +301,37 @@ NOTES:
                 f"This is a security constraint to prevent recursive spawning."
             )
 
-        base_config = VibeConfig.load(
-            session_logging=SessionLoggingConfig(enabled=False)
-        )
-        subagent_loop = AgentLoop(config=base_config, agent_name=args.agent)
+        subagent_loop = AgentLoop(config=_subagent_config(), agent_name=args.agent)
         model_alias, provider = self._get_model_info(subagent_loop)
 
         if ctx.approval_callback:
             subagent_loop.set_approval_callback(ctx.approval_callback)
 
         state = _EventProcessingState()
-        _handled_types = (
-            AssistantEvent,
-            ToolCallEvent,
-            ReasoningEvent,
-            ToolResultEvent,
-        )
+        event_count = 0
         try:
             async for event in subagent_loop.act(args.task + _TASK_SUFFIX):
-                if isinstance(event, _handled_types):
-                    if stream_event := self._process_event(event, state, ctx):
-                        yield stream_event
-
-            turns_used = sum(
-                msg.role == Role.assistant for msg in subagent_loop.messages
-            )
+                if stream_event := self._process_event(event, state, ctx):
+                    yield stream_event
+                event_count += 1
+                if event_count % _YIELD_EVERY == 0:
+                    await asyncio.sleep(0)
         except Exception as e:
             state.completed = False
-            state.accumulated_response.append(f"\n[Subagent error: {e}]")
-            turns_used = sum(
-                msg.role == Role.assistant for msg in subagent_loop.messages
-            )
+            state.accumulated_response.write(f"\n[Subagent error: {e}]")
 
-        response_content = "".join(state.accumulated_response)
+        assistant = Role.assistant
+        turns_used = sum(msg.role is assistant for msg in subagent_loop.messages)
+
+        response_content = state.accumulated_response.getvalue()
 
         # Filter out malformed tool call content from accumulated response
-        if response_content.strip() and _is_tool_call_content(response_content):
+        if _is_tool_call_content(response_content):
             response_content = ""
 
-        # Fallback: check message history if no valid content accumulated
+        # Fallback: the last valid text streamed before a tool call
         if not response_content.strip():
-            response_content = self._extract_response_from_history(subagent_loop)
+            response_content = state.last_valid_response
 
         # If still no valid content, provide a fallback message
         if not response_content.strip():
@@ -305,7 +340,7 @@ NOTES:
                 "Check the tool results above for details.]"
             )
 
-        reasoning_content = "".join(state.accumulated_reasoning) or None
+        reasoning_content = state.accumulated_reasoning.getvalue() or None
 
         # Reasoning is excluded from serialization by default to prevent context bloat.
         # Only populate when explicitly requested for debugging/programmatic access.
@@ -317,3 +352,11 @@ NOTES:
             model_alias=model_alias,
             provider=provider,
         )
+
+
+Task._EVENT_HANDLERS = {
+    AssistantEvent: Task._on_assistant,
+    ToolCallEvent: Task._on_tool_call,
+    ReasoningEvent: Task._on_reasoning,
+    ToolResultEvent: Task._on_tool_result,
+}
@@ -84,6 +84,7 @@ NOTES:
 - Todos persist only for the current session
 - Write action replaces the entire list (not incremental)
 - Each todo needs a unique id"""
+    sequential: ClassVar[bool] = True
 
     @classmethod
     def get_call_display(cls, event: ToolCallEvent) -> ToolCallDisplay:
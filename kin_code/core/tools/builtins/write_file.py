@@ -70,6 +70,7 @@ NOTES:
 - Requires overwrite=True to replace existing files
 - Parent directories are created automatically
 - Cannot write outside project directory"""
+    sequential: ClassVar[bool] = True
 
     @classmethod
     def get_call_display(cls, event: ToolCallEvent) -> ToolCallDisplay:
@@ -98,22 +99,7 @@ NOTES:
         return "Writing file"
 
     def check_allowlist_denylist(self, args: WriteFileArgs) -> ToolPermission | None:
-        import fnmatch
-
-        file_path = Path(args.path).expanduser()
-        if not file_path.is_absolute():
-            file_path = Path.cwd() / file_path
-        file_str = str(file_path)
-
-        for pattern in self.config.denylist:
-            if fnmatch.fnmatch(file_str, pattern):
-                return ToolPermission.NEVER
-
-        for pattern in self.config.allowlist:
-            if fnmatch.fnmatch(file_str, pattern):
-                return ToolPermission.ALWAYS
-
-        return None
+        return self.check_path_allowlist_denylist(args.path)
 
     @final
     async def run(
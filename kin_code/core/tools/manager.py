@@ -12,7 +12,7 @@ from typing import TYPE_CHECKING, Any
 
 from kin_code.core.paths.config_paths import resolve_local_tools_dir
 from kin_code.core.paths.global_paths import DEFAULT_TOOL_DIR, GLOBAL_TOOLS_DIR
-from kin_code.core.tools.base import BaseTool, BaseToolConfig
+from kin_code.core.tools.base import BaseTool, BaseToolConfig, ToolPermission
 from kin_code.core.tools.mcp import (
     RemoteTool,
     create_mcp_http_proxy_tool_class,
@@ -136,6 +136,7 @@ class ToolManager:
             cls.get_name(): cls for cls in self._iter_tool_classes(self._search_paths)
         }
         self._integrate_mcp()
+        self._prewarmed = False
 
     @property
     def _config(self) -> VibeConfig:
@@ -249,6 +250,22 @@ class ToolManager:
             }
         return dict(self._available)
 
+    def prewarm_tools(self) -> None:
+        """Let tools that opted in via ``prewarm`` start background work early.
+
+        Must be called from inside the running event loop, since that is where
+        the background work is scheduled. Only the first call does anything.
+        """
+        if self._prewarmed:
+            return
+        self._prewarmed = True
+        for name, tool_class in self.available_tools.items():
+            if (prewarm := getattr(tool_class, "prewarm", None)) is None:
+                continue
+            tool_config = self.get_tool_config(name)
+            if getattr(tool_config, "prewarm", False):
+                prewarm([Path.cwd()], tool_config)
+
     def _integrate_mcp(self) -> None:
         if not self._config.mcp_servers:
             return
@@ -370,6 +387,19 @@ class ToolManager:
 
         return config_class.model_validate(merged_dict)
 
+    def get_tool_permission(self, tool_name: str) -> ToolPermission:
+        """Return the effective permission for a tool.
+
+        Equivalent to ``get_tool_config(tool_name).permission`` without merging
+        and re-validating the whole config. User overrides are read live, so
+        in-place permission changes are picked up immediately.
+        """
+        if (user_overrides := self._config.tools.get(tool_name)) is not None:
+            return user_overrides.permission
+        if tool_class := self._available.get(tool_name):
+            return tool_class._get_tool_config_class()().permission
+        return BaseToolConfig().permission
+
     def get(self, tool_name: str) -> BaseTool:
         """Get a tool instance, creating it lazily on first call.
 
@@ -87,6 +87,14 @@ def get_user_cancellation_message(
             )
 
 
+@functools.lru_cache(maxsize=128)
+def get_user_cancellation_text(
+    cancellation_reason: CancellationReason, tool_name: str | None = None
+) -> str:
+    """Rendered form of :func:`get_user_cancellation_message`, cached per input."""
+    return str(get_user_cancellation_message(cancellation_reason, tool_name))
+
+
 def is_user_cancellation_event(event: BaseEvent) -> bool:
     """Check if an event represents a user-initiated cancellation.
 
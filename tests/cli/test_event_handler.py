@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from textual.widget import Widget
+
+from kin_code.cli.textual_ui.handlers.event_handler import EventHandler
+from kin_code.cli.textual_ui.widgets.tools import ToolCallMessage, ToolResultMessage
+from kin_code.core.tools.builtins.bash import Bash, BashArgs, BashResult
+from kin_code.core.types import ToolCallEvent, ToolResultEvent, ToolStreamEvent
+
+
+def _call(call_id: str) -> ToolCallEvent:
+    return ToolCallEvent(
+        tool_name="bash",
+        tool_class=Bash,
+        args=BashArgs(command="true"),
+        tool_call_id=call_id,
+    )
+
+
+def _result(call_id: str) -> ToolResultEvent:
+    return ToolResultEvent(
+        tool_name="bash",
+        tool_class=Bash,
+        result=BashResult(command="true", stdout="", stderr="", returncode=0),
+        tool_call_id=call_id,
+    )
+
+
+@pytest.fixture
+def mounted() -> list[Widget]:
+    return []
+
+
+@pytest.fixture
+def handler(mounted: list[Widget]) -> EventHandler:
+    async def mount(widget: Widget) -> None:
+        mounted.append(widget)
+
+    return EventHandler(
+        mount_callback=mount,
+        scroll_callback=MagicMock(),
+        todo_area_callback=MagicMock(),
+        get_tools_collapsed=lambda: True,
+        get_todos_collapsed=lambda: True,
+    )
+
+
+class TestConcurrentToolCalls:
+    @pytest.mark.asyncio
+    async def test_routes_stream_and_result_to_their_own_call(
+        self, handler: EventHandler, mounted: list[Widget]
+    ) -> None:
+        first = await handler.handle_event(_call("call_a"))
+        second = await handler.handle_event(_call("call_b"))
+        assert isinstance(first, ToolCallMessage)
+        assert isinstance(second, ToolCallMessage)
+        first.set_stream_message = MagicMock()
+        second.set_stream_message = MagicMock()
+
+        await handler.handle_event(
+            ToolStreamEvent(tool_name="bash", message="a...", tool_call_id="call_a")
+        )
+        await handler.handle_event(_result("call_b"))
+
+        first.set_stream_message.assert_called_once_with("a...")
+        second.set_stream_message.assert_not_called()
+        result = mounted[-1]
+        assert isinstance(result, ToolResultMessage)
+        assert result._call_widget is second
+        assert handler.tool_calls == {"call_a": first}
+
+    @pytest.mark.asyncio
+    async def test_stop_stops_every_running_call(self, handler: EventHandler) -> None:
+        stops: list[MagicMock] = []
+        for call_id in ("call_a", "call_b"):
+            call = await handler.handle_event(_call(call_id))
+            assert call is not None
+            call.stop_spinning = stop = MagicMock()
+            stops.append(stop)
+
+        handler.stop_current_tool_call()
+
+        for stop in stops:
+            stop.assert_called_once_with()
+        assert handler.tool_calls == {}
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from kin_code.core.paths.global_paths import GLOBAL_CONFIG_FILE, SESSION_LOG_DIR
+
+
+def test_derived_paths_are_reused_between_accesses() -> None:
+    assert GLOBAL_CONFIG_FILE.path is GLOBAL_CONFIG_FILE.path
+    assert SESSION_LOG_DIR.path is SESSION_LOG_DIR.path
+
+
+def test_derived_paths_follow_kin_home_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    original = GLOBAL_CONFIG_FILE.path
+
+    monkeypatch.setenv("KIN_HOME", str(tmp_path))
+
+    assert GLOBAL_CONFIG_FILE.path == tmp_path.resolve() / "config.toml"
+    assert SESSION_LOG_DIR.path == tmp_path.resolve() / "logs" / "session"
+
+    monkeypatch.delenv("KIN_HOME")
+
+    assert GLOBAL_CONFIG_FILE.path == original
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Sequence
+from enum import StrEnum
+from pathlib import Path
+from typing import ClassVar
+
+from pydantic import BaseModel, ConfigDict, Field
+import pytest
+
+from kin_code.core.agents.manager import AgentManager
+from kin_code.core.config import VibeConfig
+from kin_code.core.llm.format import (
+    APIToolFormatHandler,
+    FailedToolCall,
+    ResolvedMessage,
+    ResolvedToolCall,
+)
+from kin_code.core.tool_runner import ToolRunner, _format_tool_result
+from kin_code.core.tools.base import (
+    BaseTool,
+    BaseToolConfig,
+    BaseToolState,
+    InvokeContext,
+    ToolError,
+)
+from kin_code.core.tools.builtins.bash import BashResult
+from kin_code.core.tools.builtins.todo import Todo
+from kin_code.core.tools.manager import ToolManager
+from kin_code.core.types import (
+    AgentStats,
+    BaseEvent,
+    LLMMessage,
+    Role,
+    ToolResultEvent,
+    ToolStreamEvent,
+)
+
+
+class _Kind(StrEnum):
+    FILE = "file"
+
+
+class _Entry(BaseModel):
+    path: Path
+    kind: _Kind
+
+
+class _Result(BaseModel):
+    count: int
+    entries: list[_Entry]
+    best: _Entry | None = None
+    hidden: str = Field(default="secret", exclude=True)
+
+
+def _legacy_format(result: BaseModel) -> str:
+    return "\n".join(f"{k}: {v}" for k, v in result.model_dump().items())
+
+
+class TestFormatToolResult:
+    def test_matches_model_dump_output(self) -> None:
+        entry = _Entry(path=Path("a.txt"), kind=_Kind.FILE)
+        result = _Result(count=1, entries=[entry], best=entry)
+
+        assert _format_tool_result(result) == _legacy_format(result)
+
+    def test_skips_excluded_fields(self) -> None:
+        result = _Result(count=0, entries=[])
+
+        assert "hidden" not in _format_tool_result(result)
+        assert _format_tool_result(result) == "count: 0\nentries: []\nbest: None"
+
+    def test_matches_model_dump_for_scalar_fields(self) -> None:
+        result = BashResult(command="ls", stdout="a\nb", stderr="", returncode=0)
+
+        assert _format_tool_result(result) == _legacy_format(result)
+
+    def test_includes_extra_fields(self) -> None:
+        class _Open(BaseModel):
+            model_config = ConfigDict(extra="allow")
+            name: str
+
+        result = _Open.model_validate({"name": "x", "size": 3})
+
+        assert _format_tool_result(result) == _legacy_format(result)
+
+
+class TestMakeToolMessage:
+    def test_matches_validated_construction(self) -> None:
+        runner = ToolRunner(tool_manager=ToolManager(lambda: VibeConfig()))
+
+        message = runner._make_tool_message("bash", "ok", "call_1")
+        expected = LLMMessage(
+            role=Role.tool, name="bash", content="ok", tool_call_id="call_1"
+        )
+
+        assert message == expected
+        assert message.model_fields_set == expected.model_fields_set
+
+
+class _GateArgs(BaseModel):
+    label: str
+    wait_for: str | None = None
+    fail: bool = False
+
+
+class _GateResult(BaseModel):
+    label: str
+
+
+class _GateTool(BaseTool[_GateArgs, _GateResult, BaseToolConfig, BaseToolState]):
+    """Finishes only once the call it waits for has finished."""
+
+    finished: ClassVar[dict[str, asyncio.Event]] = {}
+
+    @classmethod
+    def get_name(cls) -> str:
+        return "gate"
+
+    async def run(
+        self, args: _GateArgs, ctx: InvokeContext | None = None
+    ) -> AsyncGenerator[ToolStreamEvent | _GateResult, None]:
+        yield ToolStreamEvent(
+            tool_name="gate",
+            message=f"{args.label} started",
+            tool_call_id=ctx.tool_call_id if ctx else "",
+        )
+        if args.wait_for:
+            await self.finished.setdefault(args.wait_for, asyncio.Event()).wait()
+        self.finished.setdefault(args.label, asyncio.Event()).set()
+        if args.fail:
+            raise ToolError(f"{args.label} failed")
+        yield _GateResult(label=args.label)
+
+
+def _gate_call(
+    label: str, wait_for: str | None = None, fail: bool = False
+) -> ResolvedToolCall:
+    return ResolvedToolCall(
+        tool_name="gate",
+        tool_class=_GateTool,
+        validated_args=_GateArgs(label=label, wait_for=wait_for, fail=fail),
+        call_id=f"call_{label}",
+    )
+
+
+async def _run_calls(
+    runner: ToolRunner, tool_calls: list[ResolvedToolCall]
+) -> tuple[Sequence[BaseEvent], list[LLMMessage]]:
+    history: list[LLMMessage] = []
+    events = [
+        event
+        async for event in runner.handle_tool_calls(
+            ResolvedMessage(tool_calls=tool_calls),
+            AgentManager(lambda: VibeConfig()),
+            None,
+            AgentStats(),
+            history.append,
+        )
+    ]
+    return events, history
+
+
+def _make_runner(max_concurrency: int) -> ToolRunner:
+    _GateTool.finished = {}
+    manager = ToolManager(lambda: VibeConfig())
+    manager._available["gate"] = _GateTool
+    return ToolRunner(
+        tool_manager=manager, auto_approve=True, max_concurrency=max_concurrency
+    )
+
+
+class TestConcurrentToolCalls:
+    @pytest.mark.asyncio
+    async def test_overlapping_calls_keep_result_and_history_order(self) -> None:
+        runner = _make_runner(max_concurrency=0)
+        calls = [_gate_call("a", wait_for="b"), _gate_call("b")]
+
+        events, history = await asyncio.wait_for(_run_calls(runner, calls), 5)
+
+        results = [e for e in events if isinstance(e, ToolResultEvent)]
+        assert [r.tool_call_id for r in results] == ["call_a", "call_b"]
+        assert all(r.error is None for r in results)
+        assert [m.tool_call_id for m in history] == ["call_a", "call_b"]
+        streams = [e for e in events if isinstance(e, ToolStreamEvent)]
+        assert events.index(streams[-1]) < events.index(results[0])
+
+    @pytest.mark.asyncio
+    async def test_failing_call_does_not_affect_siblings(self) -> None:
+        runner = _make_runner(max_concurrency=2)
+        calls = [_gate_call("a", fail=True), _gate_call("b", wait_for="a")]
+
+        events, history = await asyncio.wait_for(_run_calls(runner, calls), 5)
+
+        results = [e for e in events if isinstance(e, ToolResultEvent)]
+        assert results[0].error is not None and "a failed" in results[0].error
+        assert results[1].error is None
+        assert len(history) == 2
+
+    @pytest.mark.asyncio
+    async def test_single_slot_runs_calls_in_order(self) -> None:
+        runner = _make_runner(max_concurrency=1)
+        calls = [_gate_call("a"), _gate_call("b", wait_for="a")]
+
+        events, _ = await asyncio.wait_for(_run_calls(runner, calls), 5)
+
+        assert [type(e).__name__ for e in events] == [
+            "ToolCallEvent",
+            "ToolStreamEvent",
+            "ToolResultEvent",
+            "ToolCallEvent",
+            "ToolStreamEvent",
+            "ToolResultEvent",
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("max_concurrency", "running"), [(0, 3), (2, 2)])
+    async def test_interrupt_reports_every_announced_call(
+        self, max_concurrency: int, running: int
+    ) -> None:
+        runner = _make_runner(max_concurrency=max_concurrency)
+        calls = [_gate_call(label, wait_for="never") for label in ("a", "b", "c")]
+        events: list[BaseEvent] = []
+        history: list[LLMMessage] = []
+        started = asyncio.Event()
+
+        async def consume() -> None:
+            async for event in runner.handle_tool_calls(
+                ResolvedMessage(tool_calls=calls),
+                AgentManager(lambda: VibeConfig()),
+                None,
+                AgentStats(),
+                history.append,
+            ):
+                events.append(event)
+                if sum(isinstance(e, ToolStreamEvent) for e in events) == running:
+                    started.set()
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.wait_for(started.wait(), 5)
+        consumer.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await consumer
+
+        results = [e for e in events if isinstance(e, ToolResultEvent)]
+        expected = ["call_a", "call_b", "call_c"]
+        assert [r.tool_call_id for r in results] == expected
+        assert all(r.error for r in results)
+        assert [m.tool_call_id for m in history] == expected
+
+    def test_sequential_tools_disable_concurrency(self) -> None:
+        runner = _make_runner(max_concurrency=0)
+        todo_call = ResolvedToolCall(
+            tool_name="todo", tool_class=Todo, validated_args=_GateArgs(label="t")
+        )
+
+        assert runner._runs_concurrently([_gate_call("a"), _gate_call("b")])
+        assert not runner._runs_concurrently([_gate_call("a"), todo_call])
+
+
+class TestFailedToolCalls:
+    @pytest.mark.asyncio
+    async def test_reports_each_failure_and_records_it_in_history(self) -> None:
+        runner = _make_runner(max_concurrency=1)
+        failed = [
+            FailedToolCall(tool_name="nope", call_id=f"bad_{i}", error="bad json")
+            for i in range(3)
+        ]
+        history: list[LLMMessage] = []
+        stats = AgentStats()
+
+        events = [
+            event
+            async for event in runner.handle_tool_calls(
+                ResolvedMessage(tool_calls=[], failed_calls=failed),
+                AgentManager(lambda: VibeConfig()),
+                None,
+                stats,
+                history.append,
+            )
+        ]
+
+        assert [e.tool_call_id for e in events] == ["bad_0", "bad_1", "bad_2"]
+        assert stats.tool_calls_failed == 3
+        handler = APIToolFormatHandler()
+        assert history == [
+            handler.create_failed_tool_response_message(call, event.error or "")
+            for call, event in zip(failed, events, strict=True)
+            if isinstance(event, ToolResultEvent)
+        ]
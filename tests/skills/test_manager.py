@@ -5,6 +5,7 @@ from pathlib import Path
 import pytest
 
 from kin_code.core.config import SessionLoggingConfig, VibeConfig
+from kin_code.core.skills import manager as manager_module
 from kin_code.core.skills.manager import SkillManager
 from tests.skills.conftest import create_skill
 
@@ -238,6 +239,22 @@ class TestSkillManagerSearchPaths:
         assert len(skills) == 1
         assert skills["duplicate-skill"].description == "First version"
 
+    def test_deduplicates_equivalent_search_paths(self, tmp_path: Path) -> None:
+        skills_dir = tmp_path / "skills"
+        create_skill(skills_dir, "only-skill", "Only skill")
+        (tmp_path / "other").mkdir()
+
+        # model_construct skips the validator that already resolves skill_paths
+        manager = SkillManager(
+            lambda: VibeConfig.model_construct(
+                skill_paths=[skills_dir, tmp_path / "other" / ".." / "skills"],
+                enabled_skills=[],
+                disabled_skills=[],
+            )
+        )
+
+        assert manager._search_paths.count(skills_dir) == 1
+
     def test_ignores_nonexistent_skill_paths(self, tmp_path: Path) -> None:
         skills_dir = tmp_path / "skills"
         skills_dir.mkdir()
@@ -254,6 +271,22 @@ class TestSkillManagerSearchPaths:
         assert len(manager.available_skills) == 1
         assert "valid-skill" in manager.available_skills
 
+    def test_search_paths_are_reused_until_refresh(self, tmp_path: Path) -> None:
+        skills_dir = tmp_path / "skills"
+        config = VibeConfig(
+            session_logging=SessionLoggingConfig(enabled=False),
+            system_prompt_id="tests",
+            include_project_context=False,
+            skill_paths=[skills_dir],
+        )
+        assert SkillManager(lambda: config).available_skills == {}
+
+        create_skill(skills_dir, "late-skill", "Created after first scan")
+        assert SkillManager(lambda: config).available_skills == {}
+
+        SkillManager.refresh()
+        assert "late-skill" in SkillManager(lambda: config).available_skills
+
 
 class TestSkillManagerGetSkill:
     def test_returns_skill_by_name(self, skills_dir: Path) -> None:
@@ -274,6 +307,35 @@ class TestSkillManagerGetSkill:
     def test_returns_none_for_unknown_skill(self, skill_manager: SkillManager) -> None:
         assert skill_manager.get_skill("nonexistent-skill") is None
 
+    def test_repeated_lookups_do_not_rerun_filters(
+        self, skills_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        create_skill(skills_dir, "skill-a", "Skill A")
+        create_skill(skills_dir, "skill-b", "Skill B")
+        config = VibeConfig(
+            session_logging=SessionLoggingConfig(enabled=False),
+            system_prompt_id="tests",
+            include_project_context=False,
+            skill_paths=[skills_dir],
+            disabled_skills=["skill-b"],
+        )
+        manager = SkillManager(lambda: config)
+        calls: list[str] = []
+        original = manager_module.name_matches
+
+        def counting_name_matches(name: str, patterns: list[str]) -> bool:
+            calls.append(name)
+            return original(name, patterns)
+
+        monkeypatch.setattr(manager_module, "name_matches", counting_name_matches)
+
+        for _ in range(3):
+            assert manager.get_skill("skill-a") is not None
+            assert manager.get_skill("skill-b") is None
+            assert manager.get_skill("missing") is None
+
+        assert sorted(calls) == ["skill-a", "skill-b"]
+
 
 class TestSkillManagerFiltering:
     def test_enabled_skills_filters_to_only_enabled(self, skills_dir: Path) -> None:
@@ -392,6 +454,24 @@ class TestSkillManagerFiltering:
         assert manager.get_skill("enabled-skill") is not None
         assert manager.get_skill("disabled-skill") is None
 
+    def test_filtering_follows_config_changes(self, skills_dir: Path) -> None:
+        create_skill(skills_dir, "skill-a", "Skill A")
+        create_skill(skills_dir, "skill-b", "Skill B")
+
+        config = VibeConfig(
+            session_logging=SessionLoggingConfig(enabled=False),
+            system_prompt_id="tests",
+            include_project_context=False,
+            skill_paths=[skills_dir],
+        )
+        manager = SkillManager(lambda: config)
+        assert manager.available_skills is manager.available_skills
+        assert set(manager.available_skills) == {"skill-a", "skill-b"}
+
+        config = config.model_copy(update={"disabled_skills": ["skill-b"]})
+
+        assert set(manager.available_skills) == {"skill-a"}
+
 
 class TestSkillUserInvocable:
     def test_user_invocable_defaults_to_true(self, skills_dir: Path) -> None:
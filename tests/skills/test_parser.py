@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 
-from kin_code.core.skills.parser import SkillParseError, parse_frontmatter
+from kin_code.core.skills.parser import (
+    SkillParseError,
+    parse_frontmatter,
+    parse_frontmatter_from_file,
+)
 
 
 class TestParseFrontmatter:
@@ -113,3 +119,39 @@ description: No body
 
         assert frontmatter["name"] == "minimal"
         assert body.strip() == ""
+
+
+class TestParseFrontmatterFromFile:
+    def test_parses_frontmatter_after_leading_blank_lines(self, tmp_path: Path) -> None:
+        skill_file = tmp_path / "SKILL.md"
+        skill_file.write_text(
+            "\n---\nname: test-skill\ndescription: A test skill\n---\n\nBody\n",
+            encoding="utf-8",
+        )
+
+        frontmatter = parse_frontmatter_from_file(skill_file)
+
+        assert frontmatter == {"name": "test-skill", "description": "A test skill"}
+
+    def test_ignores_body_after_closing_boundary(self, tmp_path: Path) -> None:
+        skill_file = tmp_path / "SKILL.md"
+        skill_file.write_text(
+            "---\nname: test-skill\n---\n\n---\n[not: yaml\n---\n", encoding="utf-8"
+        )
+
+        assert parse_frontmatter_from_file(skill_file) == {"name": "test-skill"}
+
+    @pytest.mark.parametrize(
+        "content",
+        ["", "Just markdown", "---\nname: incomplete\n", "intro\n---\nname: x\n---\n"],
+    )
+    def test_raises_error_for_missing_frontmatter(
+        self, tmp_path: Path, content: str
+    ) -> None:
+        skill_file = tmp_path / "SKILL.md"
+        skill_file.write_text(content, encoding="utf-8")
+
+        with pytest.raises(SkillParseError) as exc_info:
+            parse_frontmatter_from_file(skill_file)
+
+        assert "Missing or invalid YAML frontmatter" in str(exc_info.value)
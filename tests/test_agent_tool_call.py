@@ -11,6 +11,7 @@ from kin_code.core.agents.models import BuiltinAgentName
 from kin_code.core.config import SessionLoggingConfig, VibeConfig
 from kin_code.core.tools.base import BaseToolConfig, ToolPermission
 from kin_code.core.tools.builtins.todo import TodoItem
+from kin_code.core.tools.manager import ToolManager
 from kin_code.core.types import (
     ApprovalResponse,
     AssistantEvent,
@@ -496,3 +497,43 @@ async def test_ensure_assistant_after_tool_appends_understood() -> None:
     idx = next(i for i, m in enumerate(agent_loop.messages) if m.role == Role.tool)
     assert agent_loop.messages[idx + 1].role == Role.assistant
     assert agent_loop.messages[idx + 1].content == "Understood."
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("measure_tool_duration", [True, False])
+async def test_tool_result_duration_is_optional(measure_tool_duration: bool) -> None:
+    backend = FakeBackend([
+        [mock_llm_chunk(content="Checking.", tool_calls=[make_todo_tool_call("c1")])],
+        [mock_llm_chunk(content="Done.")],
+    ])
+    agent_loop = AgentLoop(
+        make_config(),
+        agent_name=BuiltinAgentName.AUTO_APPROVE,
+        backend=backend,
+        measure_tool_duration=measure_tool_duration,
+    )
+
+    events = await act_and_collect_events(agent_loop, "What's my todo list?")
+
+    result = next(e for e in events if isinstance(e, ToolResultEvent))
+    assert result.result is not None
+    assert (result.duration is not None) is measure_tool_duration
+
+
+@pytest.mark.asyncio
+async def test_act_prewarms_tools_inside_the_running_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    loops: list[asyncio.AbstractEventLoop] = []
+    monkeypatch.setattr(
+        ToolManager,
+        "prewarm_tools",
+        lambda self: loops.append(asyncio.get_running_loop()),
+    )
+    backend = FakeBackend([[mock_llm_chunk(content="Hi.")]])
+    agent_loop = make_agent_loop(backend=backend)
+    assert loops == []
+
+    await act_and_collect_events(agent_loop, "Hello")
+
+    assert loops == [asyncio.get_running_loop()]
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from kin_code.core import run_programmatic
 from kin_code.core.config import Backend, SessionLoggingConfig, VibeConfig
+from kin_code.core.programmatic import _get_runner
 from kin_code.core.types import LLMMessage, OutputFormat, Role
 from tests.mock.mock_backend_factory import mock_backend_factory
 from tests.mock.utils import mock_llm_chunk
@@ -137,3 +140,33 @@ def test_run_programmatic_ignores_system_messages_in_previous(
         assert spy.emitted[1][1] == "Continue our previous discussion."
         assert spy.emitted[2][1] == "Let's move on to practical examples."
         assert spy.emitted[3][1] == "Understood."
+
+
+def test_run_programmatic_reuses_event_loop_across_calls(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    loops: list[asyncio.AbstractEventLoop] = []
+    monkeypatch.setattr(
+        "kin_code.core.programmatic.create_formatter",
+        lambda *_args, **_kwargs: SpyStreamingFormatter(),
+    )
+
+    with mock_backend_factory(
+        Backend.GENERIC,
+        lambda provider, **kwargs: FakeBackend([mock_llm_chunk(content="Done.")]),
+    ):
+        cfg = VibeConfig(
+            session_logging=SessionLoggingConfig(enabled=False),
+            system_prompt_id="tests",
+            include_project_context=False,
+            include_prompt_detail=False,
+            include_model_info=False,
+            include_commit_signature=False,
+        )
+
+        for _ in range(2):
+            run_programmatic(config=cfg, prompt="Hi", output_format=OutputFormat.TEXT)
+            loops.append(_get_runner().get_loop())
+
+    assert loops[0] is loops[1]
+    assert not loops[0].is_closed()
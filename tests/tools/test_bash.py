@@ -3,7 +3,13 @@ from __future__ import annotations
 import pytest
 
 from kin_code.core.tools.base import BaseToolState, ToolError, ToolPermission
-from kin_code.core.tools.builtins.bash import Bash, BashArgs, BashToolConfig
+from kin_code.core.tools.builtins.bash import (
+    Bash,
+    BashArgs,
+    BashToolConfig,
+    _extract_commands,
+    _get_subprocess_encoding,
+)
 from tests.mock.utils import collect_result
 
 
@@ -89,3 +95,100 @@ def test_check_allowlist_denylist():
     assert denylisted is ToolPermission.NEVER
     assert mixed is None
     assert empty is None
+
+
+def test_extract_commands_includes_nested_commands_in_source_order():
+    command = "git status && echo $(cat foo | grep 'a b') | wc -l"
+
+    assert _extract_commands(command) == (
+        "git status",
+        "echo",
+        "cat foo",
+        "grep 'a b'",
+        "wc -l",
+    )
+
+
+def test_check_allowlist_denylist_sees_command_substitutions():
+    config = BashToolConfig(allowlist=["echo"], denylist=["rm"])
+    bash_tool = Bash(config=config, state=BaseToolState())
+
+    permission = bash_tool.check_allowlist_denylist(
+        BashArgs(command="echo $(rm -rf /tmp/x)")
+    )
+
+    assert permission is ToolPermission.NEVER
+
+
+def test_check_allowlist_denylist_standalone_and_large_lists():
+    config = BashToolConfig(
+        allowlist=[f"tool{i}" for i in range(200)] + ["echo"],
+        denylist=[f"danger{i}" for i in range(200)],
+        denylist_standalone=["python"],
+    )
+    bash_tool = Bash(config=config, state=BaseToolState())
+
+    def check(command: str) -> ToolPermission | None:
+        return bash_tool.check_allowlist_denylist(BashArgs(command=command))
+
+    assert check("/usr/bin/python") is ToolPermission.NEVER
+    assert check("python script.py") is None
+    assert check("danger150 --force") is ToolPermission.NEVER
+    assert check("tool199 && echo ok") is ToolPermission.ALWAYS
+
+    config.denylist.append("echo")
+
+    assert check("echo ok") is ToolPermission.NEVER
+
+
+@pytest.mark.asyncio
+async def test_large_output_is_truncated_without_buffering_it_all():
+    config = BashToolConfig(max_output_bytes=10)
+    bash_tool = Bash(config=config, state=BaseToolState())
+
+    result = await collect_result(
+        bash_tool.run(
+            BashArgs(command="head -c 5000000 /dev/zero | tr '\\0' x; echo err >&2")
+        )
+    )
+
+    assert result.stdout == "x" * 10
+    assert result.stderr == "err\n"
+    assert result.returncode == 0
+
+
+@pytest.mark.asyncio
+async def test_truncation_counts_decoded_characters():
+    config = BashToolConfig(max_output_bytes=3)
+    bash_tool = Bash(config=config, state=BaseToolState())
+
+    result = await collect_result(bash_tool.run(BashArgs(command="printf 'ééééé'")))
+
+    assert result.stdout == "ééé"
+
+
+@pytest.mark.asyncio
+async def test_picks_up_environment_changes_between_runs(bash, monkeypatch):
+    monkeypatch.setenv("KIN_TEST_VALUE", "first")
+    first = await collect_result(bash.run(BashArgs(command="echo $KIN_TEST_VALUE")))
+    monkeypatch.setenv("KIN_TEST_VALUE", "second")
+    second = await collect_result(bash.run(BashArgs(command="echo $KIN_TEST_VALUE")))
+
+    assert (first.stdout, second.stdout) == ("first\n", "second\n")
+
+
+def test_extract_commands_reuses_parse_for_repeated_commands():
+    _extract_commands.cache_clear()
+
+    first = _extract_commands("git status")
+    second = _extract_commands("git status")
+
+    assert first is second
+    assert _extract_commands.cache_info().hits == 1
+
+
+def test_subprocess_encoding_is_looked_up_once():
+    _get_subprocess_encoding.cache_clear()
+
+    assert _get_subprocess_encoding() == _get_subprocess_encoding()
+    assert _get_subprocess_encoding.cache_info().misses == 1
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import pytest
+
+from kin_code.core.tools.base import BaseToolState, ToolError
+from kin_code.core.tools.builtins.calculator import (
+    Calculator,
+    CalculatorArgs,
+    CalculatorConfig,
+)
+from tests.mock.utils import collect_result
+
+
+@pytest.fixture
+def calculator():
+    return Calculator(config=CalculatorConfig(), state=BaseToolState())
+
+
+@pytest.mark.asyncio
+async def test_evaluates_functions_and_constants(calculator):
+    result = await collect_result(
+        calculator.run(CalculatorArgs(expression="sqrt(16) + floor(pi)"))
+    )
+
+    assert result.result == 7.0
+    assert result.formatted == "7"
+
+
+@pytest.mark.asyncio
+async def test_reuses_evaluator_across_calls(calculator):
+    evaluator = calculator._evaluator
+
+    await collect_result(calculator.run(CalculatorArgs(expression="1 + 1")))
+    second = await collect_result(calculator.run(CalculatorArgs(expression="2 * tau")))
+
+    assert calculator._evaluator is evaluator
+    assert second.formatted == "12.56637061"
+
+
+@pytest.mark.asyncio
+async def test_failed_call_does_not_break_later_calls(calculator):
+    with pytest.raises(ToolError, match="Undefined name"):
+        await collect_result(calculator.run(CalculatorArgs(expression="unknown + 1")))
+
+    result = await collect_result(calculator.run(CalculatorArgs(expression="2**10")))
+
+    assert result.result == 1024.0
+
+
+@pytest.mark.asyncio
+async def test_rejects_huge_exponents(calculator):
+    with pytest.raises(ToolError, match="Math error"):
+        await collect_result(calculator.run(CalculatorArgs(expression="pow(2, 5000)")))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "expression", ["1024 * 1024", " 3.14 + 2.71 ", "7 / 2 - -1", "2 * 3 + 4 * 5", "42"]
+)
+async def test_plain_arithmetic_matches_simpleeval(calculator, expression):
+    result = await collect_result(calculator.run(CalculatorArgs(expression=expression)))
+
+    assert result.result == float(calculator._evaluator.eval(expression))
+
+
+@pytest.mark.asyncio
+async def test_plain_arithmetic_division_by_zero(calculator):
+    with pytest.raises(ToolError, match="Math error"):
+        await collect_result(calculator.run(CalculatorArgs(expression="1 / 0")))
+
+
+@pytest.mark.asyncio
+async def test_plain_arithmetic_leading_zeros_fall_back(calculator):
+    with pytest.raises(ToolError, match="Evaluation error"):
+        await collect_result(calculator.run(CalculatorArgs(expression="007 + 1")))
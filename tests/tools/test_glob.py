@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import os
+
 import pytest
 
-from kin_code.core.tools.base import ToolError
+from kin_code.core.tools.base import ToolError, ToolPermission
 from kin_code.core.tools.builtins.glob import Glob, GlobArgs, GlobState, GlobToolConfig
 from tests.mock.utils import collect_result
 
@@ -110,6 +112,23 @@ async def test_truncates_to_max_results(tmp_path, monkeypatch):
     assert result.total_matches == 10
 
 
+@pytest.mark.asyncio
+async def test_truncation_keeps_most_recent_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = GlobToolConfig(max_results=3)
+    glob = Glob(config=config, state=GlobState())
+    for i in range(8):
+        path = tmp_path / f"file{i}.py"
+        path.write_text("content")
+        os.utime(path, (1_700_000_000 + (i * 3) % 8, 1_700_000_000 + (i * 3) % 8))
+
+    result = await collect_result(glob.run(GlobArgs(pattern="*.py")))
+
+    assert result.files == ["file5.py", "file2.py", "file7.py"]
+    assert result.truncated
+    assert result.total_matches == 8
+
+
 @pytest.mark.asyncio
 async def test_respects_default_exclude_patterns(glob, tmp_path):
     (tmp_path / "included.py").write_text("content")
@@ -228,3 +247,139 @@ async def test_excludes_venv_directory(glob, tmp_path):
 
     assert "included.py" in result.files
     assert not any(".venv" in f for f in result.files)
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "*",
+        "**/*.py",
+        "src/**/*.py",
+        "*/*",
+        "**/pkg/**/*.py",
+        "**/*.PY",
+        "linked/*.py",
+        "linked/**/*.py",
+        "./src/*",
+    ],
+)
+def test_directory_walk_matches_pathlib_glob(glob, tmp_path, pattern):
+    for rel in [
+        "top.py",
+        "notes.txt",
+        ".hidden.py",
+        "src/app.py",
+        "src/pkg/mod.py",
+        "src/pkg/sub/pkg/deep.py",
+        "src/pkg/Upper.PY",
+        "docs/pkg/readme.md",
+    ]:
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("content")
+    (tmp_path / "linked").symlink_to(tmp_path / "src")
+    (tmp_path / "alias.py").symlink_to(tmp_path / "top.py")
+    spec = glob._build_exclude_spec(tmp_path)
+
+    walked = glob._find_matching_files(tmp_path, pattern, spec)
+    expected = glob._find_matching_files_pathlib(tmp_path, pattern, spec)
+
+    assert walked == expected
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        ("**/*.py", ["src/app.py"]),
+        ("*/*.py", ["src/app.py"]),
+        ("node_modules/*.py", []),
+    ],
+)
+def test_excluded_directories_are_not_scanned(
+    glob, tmp_path, monkeypatch, pattern, expected
+):
+    from kin_code.core.tools.builtins import glob as glob_module
+
+    for rel in ["src/app.py", "node_modules/dep.py", "node_modules/pkg/index.py"]:
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("content")
+    scanned: list[str] = []
+    real_scan = glob_module._scan
+
+    def recording_scan(directory: str):
+        scanned.append(directory)
+        return real_scan(directory)
+
+    monkeypatch.setattr(glob_module, "_scan", recording_scan)
+    spec = glob._build_exclude_spec(tmp_path)
+
+    files = glob._find_matching_files(tmp_path, pattern, spec)
+
+    assert not any("node_modules" in d for d in scanned)
+    assert [rel for rel, _ in files] == expected
+
+
+def test_exclude_spec_is_reused_until_ignore_file_changes(glob, tmp_path):
+    gitignore = tmp_path / ".gitignore"
+    gitignore.write_text("*.log\n")
+
+    first = glob._build_exclude_spec(tmp_path)
+    assert glob._build_exclude_spec(tmp_path) is first
+    assert first.match_file("debug.log")
+
+    gitignore.write_text("*.tmp\n# comment\n")
+
+    updated = glob._build_exclude_spec(tmp_path)
+    assert updated is not first
+    assert updated.match_file("scratch.tmp")
+    assert not updated.match_file("debug.log")
+
+
+def test_path_denylist_wins_over_allowlist(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = GlobToolConfig(
+        allowlist=[f"{tmp_path}/*", "/unrelated/*"],
+        denylist=["*/secrets", "*/private*"],
+    )
+    glob = Glob(config=config, state=GlobState())
+
+    assert glob.check_allowlist_denylist(GlobArgs(pattern="*", path="src")) == (
+        ToolPermission.ALWAYS
+    )
+    assert glob.check_allowlist_denylist(GlobArgs(pattern="*", path="secrets")) == (
+        ToolPermission.NEVER
+    )
+    assert (
+        glob.check_allowlist_denylist(GlobArgs(pattern="*", path="private/keys"))
+        == ToolPermission.NEVER
+    )
+    assert glob.check_allowlist_denylist(GlobArgs(pattern="*", path="/etc")) is None
+
+
+@pytest.mark.parametrize(
+    "extra_patterns", [[], ["/top-only", "docs/**/draft", "*.tmp"], ["!keep.pyc"]]
+)
+def test_exclude_matcher_agrees_with_pathspec(glob, tmp_path, extra_patterns):
+    from kin_code.core.tools.builtins._ignore import exclude_matcher
+
+    (tmp_path / ".gitignore").write_text("\n".join(extra_patterns))
+    spec = glob._build_exclude_spec(tmp_path)
+    is_excluded = exclude_matcher(spec)
+
+    if not any(p.startswith("!") for p in extra_patterns):
+        assert is_excluded != spec.match_file
+    for path in [
+        "src/app.py",
+        "node_modules/",
+        "pkg/node_modules/dep/index.js",
+        "build/",
+        "src/build",
+        "mod.pyc",
+        "keep.pyc",
+        "pkg.egg-info/",
+        "top-only",
+        "src/top-only",
+        "docs/a/b/draft",
+        "notes.tmp",
+        ".DS_Store",
+    ]:
+        assert is_excluded(path) == spec.match_file(path), path
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from datetime import UTC, datetime
+import os
+
 import pytest
 
 from kin_code.core.tools.base import ToolError
@@ -160,6 +163,26 @@ async def test_truncates_to_max_entries(tmp_path, monkeypatch):
     assert result.truncated
 
 
+@pytest.mark.asyncio
+async def test_truncation_keeps_directories_first_and_counts_everything(
+    tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    config = ListDirectoryConfig(max_entries=3)
+    list_dir = ListDirectory(config=config, state=ListDirectoryState())
+    for name in ["zeta", "Alpha"]:
+        (tmp_path / name).mkdir()
+    for name in ["d.py", "B.py", "c.py", "a.py"]:
+        (tmp_path / name).write_text("content")
+
+    result = await collect_result(list_dir.run(ListDirectoryArgs()))
+
+    assert [e.name for e in result.entries] == ["Alpha", "zeta", "a.py"]
+    assert result.truncated
+    assert result.total_directories == 2
+    assert result.total_files == 4
+
+
 @pytest.mark.asyncio
 async def test_entries_have_correct_types(list_dir, tmp_path):
     (tmp_path / "file.py").write_text("content")
@@ -175,6 +198,21 @@ async def test_entries_have_correct_types(list_dir, tmp_path):
     assert entries_by_name["symlink"].type == "symlink"
 
 
+@pytest.mark.asyncio
+async def test_recursive_listing_does_not_follow_directory_symlinks(list_dir, tmp_path):
+    (tmp_path / "real").mkdir()
+    (tmp_path / "real" / "inner.py").write_text("content")
+    (tmp_path / "linked").symlink_to(tmp_path / "real")
+
+    result = await collect_result(list_dir.run(ListDirectoryArgs(recursive=True)))
+
+    entries_by_name = {e.name: e for e in result.entries}
+    assert entries_by_name["linked"].type == "symlink"
+    assert entries_by_name["linked"].size is None
+    assert os.path.join("real", "inner.py") in entries_by_name
+    assert not any(name.startswith("linked" + os.sep) for name in entries_by_name)
+
+
 @pytest.mark.asyncio
 async def test_files_have_size(list_dir, tmp_path):
     (tmp_path / "file.py").write_text("hello world")
@@ -206,6 +244,21 @@ async def test_entries_have_modified_timestamp(list_dir, tmp_path):
     assert "T" in file_entry.modified
 
 
+@pytest.mark.asyncio
+async def test_modified_timestamp_is_iso_utc(list_dir, tmp_path):
+    path = tmp_path / "file.py"
+    path.write_text("content")
+    os.utime(path, (1_700_000_000.75, 1_700_000_000.75))
+
+    result = await collect_result(list_dir.run(ListDirectoryArgs()))
+
+    file_entry = next(e for e in result.entries if e.name == "file.py")
+    assert file_entry.modified == "2023-11-14T22:13:20+00:00"
+    assert datetime.fromisoformat(file_entry.modified) == datetime(
+        2023, 11, 14, 22, 13, 20, tzinfo=UTC
+    )
+
+
 @pytest.mark.asyncio
 async def test_respects_exclude_patterns_recursive(list_dir, tmp_path):
     (tmp_path / "included.py").write_text("content")
@@ -247,3 +300,47 @@ async def test_sorted_alphabetically_within_type(list_dir, tmp_path):
 
     file_names = [e.name for e in result.entries if e.type == "file"]
     assert file_names == sorted(file_names, key=str.lower)
+
+
+def test_unchanged_directory_listing_is_reused(tmp_path, monkeypatch):
+    from kin_code.core.tools.builtins import _scandir
+
+    (tmp_path / "a.py").write_text("content")
+    settled = 1_700_000_000
+    os.utime(tmp_path, (settled, settled))
+    path = str(tmp_path)
+
+    first = _scandir.scan_directory(path)
+    assert [e.name for e in first] == ["a.py"]
+
+    def fail_scandir(_path):
+        raise AssertionError("listing should come from cache")
+
+    with monkeypatch.context() as m:
+        m.setattr(_scandir.os, "scandir", fail_scandir)
+        assert _scandir.scan_directory(path) is first
+        os.utime(tmp_path / "a.py", (settled + 5, settled + 5))
+        assert first[0].stat().st_mtime == settled + 5
+
+    (tmp_path / "b.py").write_text("content")
+
+    assert sorted(e.name for e in _scandir.scan_directory(path)) == ["a.py", "b.py"]
+
+
+def test_recently_changed_directory_is_not_cached(tmp_path, monkeypatch):
+    from kin_code.core.tools.builtins import _scandir
+
+    (tmp_path / "a.py").write_text("content")
+    _scandir.scan_directory(str(tmp_path))
+
+    calls = []
+    real_scandir = os.scandir
+
+    def counting_scandir(path):
+        calls.append(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(_scandir.os, "scandir", counting_scandir)
+    _scandir.scan_directory(str(tmp_path))
+
+    assert calls == [str(tmp_path)]
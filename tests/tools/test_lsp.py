@@ -1,27 +1,102 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import os
+from pathlib import Path
 import shutil
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
+import pytest_asyncio
 
-from kin_code.core.tools.base import ToolError
+from kin_code.core.tools.base import InvokeContext, ToolError
+from kin_code.core.tools.builtins import lsp as lsp_module
 from kin_code.core.tools.builtins.lsp import (
     LSP,
     LSPArgs,
     LSPOperation,
+    LSPResult,
+    LSPServerProcess,
     LSPState,
     LSPToolConfig,
+    _find_workspace_root,
+    _frame,
+    _read_messages,
 )
 from tests.mock.utils import collect_result
 
 
+class _RecordingStdin:
+    """Record writes and answer each request with the next canned response."""
+
+    def __init__(
+        self, stdout: asyncio.StreamReader, responses: list[dict[str, Any]]
+    ) -> None:
+        self.writes: list[bytes] = []
+        self._stdout = stdout
+        self._responses = responses
+
+    def writelines(self, data: list[bytes]) -> None:
+        self.writes.append(b"".join(data))
+        for message in _decode_all(self.writes[-1]):
+            if "id" in message and self._responses:
+                self._stdout.feed_data(_encode(self._responses.pop(0)))
+
+    async def drain(self) -> None:
+        pass
+
+
+def _encode(message: dict[str, Any]) -> bytes:
+    content = json.dumps(message).encode()
+    return b"Content-Length: %d\r\n\r\n" % len(content) + content
+
+
+def _decode_all(data: bytes) -> list[dict[str, Any]]:
+    messages = []
+    while data:
+        header, _, rest = data.partition(b"\r\n\r\n")
+        length = int(header.split(b":")[1])
+        messages.append(json.loads(rest[:length]))
+        data = rest[length:]
+    return messages
+
+
 @pytest.fixture
-def lsp(tmp_path, monkeypatch):
+def fake_server():
+    """Build servers that answer requests with canned responses, in order."""
+
+    def make(*responses: dict[str, Any]) -> LSPServerProcess:
+        stdout = asyncio.StreamReader()
+        stdin = _RecordingStdin(stdout, list(responses))
+        process = SimpleNamespace(stdin=stdin, stdout=stdout, returncode=None)
+        process.kill = lambda: setattr(process, "returncode", -9)
+        server = LSPServerProcess(process=process)  # type: ignore[arg-type]
+        server.reader_task = asyncio.create_task(_read_messages(server))
+        return server
+
+    return make
+
+
+@pytest_asyncio.fixture
+async def lsp(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     config = LSPToolConfig()
     tool = LSP(config=config, state=LSPState())
     LSP._servers.clear()
-    return tool
+    LSP._server_locks.clear()
+    yield tool
+    # Servers are bound to this test's event loop, so close their pipes while
+    # it still runs; waiting for exit can hang on children holding stdout.
+    for server in LSP._servers.values():
+        if server.reader_task is not None:
+            server.reader_task.cancel()
+        if isinstance(server.process, asyncio.subprocess.Process):
+            server.process._transport.close()  # type: ignore[attr-defined]
+    await asyncio.sleep(0)
+    LSP._servers.clear()
+    LSP._server_locks.clear()
 
 
 @pytest.fixture
@@ -94,6 +169,20 @@ class TestLSPParsing:
         assert locations[0].line == 10
         assert locations[0].character == 5
 
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX paths")
+    def test_parse_locations_decodes_uri(self, lsp):
+        response = {
+            "uri": "file:///path/to/my%20dir/caf%C3%A9.py",
+            "range": {
+                "start": {"line": 0, "character": 0},
+                "end": {"line": 0, "character": 1},
+            },
+        }
+
+        locations = lsp._parse_locations(response)
+
+        assert locations[0].file_path == "/path/to/my dir/café.py"
+
     def test_parse_locations_list(self, lsp):
         response = [
             {
@@ -256,12 +345,465 @@ class TestLSPParsing:
         assert calls[0].name == "callee_func"
         assert calls[0].line == 21
 
+    def test_parse_nested_symbols_in_document_order(self, lsp):
+        def symbol(name, line, children=()):
+            return {
+                "name": name,
+                "kind": 5,
+                "range": {"start": {"line": line, "character": 0}},
+                "children": list(children),
+            }
+
+        response = [
+            symbol("A", 0, [symbol("m", 1, [symbol("inner", 2)]), symbol("n", 3)]),
+            symbol("B", 4),
+        ]
+
+        symbols = lsp._parse_symbols(response, Path("/path/to/file.py"))
+
+        assert [(s.name, s.line) for s in symbols] == [
+            ("A", 1),
+            ("A.m", 2),
+            ("A.m.inner", 3),
+            ("A.n", 4),
+            ("B", 5),
+        ]
+
     def test_symbol_kind_to_string(self, lsp):
         assert lsp._symbol_kind_to_string(5) == "class"
         assert lsp._symbol_kind_to_string(6) == "method"
         assert lsp._symbol_kind_to_string(12) == "function"
         assert lsp._symbol_kind_to_string(13) == "variable"
+        assert lsp._symbol_kind_to_string(26) == "type_parameter"
         assert lsp._symbol_kind_to_string(999) == "unknown"
+        assert lsp._symbol_kind_to_string(0) == "unknown"
+        assert lsp._symbol_kind_to_string(-1) == "unknown"
+
+
+class TestLSPTransport:
+    @pytest.mark.asyncio
+    async def test_did_open_shares_a_write_with_the_request(
+        self, lsp, python_file, fake_server
+    ):
+        server = fake_server({"jsonrpc": "2.0", "id": 1, "result": None})
+        args = LSPArgs(
+            operation=LSPOperation.HOVER,
+            file_path=str(python_file),
+            line=2,
+            character=5,
+        )
+
+        result = await lsp._execute_operation(server, args, python_file, "python")
+
+        assert result.hover_content is None
+        writes = server.process.stdin.writes
+        assert len(writes) == 1
+        methods = [m["method"] for m in _decode_all(writes[0])]
+        assert methods == ["textDocument/didOpen", "textDocument/hover"]
+        assert server.outbox == []
+
+    @pytest.mark.asyncio
+    async def test_document_is_only_resent_when_it_changes(
+        self, lsp, python_file, fake_server
+    ):
+        server = fake_server(
+            *(
+                {"jsonrpc": "2.0", "id": request_id, "result": None}
+                for request_id in (1, 2, 3)
+            )
+        )
+        args = LSPArgs(
+            operation=LSPOperation.HOVER,
+            file_path=str(python_file),
+            line=2,
+            character=5,
+        )
+
+        await lsp._execute_operation(server, args, python_file, "python")
+        await lsp._execute_operation(server, args, python_file, "python")
+        python_file.write_text("x = 1\n")
+        os.utime(python_file, ns=(0, 0))
+        await lsp._execute_operation(server, args, python_file, "python")
+
+        messages = [_decode_all(w) for w in server.process.stdin.writes]
+        assert [[m["method"] for m in batch] for batch in messages] == [
+            ["textDocument/didOpen", "textDocument/hover"],
+            ["textDocument/hover"],
+            ["textDocument/didChange", "textDocument/hover"],
+        ]
+        change = messages[2][0]["params"]
+        assert change["textDocument"]["version"] == 2
+        assert change["contentChanges"] == [{"text": "x = 1\n"}]
+
+    @pytest.mark.asyncio
+    async def test_same_mtime_rewrite_is_resent(self, lsp, python_file, fake_server):
+        server = fake_server()
+        mtime_ns = python_file.stat().st_mtime_ns
+        await lsp._open_document(server, python_file, "python")
+
+        python_file.write_bytes(b"caf\xe9 = 1\n")
+        os.utime(python_file, ns=(mtime_ns, mtime_ns))
+        await lsp._open_document(server, python_file, "python")
+
+        change = _decode_all(b"".join(server.outbox))[1]
+        assert change["method"] == "textDocument/didChange"
+        assert change["params"]["contentChanges"] == [{"text": "caf\ufffd = 1\n"}]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_opens_send_one_did_open(
+        self, lsp, python_file, fake_server
+    ):
+        server = fake_server()
+
+        await asyncio.gather(
+            lsp._open_document(server, python_file, "python"),
+            lsp._open_document(server, python_file, "python"),
+        )
+
+        messages = _decode_all(b"".join(server.outbox))
+        assert [m["method"] for m in messages] == ["textDocument/didOpen"]
+
+    def test_frame_length_counts_bytes(self):
+        message = {"jsonrpc": "2.0", "method": "m", "params": {"text": "café ✓"}}
+
+        assert _decode_all(b"".join(_frame(message))) == [message]
+
+    @pytest.mark.asyncio
+    async def test_responses_are_matched_by_id(self, lsp, fake_server):
+        server = fake_server()
+        requests = asyncio.gather(
+            lsp._send_request(server, "a", {}), lsp._send_request(server, "b", {})
+        )
+        await asyncio.sleep(0)
+
+        for response in [
+            {"jsonrpc": "2.0", "id": 1, "method": "window/workDoneProgress/create"},
+            {"jsonrpc": "2.0", "id": 2, "result": "second"},
+            {"jsonrpc": "2.0", "id": 1, "result": "first"},
+        ]:
+            server.process.stdout.feed_data(_encode(response))
+
+        assert await requests == ["first", "second"]
+        assert server.pending == {}
+
+    @pytest.mark.asyncio
+    async def test_extra_headers_are_skipped(self, lsp, fake_server):
+        server = fake_server()
+        request = asyncio.create_task(lsp._send_request(server, "a", {}))
+        await asyncio.sleep(0)
+
+        content = json.dumps({"jsonrpc": "2.0", "id": 1, "result": "ok"}).encode()
+        server.process.stdout.feed_data(
+            b"Content-Length: %d\r\n"
+            b"Content-Type: application/vscode-jsonrpc; charset=utf-8\r\n"
+            b"\r\n" % len(content) + content
+        )
+
+        assert await request == "ok"
+
+    @pytest.mark.asyncio
+    async def test_call_hierarchy_items_are_requested_together(
+        self, lsp, python_file, fake_server
+    ):
+        server = fake_server({
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": [{"n": 1}, {"n": 2}],
+        })
+        args = LSPArgs(
+            operation=LSPOperation.INCOMING_CALLS,
+            file_path=str(python_file),
+            line=2,
+            character=5,
+        )
+
+        def caller(name):
+            return {"from": {"name": name, "uri": "file:///a.py", "range": {}}}
+
+        operation = asyncio.create_task(
+            lsp._execute_operation(server, args, python_file, "python")
+        )
+        while len(server.process.stdin.writes) < 3:
+            await asyncio.sleep(0)
+
+        for request_id, name in [(3, "second"), (2, "first")]:
+            response = {"jsonrpc": "2.0", "id": request_id, "result": [caller(name)]}
+            server.process.stdout.feed_data(_encode(response))
+
+        result = await operation
+        assert [c.name for c in result.call_items] == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_identical_queries_share_a_request(self, lsp, fake_server):
+        server = fake_server({"jsonrpc": "2.0", "id": 1, "result": "hover"})
+        params = {"textDocument": {"uri": "file:///a.py"}, "position": {}}
+
+        results = await asyncio.gather(
+            lsp._send_request(server, "textDocument/hover", params),
+            lsp._send_request(server, "textDocument/hover", dict(params)),
+        )
+
+        assert results == ["hover", "hover"]
+        assert len(server.process.stdin.writes) == 1
+        assert server.inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_in_flight_requests_are_bounded(self, lsp, fake_server, monkeypatch):
+        monkeypatch.setattr(lsp_module, "MAX_IN_FLIGHT", 1)
+        server = fake_server()
+        requests = asyncio.gather(
+            lsp._send_request(server, "a", {}), lsp._send_request(server, "b", {})
+        )
+        await asyncio.sleep(0)
+
+        assert len(server.process.stdin.writes) == 1
+        server.process.stdout.feed_data(
+            _encode({"jsonrpc": "2.0", "id": 1, "result": "first"})
+        )
+        while len(server.process.stdin.writes) < 2:
+            await asyncio.sleep(0)
+        server.process.stdout.feed_data(
+            _encode({"jsonrpc": "2.0", "id": 2, "result": "second"})
+        )
+
+        assert await requests == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_server_requests_are_answered(self, lsp, fake_server):
+        server = fake_server()
+        for request in [
+            {"id": 7, "method": "window/workDoneProgress/create", "params": {}},
+            {"id": 8, "method": "workspace/configuration", "params": {"items": [{}]}},
+            {"id": 9, "method": "workspace/applyEdit", "params": {}},
+        ]:
+            server.process.stdout.feed_data(_encode({"jsonrpc": "2.0", **request}))
+        while len(server.process.stdin.writes) < 3:
+            await asyncio.sleep(0)
+
+        replies = [_decode_all(w)[0] for w in server.process.stdin.writes]
+        assert replies[0] == {"jsonrpc": "2.0", "id": 7, "result": None}
+        assert replies[1] == {"jsonrpc": "2.0", "id": 8, "result": [None]}
+        assert replies[2]["error"]["code"] == -32601
+
+    @pytest.mark.asyncio
+    async def test_progress_is_streamed_before_the_result(
+        self, lsp, python_file, fake_server, monkeypatch
+    ):
+        server = fake_server()
+
+        async def ensure_server(language, workspace_root):
+            return server
+
+        monkeypatch.setattr(lsp, "_ensure_server", ensure_server)
+        args = LSPArgs(
+            operation=LSPOperation.FIND_REFERENCES,
+            file_path=str(python_file),
+            line=2,
+            character=5,
+        )
+        events = lsp.run(args, InvokeContext(tool_call_id="call-1"))
+        first = asyncio.ensure_future(anext(events))
+        while not server.process.stdin.writes:
+            await asyncio.sleep(0)
+
+        request = _decode_all(server.process.stdin.writes[0])[-1]
+        token = request["params"]["workDoneToken"]
+        for value in [
+            {"kind": "begin", "title": "Finding references", "percentage": 0},
+            {"kind": "report", "message": "a.py", "percentage": 50},
+            {"kind": "end"},
+        ]:
+            progress = {"token": token, "value": value}
+            server.process.stdout.feed_data(
+                _encode({"jsonrpc": "2.0", "method": "$/progress", "params": progress})
+            )
+        server.process.stdout.feed_data(
+            _encode({"jsonrpc": "2.0", "id": request["id"], "result": []})
+        )
+
+        assert (await first).message == "Finding references 0%"
+        assert (await anext(events)).message == "a.py 50%"
+        result = await anext(events)
+        assert isinstance(result, LSPResult)
+        assert result.locations == []
+        with pytest.raises(StopAsyncIteration):
+            await anext(events)
+        assert server.progress == {}
+
+    @pytest.mark.asyncio
+    async def test_error_response_raises(self, lsp, fake_server):
+        server = fake_server({
+            "jsonrpc": "2.0",
+            "id": 1,
+            "error": {"code": -1, "message": "boom"},
+        })
+
+        with pytest.raises(ToolError, match="LSP error: boom"):
+            await lsp._send_request(server, "a", {})
+
+    @pytest.mark.asyncio
+    async def test_pending_requests_fail_when_server_exits(self, lsp, fake_server):
+        server = fake_server()
+        request = asyncio.create_task(lsp._send_request(server, "a", {}))
+        await asyncio.sleep(0)
+
+        server.process.stdout.feed_eof()
+
+        with pytest.raises(ToolError, match="closed connection"):
+            await request
+        assert server.pending == {}
+
+    @pytest.mark.asyncio
+    async def test_broken_stream_retires_the_server(self, lsp, fake_server):
+        server = fake_server()
+        server.process.stdout.feed_data(b"Content-Length: x\r\n\r\n")
+        assert server.reader_task is not None
+        await server.reader_task
+
+        assert not server.alive
+        assert server.process.returncode == -9
+
+    @pytest.mark.asyncio
+    async def test_undecodable_body_is_skipped(self, lsp, fake_server):
+        server = fake_server({"jsonrpc": "2.0", "id": 1, "result": "ok"})
+        server.process.stdout.feed_data(b"Content-Length: 3\r\n\r\n{{{")
+
+        assert await lsp._send_request(server, "a", {}) == "ok"
+        assert server.alive
+
+    @pytest.mark.asyncio
+    async def test_request_times_out(self, fake_server):
+        tool = LSP(config=LSPToolConfig(timeout=0), state=LSPState())
+        server = fake_server()
+
+        with pytest.raises(ToolError, match="timed out"):
+            await tool._send_request(server, "a", {})
+        assert server.pending == {}
+
+
+class TestLSPServerPool:
+    def test_workspace_root_is_nearest_project(self, tmp_path):
+        (tmp_path / ".git").mkdir()
+        package = tmp_path / "packages" / "app"
+        (package / "src").mkdir(parents=True)
+        (package / "pyproject.toml").write_text("")
+
+        assert _find_workspace_root(package / "src") == package
+        assert _find_workspace_root(tmp_path / "packages") == tmp_path
+
+    def test_workspace_root_is_looked_up_once_per_directory(self, tmp_path):
+        (tmp_path / "pyproject.toml").write_text("")
+        _find_workspace_root.cache_clear()
+
+        assert _find_workspace_root(tmp_path) == tmp_path
+        assert _find_workspace_root(tmp_path) == tmp_path
+        assert _find_workspace_root.cache_info().hits == 1
+
+    @pytest.mark.asyncio
+    async def test_servers_are_shared_per_workspace(
+        self, lsp, tmp_path, fake_server, monkeypatch
+    ):
+        started: list[Path] = []
+
+        async def start_server(language, workspace_root):
+            started.append(workspace_root)
+            await asyncio.sleep(0)
+            server = LSP._servers[language, workspace_root] = fake_server()
+            return server
+
+        monkeypatch.setattr(lsp, "_start_server", start_server)
+        first, second = tmp_path / "first", tmp_path / "second"
+
+        servers = await asyncio.gather(
+            lsp._ensure_server("python", first),
+            lsp._ensure_server("python", first),
+            lsp._ensure_server("python", second),
+        )
+
+        assert started == [first, second]
+        assert servers[0] is servers[1]
+        assert servers[0] is not servers[2]
+        assert await lsp._ensure_server("python", first) is servers[0]
+
+    @pytest.mark.asyncio
+    async def test_multi_root_server_gets_new_workspace_folders(
+        self, lsp, tmp_path, fake_server
+    ):
+        first, second = tmp_path / "first", tmp_path / "second"
+        server = fake_server()
+        server.workspace_folders = True
+        server.roots.add(first)
+        LSP._servers["python", first] = server
+
+        assert await lsp._ensure_server("python", second) is server
+        assert await lsp._ensure_server("python", second) is server
+
+        messages = [_decode_all(w) for w in server.process.stdin.writes]
+        assert len(messages) == 1
+        [notification] = messages[0]
+        assert notification["method"] == "workspace/didChangeWorkspaceFolders"
+        assert notification["params"]["event"] == {
+            "added": [{"uri": second.as_uri(), "name": "second"}],
+            "removed": [],
+        }
+        assert server.roots == {first, second}
+
+    @pytest.mark.asyncio
+    async def test_dead_server_is_replaced(self, lsp, tmp_path, fake_server):
+        dead = fake_server()
+        dead.process.returncode = 1
+        LSP._servers[("python", tmp_path)] = dead
+        replacement = fake_server()
+
+        async def start_server(language, workspace_root):
+            return replacement
+
+        lsp._start_server = start_server
+
+        assert await lsp._ensure_server("python", tmp_path) is replacement
+
+    @pytest.mark.asyncio
+    async def test_prewarm_starts_servers_for_project_languages(
+        self, tmp_path, monkeypatch
+    ):
+        (tmp_path / "pyproject.toml").write_text("")
+        (tmp_path / "package.json").write_text("{}")
+        (tmp_path / "src").mkdir()
+        started: list[tuple[str, Path]] = []
+
+        async def ensure_server(self, language, workspace_root):
+            started.append((language, workspace_root))
+
+        monkeypatch.setattr(LSP, "_ensure_server", ensure_server)
+        monkeypatch.setattr(lsp_module, "_which", lambda command: command)
+
+        tasks = LSP.prewarm([tmp_path / "src"])
+        assert LSP._prewarm_tasks == set(tasks)
+        await asyncio.gather(*tasks)
+
+        assert sorted(started) == [("python", tmp_path), ("typescript", tmp_path)]
+        assert LSP._prewarm_tasks == set()
+
+    def test_which_remembers_only_hits(self, monkeypatch):
+        lookups: list[str] = []
+
+        def which(command):
+            lookups.append(command)
+            return f"/bin/{command}" if command == "found" else None
+
+        monkeypatch.setattr(shutil, "which", which)
+        monkeypatch.setattr(lsp_module, "_which_cache", {})
+
+        assert lsp_module._which("found") == "/bin/found"
+        assert lsp_module._which("found") == "/bin/found"
+        assert lsp_module._which("missing") is None
+        assert lsp_module._which("missing") is None
+        assert lookups == ["found", "missing", "missing"]
+
+    def test_prewarm_needs_a_running_loop(self, tmp_path):
+        (tmp_path / "pyproject.toml").write_text("")
+
+        assert LSP.prewarm([tmp_path]) == []
 
 
 class TestLSPUIDisplay:
@@ -6,6 +6,7 @@ import pytest
 
 from kin_code.core.config import SessionLoggingConfig, VibeConfig
 from kin_code.core.tools.base import BaseToolConfig, ToolPermission
+from kin_code.core.tools.builtins.lsp import LSP
 from kin_code.core.tools.manager import ToolManager
 
 
@@ -436,3 +437,53 @@ class DummyTool(BaseTool[DummyArgs, DummyResult, BaseToolConfig, BaseToolState])
         final_class = available.get("dummy_tool")
         assert final_class is not None
         assert final_class.description == "Dummy tool v2"
+
+
+@pytest.mark.parametrize("tool_name", ["bash", "read_file", "todo", "unknown_tool"])
+def test_get_tool_permission_matches_full_config(tool_manager, tool_name):
+    assert (
+        tool_manager.get_tool_permission(tool_name)
+        == tool_manager.get_tool_config(tool_name).permission
+    )
+
+
+def test_get_tool_permission_sees_in_place_override_changes(config, tool_manager):
+    config.tools["bash"] = BaseToolConfig(permission=ToolPermission.ASK)
+    assert tool_manager.get_tool_permission("bash") == ToolPermission.ASK
+
+    config.tools["bash"].permission = ToolPermission.NEVER
+
+    assert tool_manager.get_tool_permission("bash") == ToolPermission.NEVER
+    assert tool_manager.get_tool_config("bash").permission == ToolPermission.NEVER
+
+
+def test_prewarms_tools_that_opt_in(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        LSP, "prewarm", classmethod(lambda cls, roots, config: calls.append(roots))
+    )
+    vibe_config = VibeConfig(
+        session_logging=SessionLoggingConfig(enabled=False),
+        system_prompt_id="tests",
+        include_project_context=False,
+        tools={LSP.get_name(): BaseToolConfig.model_validate({"prewarm": True})},
+    )
+
+    manager = ToolManager(lambda: vibe_config)
+    assert calls == []
+
+    manager.prewarm_tools()
+    manager.prewarm_tools()
+
+    assert calls == [[Path.cwd()]]
+
+
+def test_does_not_prewarm_by_default(tool_manager, monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        LSP, "prewarm", classmethod(lambda cls, roots, config: calls.append(roots))
+    )
+
+    ToolManager(lambda: tool_manager._config).prewarm_tools()
+
+    assert calls == []
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -14,8 +16,10 @@ from kin_code.core.tools.builtins.task import (
     TaskResult,
     TaskToolConfig,
     _is_tool_call_content,
+    _load_subagent_config,
+    _subagent_config,
 )
-from kin_code.core.types import AssistantEvent, LLMMessage, Role
+from kin_code.core.types import AssistantEvent, LLMMessage, Role, ToolCallEvent
 from tests.mock.utils import collect_result
 
 
@@ -127,6 +131,109 @@ class TestTaskToolExecution:
             assert result.model_alias == "test-model"
             assert result.provider == "test-provider"
 
+    @pytest.mark.asyncio
+    async def test_tool_call_discards_earlier_response(
+        self, task_tool: Task, ctx: InvokeContext
+    ) -> None:
+        """Only the content streamed after the last tool call is returned."""
+
+        async def mock_act(task: str):
+            yield AssistantEvent(content="Let me look around.")
+            yield ToolCallEvent(
+                tool_name="task",
+                tool_class=Task,
+                args=TaskArgs(task="nested"),
+                tool_call_id="call-1",
+            )
+            yield AssistantEvent(content="Final")
+            yield AssistantEvent(content=" summary.")
+
+        with patch(
+            "kin_code.core.tools.builtins.task.AgentLoop"
+        ) as mock_agent_loop_class:
+            mock_model = MagicMock()
+            mock_model.alias = "test-model"
+            mock_model.provider = "test-provider"
+
+            mock_agent_loop = MagicMock()
+            mock_agent_loop.act = mock_act
+            mock_agent_loop.messages = []
+            mock_agent_loop.config.get_active_model.return_value = mock_model
+            mock_agent_loop_class.return_value = mock_agent_loop
+
+            args = TaskArgs(task="explore the codebase", agent="explore")
+            result = await collect_result(task_tool.run(args, ctx))
+
+            assert isinstance(result, TaskResult)
+            assert result.response == "Final summary."
+
+    @pytest.mark.asyncio
+    async def test_malformed_summary_falls_back_to_earlier_text(
+        self, task_tool: Task, ctx: InvokeContext
+    ) -> None:
+        """Text streamed before a tool call is used when the summary is unusable."""
+
+        async def mock_act(task: str):
+            yield AssistantEvent(content="Found it in ")
+            yield AssistantEvent(content="config.py.")
+            yield ToolCallEvent(
+                tool_name="task",
+                tool_class=Task,
+                args=TaskArgs(task="nested"),
+                tool_call_id="call-1",
+            )
+            yield AssistantEvent(content="<function=read_file>")
+
+        with patch(
+            "kin_code.core.tools.builtins.task.AgentLoop"
+        ) as mock_agent_loop_class:
+            mock_model = MagicMock()
+            mock_model.alias = "test-model"
+            mock_model.provider = "test-provider"
+
+            mock_agent_loop = MagicMock()
+            mock_agent_loop.act = mock_act
+            mock_agent_loop.messages = []
+            mock_agent_loop.config.get_active_model.return_value = mock_model
+            mock_agent_loop_class.return_value = mock_agent_loop
+
+            args = TaskArgs(task="explore the codebase", agent="explore")
+            result = await collect_result(task_tool.run(args, ctx))
+
+            assert isinstance(result, TaskResult)
+            assert result.response == "Found it in config.py."
+
+    @pytest.mark.asyncio
+    async def test_event_burst_lets_other_tasks_run(
+        self, task_tool: Task, ctx: InvokeContext
+    ) -> None:
+        """A subagent that never suspends still hands control to the loop."""
+        other = asyncio.create_task(asyncio.sleep(0))
+        observed: list[bool] = []
+
+        async def mock_act(task: str):
+            for _ in range(64):
+                yield AssistantEvent(content=".")
+            observed.append(other.done())
+
+        with patch(
+            "kin_code.core.tools.builtins.task.AgentLoop"
+        ) as mock_agent_loop_class:
+            mock_model = MagicMock()
+            mock_model.alias = "test-model"
+            mock_model.provider = "test-provider"
+
+            mock_agent_loop = MagicMock()
+            mock_agent_loop.act = mock_act
+            mock_agent_loop.messages = []
+            mock_agent_loop.config.get_active_model.return_value = mock_model
+            mock_agent_loop_class.return_value = mock_agent_loop
+
+            args = TaskArgs(task="explore the codebase", agent="explore")
+            await collect_result(task_tool.run(args, ctx))
+
+        assert observed == [True]
+
     @pytest.mark.asyncio
     async def test_handles_stopped_by_middleware(
         self, task_tool: Task, ctx: InvokeContext
@@ -193,6 +300,24 @@ class TestTaskToolExecution:
             assert "Simulated error" in result.response
 
 
+class TestSubagentConfig:
+    def test_reuses_loaded_config_until_file_changes(self, config_dir: Path) -> None:
+        _load_subagent_config.cache_clear()
+        with patch.object(VibeConfig, "load", wraps=VibeConfig.load) as load:
+            first = _subagent_config()
+            second = _subagent_config()
+            assert load.call_count == 1
+            assert first is not second
+            assert first.session_logging.enabled is False
+
+            config_file = config_dir / "config.toml"
+            config_file.write_text(
+                "tool_concurrency = 3\n" + config_file.read_text("utf-8"), "utf-8"
+            )
+            assert _subagent_config().tool_concurrency == 3
+            assert load.call_count == 2
+
+
 class TestMalformedContentDetection:
     """Tests for _is_tool_call_content() malformed tool call detection."""
 